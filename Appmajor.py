@@ -1,10 +1,23 @@
+import time
+_started = time.perf_counter()  # Startup is measured from here; see doorframe.startup
 import tkinter as tk
-from tkinter import ttk, messagebox, font
-import json
+from tkinter import ttk, messagebox, font, filedialog
+import sqlite3
 import os
 import sys
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-import math
+from doorframe.catalog import Catalogs, catalog_store, load_catalogs
+from doorframe.diagram import DISPLAY_SIZE, display_image, start_preload
+from doorframe.engine import (DoorSpec, FIREPROOF, NON_FIREPROOF, HONEYCOMB_PAPER, YIPAIYIKONG,
+                              HONEYCOMB_BOARD, SIMPLE, ELECTRIC_LOCK, BOX_LOCK, TOP, BOTTOM, MODE_NORMAL, MODE_UB)
+from doorframe.history import HISTORY_SIZE, ResultHistory
+from doorframe.importer import DATASHEET_EXTENSIONS, check_model, import_datasheet
+from doorframe.live import LivePreview
+from doorframe.report import build_report, merge_spans, render_spans
+from doorframe.search import CatalogIndex
+from doorframe import startup
+from doorframe.tasks import Calculator
+from doorframe.translations import load_translations
+from doorframe.watch import CatalogWatcher, Reload
 # from tkVideoPlayer import TkinterVideo 
 
 # Determine the path to the JSON files
@@ -13,59 +26,58 @@ if getattr(sys, 'frozen', False):
 else:
     application_path = os.path.dirname(__file__)
 
-LOCK_FILE = os.path.join(application_path, 'electric_locks.json')
-TRANSLATIONS_FILE = os.path.join(application_path, 'translations.json')
-BOXLOCK_FILE = os.path.join(application_path, 'box_locks.json')
-CONCEALED_FILE = os.path.join(application_path, 'concealeds.json')
-
-# Load electric lock types from file
-def load_electric_locks():
-    if os.path.exists(LOCK_FILE):
-        with open(LOCK_FILE, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    return {}
-
-# Save electric lock types to file
-def save_electric_locks(electric_locks):
-    with open(LOCK_FILE, 'w', encoding='utf-8') as file:
-        json.dump(electric_locks, file, ensure_ascii=False, indent=4)
-        
-# Load box lock types from file
-def load_box_locks():
-    if os.path.exists(BOXLOCK_FILE):
-        with open(BOXLOCK_FILE, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    return {}
-
-# Save box lock types to file
-def save_box_locks(box_locks):
-    with open(BOXLOCK_FILE, 'w', encoding='utf-8') as file:
-        json.dump(box_locks, file, ensure_ascii=False, indent=4)
-        
-# Load box lock types from file
-def load_concealed_door():
-    if os.path.exists(CONCEALED_FILE):
-        with open(CONCEALED_FILE, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    return {}
-
-# Save box lock types to file
-def save_concealed_door(concealeds):
-    with open(CONCEALED_FILE, 'w', encoding='utf-8') as file:
-        json.dump(concealeds, file, ensure_ascii=False, indent=4)
-
-# Load translations from file
-def load_translations():
-    if os.path.exists(TRANSLATIONS_FILE):
-        with open(TRANSLATIONS_FILE, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    return {}
-
-# Initialize electric locks and translations
-electric_locks = load_electric_locks()
-translations = load_translations()
-box_locks = load_box_locks()
-concealeds = load_concealed_door()
+# Combobox options whose translated label maps back to an engine value
+OPTION_KEYS = (FIREPROOF, NON_FIREPROOF, HONEYCOMB_PAPER, YIPAIYIKONG, HONEYCOMB_BOARD,
+               SIMPLE, ELECTRIC_LOCK, BOX_LOCK, TOP, BOTTOM)
+
+# The language the GUI starts in
+DEFAULT_LANGUAGE = "zh"
+# How often the GUI checks on a running calculation (ms)
+POLL_INTERVAL = 50
+# Pause after the last keystroke before the live preview recalculates (ms)
+PREVIEW_DELAY = 15
+# How often the GUI takes catalog and translation reloads from the watcher (ms)
+RELOAD_INTERVAL = 1000
+# Option comboboxes and their choices, shown translated
+OPTION_CHOICES = {"category": (FIREPROOF, NON_FIREPROOF), "structure_type": (HONEYCOMB_PAPER, YIPAIYIKONG, HONEYCOMB_BOARD),
+                  "door_type": (SIMPLE, ELECTRIC_LOCK, BOX_LOCK), "lock_direction": (TOP, BOTTOM)}
+OPTION_FIELDS = tuple(OPTION_CHOICES)
+EDGE_SEALING_TYPES = ("6mm 實木", "4mm 白木", "6mm 鋁封邊", "1mm 鐡封邊 + 1mm 石墨片", "1mm 鐡封邊", "1mm 不織布", "0.8mm 美耐板",
+                      "0.5mm ABS", "1mm 鋁封邊")
+# The form below the mode selection, in row order: (key, entry type, separator below it)
+FORM_FIELDS = (
+    ("structure_type", "structure_type", False), ("door_type", "door_type", False), ("num_doors", "entry", True),
+    ("right_vpiece_width", "entry", False), ("left_vpiece_width", "entry", False), ("upper_hpiece_width", "entry", False),
+    ("lower_hpiece_width", "entry", True), ("ub_wood_width", "entry", True),
+    ("edge_sealing_type", "edge_sealing_type", False), ("edge_sealing_thickness", "entry", True),
+    ("electric_lock_name", "electric_lock_name", False), ("box_lock_name", "box_lock_name", False),
+    ("lock_length", "entry", False), ("lock_height", "entry", False), ("lock_direction", "lock_direction", True),
+    ("concealed_door_closer_name", "concealed_door_closer_name", False), ("concealed_wood_width", "entry", True),
+    ("slats_width", "entry", False), ("gap_width", "entry", False), ("reinforce_wood", "entry", False),
+    ("max_height", "entry", False), ("min_height", "entry", True), ("lock_offset_bottom", "entry", False),
+    ("frame_height", "entry", False), ("frame_width", "entry", False),
+)
+# Shown with the category before one is chosen; the other fields are built when update_inputs first shows them
+STARTUP_FIELDS = ("num_doors", "right_vpiece_width", "upper_hpiece_width", "lower_hpiece_width", "edge_sealing_type",
+                  "edge_sealing_thickness", "frame_height", "frame_width")
+# Catalog kind -> the translation key naming it
+CATALOG_LABELS = {"electric_locks": "electric lock", "box_locks": "box lock", "concealeds": "concealed door closer"}
+# Catalog kind -> the combobox listing it
+CATALOG_FIELDS = {"electric_locks": "electric_lock_name", "box_locks": "box_lock_name",
+                  "concealeds": "concealed_door_closer_name"}
+
+startup.since("imports", _started)
+
+# Initialize the component catalogs (one read of catalog.db) and translations
+with startup.phase("catalog_load"):
+    _catalogs = load_catalogs()
+electric_locks = _catalogs.electric_locks
+box_locks = _catalogs.box_locks
+concealeds = _catalogs.concealeds
+with startup.phase("translation_load"):
+    translations = load_translations()
+    # The language the GUI starts in is read now, the others when selected
+    translations.get(DEFAULT_LANGUAGE)
 
 def safe_int(value, default=0):
     """Convert a value to an integer, or return a default if conversion fails."""
@@ -109,7 +121,7 @@ class DoorFrameCalculator:
     def __init__(self, root):
         self.root = root
         self.root.geometry("1400x820")
-        self.current_language = "zh"
+        self.current_language = DEFAULT_LANGUAGE
         self.entries = {}
 
         # Create a canvas and a scrollbar for the entire application
@@ -120,6 +132,7 @@ class DoorFrameCalculator:
         self.scrollbar_x.pack(side="bottom", fill="x")
         self.scrollable_frame = ttk.Frame(self.canvas)
         self.tooltips_enabled = tk.BooleanVar(value=False)
+        self.live_preview = tk.BooleanVar(value=False)
         self.canvas.create_window((10, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar_y.set, xscrollcommand=self.scrollbar_x.set)
 
@@ -131,20 +144,24 @@ class DoorFrameCalculator:
             "<Configure>",
             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")) if self.canvas else None)
         
-        # Initialize translated door type labels
-        self.simple_label = translations[self.current_language]["simple"].lower()
-        self.electric_lock_label = translations[self.current_language]["electric lock"].lower()
-        self.ub_label = translations[self.current_language]["UB"].lower()
-        self.box_lock_label = translations[self.current_language]["box lock"].lower()
-        
-        self.yipaiyikong_label = translations[self.current_language]["yipaiyikong"].lower()
-        self.top_label = translations[self.current_language]["top"].lower()
-        self.bottom_label = translations[self.current_language]["bottom"].lower()
-        self.concealed_label = translations[self.current_language]["concealed door closer"].lower()
-        self.fireproof_label = translations[self.current_language]["fireproof"].lower()
-        self.non_fireproof_label = translations[self.current_language]["non_fireproof"].lower()
-        self.honeycomb_paper_label = translations[self.current_language]["honeycomb_paper"].lower()
-        self.honeycomb_board_label = translations[self.current_language]["honeycomb_board"].lower()
+        # Options are branched on by their language-neutral keys; see selected_option()
+        self.update_option_keys()
+        
+        # The engine shares the module level catalogs, so edits made through the menus apply immediately;
+        # changes from other stations are swapped in by apply_reloads()
+        self.catalogs = Catalogs(electric_locks, box_locks, concealeds)
+        # Type-ahead indexes of the lock and closer comboboxes; see update_catalog_choices()
+        self.search_indexes = {}
+        # Calculations run on a worker thread; see calculate_material()
+        self.calculator = Calculator()
+        self.polling = False
+        # Live preview of the form while typing; see schedule_preview()
+        self.preview = LivePreview(self.catalogs, DISPLAY_SIZE)
+        self.preview_after = None
+        self.preview_photo = None
+        self.preview_photo_source = None
+        self.watcher = CatalogWatcher(self.catalogs).start()
+        self.root.after(RELOAD_INTERVAL, self.apply_reloads)
         
         self.tooltips = {}
         
@@ -185,6 +202,8 @@ class DoorFrameCalculator:
         self.image_label = None
         
         self.create_widgets()
+        # Decode the diagram templates in the background once the window is up
+        self.root.after_idle(start_preload, DISPLAY_SIZE)
         
         
         
@@ -214,6 +233,7 @@ class DoorFrameCalculator:
         self.edit_menu.add_command(label=translations[self.current_language]["remove_box_lock"], command=self.remove_box_lock)
         self.edit_menu.add_command(label=translations[self.current_language]["add_concealed_door_closer"], command=self.add_concealed)
         self.edit_menu.add_command(label=translations[self.current_language]["remove_concealed_door_closer"], command=self.remove_concealed)
+        self.edit_menu.add_command(label=translations[self.current_language]["import_catalog"], command=self.import_catalog)
 
         self.language_menu = tk.Menu(self.menu_bar, tearoff=0, font=menu_font)
         self.menu_bar.add_cascade(label=translations[self.current_language]["language"], menu=self.language_menu)
@@ -232,17 +252,14 @@ class DoorFrameCalculator:
         self.view_menu = tk.Menu(self.menu_bar, tearoff=0, font=menu_font)
         self.menu_bar.add_cascade(label="Guidance", menu=self.view_menu)
         self.view_menu.add_checkbutton(label=translations[self.current_language]["Enable_"], variable=self.tooltips_enabled, command=self.toggle_tooltips)
+        self.view_menu.add_checkbutton(label=translations[self.current_language]["live_preview"], variable=self.live_preview, command=self.schedule_preview)
         
         style = ttk.Style()
         style.configure("CustomLabel.TLabel", foreground="gray30")
-        current_row = 0
-        current_row = self.create_label_and_entry(self.entries_frame, "category", current_row, "category")
-        self.entries["category"][1]['values'] = (
-            translations[self.current_language]["fireproof"],
-            translations[self.current_language]["non_fireproof"]
-        )
-        self.entries["category"][1].bind("<<ComboboxSelected>>", self.update_inputs)
-        current_row += 1
+        # Every field has its row; the ones hidden at startup are built on first show (see build_field)
+        self.pending_fields = {"category": (0, "category", False)}
+        self.build_field("category")
+        current_row = 2
         
         self.mode_selection_label = ttk.Label(
             self.entries_frame,
@@ -252,19 +269,19 @@ class DoorFrameCalculator:
         )
         self.mode_selection_label.grid(row=current_row, column=0, sticky="w")
 
-        self.mode_selection = tk.StringVar(value="Normal")  # Default mode
+        self.mode_selection = tk.StringVar(value=MODE_NORMAL)  # Default mode
         self.normal_mode_button = ttk.Radiobutton(
             self.entries_frame,
             text=translations[self.current_language]["normal_mode"],
             variable=self.mode_selection,
-            value="Normal",
+            value=MODE_NORMAL,
             command=self.update_inputs
         )
         self.ub_mode_button = ttk.Radiobutton(
             self.entries_frame,
             text=translations[self.current_language]["ub_mode"],
             variable=self.mode_selection,
-            value="UB",
+            value=MODE_UB,
             command=self.update_inputs
         )
         
@@ -272,93 +289,58 @@ class DoorFrameCalculator:
         self.ub_mode_button.grid(row=current_row, column=1, sticky="w", padx=120)
         current_row += 1
     
-        # Structure Type Dropdown (for Non-Fireproof)
-        current_row = self.create_label_and_entry(self.entries_frame, "structure_type", current_row, "structure_type")
-        self.entries["structure_type"][1]['values'] = ("honeycomb_paper", "yipaiyikong", "honeycomb_board")
-
-        self.entries["structure_type"][1].bind("<<ComboboxSelected>>", self.update_inputs)
-    
-        # Door Type Dropdown
-        current_row = self.create_label_and_entry(self.entries_frame, "door_type", current_row, "door_type")
-        self.entries["door_type"][1]['values'] = ("simple", "electric lock", "box lock")
-        self.tooltips["door_type"] = ToolTip(self.entries["door_type"][1], translations[self.current_language]["tooltips"]["door_type"], self)
-        self.entries["door_type"][1].bind("<<ComboboxSelected>>", self.update_inputs)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "num_doors", current_row, add_separator=True)
-        self.tooltips["num_doors"] = ToolTip(self.entries["num_doors"][1], translations[self.current_language]["tooltips"]["num_doors"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "right_vpiece_width", current_row)
-        self.tooltips["right_vpiece_width"] = ToolTip(self.entries["right_vpiece_width"][1], translations[self.current_language]["tooltips"]["right_vpiece_width"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "left_vpiece_width", current_row)
-        self.tooltips["left_vpiece_width"] = ToolTip(self.entries["left_vpiece_width"][1], translations[self.current_language]["tooltips"]["left_vpiece_width"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "upper_hpiece_width", current_row)
-        self.tooltips["upper_hpiece_width"] = ToolTip(self.entries["upper_hpiece_width"][1], translations[self.current_language]["tooltips"]["upper_hpiece_width"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "lower_hpiece_width", current_row, add_separator=True)
-        self.tooltips["lower_hpiece_width"] = ToolTip(self.entries["lower_hpiece_width"][1], translations[self.current_language]["tooltips"]["lower_hpiece_width"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "ub_wood_width", current_row, add_separator=True)
-        self.tooltips["ub_wood_width"] = ToolTip(self.entries["ub_wood_width"][1], translations[self.current_language]["tooltips"]["ub_wood_width"], self)
-        
-        current_row= self.create_label_and_entry(self.entries_frame, "edge_sealing_type", current_row, "edge_sealing_type")
-        self.entries["edge_sealing_type"][1]['values'] = ("6mm 實木", "4mm 白木", "6mm 鋁封邊", "1mm 鐡封邊 + 1mm 石墨片", "1mm 鐡封邊", "1mm 不織布", "0.8mm 美耐板", "0.5mm ABS", "1mm 鋁封邊")
-        self.tooltips["edge_sealing_type"] = ToolTip(self.entries["edge_sealing_type"][1], translations[self.current_language]["tooltips"]["edge_sealing_type"], self)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "edge_sealing_thickness", current_row, add_separator=True)
-        self.tooltips["edge_sealing_thickness"] = ToolTip(self.entries["edge_sealing_thickness"][1], translations[self.current_language]["tooltips"]["edge_sealing_thickness"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "electric_lock_name", current_row, "electric_lock_name")
-        self.entries["electric_lock_name"][1]['values'] = list(electric_locks.keys())
-        self.tooltips["electric_lock_name"] = ToolTip(self.entries["electric_lock_name"][1], translations[self.current_language]["tooltips"]["electric_lock_name"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "box_lock_name", current_row, "box_lock_name")
-        self.entries["box_lock_name"][1]['values'] = list(box_locks.keys())
-        self.tooltips["box_lock_name"] = ToolTip(self.entries["box_lock_name"][1], translations[self.current_language]["tooltips"]["box_lock_name"], self)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "lock_length", current_row)
-        self.tooltips["lock_length"] = ToolTip(self.entries["lock_length"][1], translations[self.current_language]["tooltips"]["lock_length"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "lock_height", current_row)
-        self.tooltips["lock_height"] = ToolTip(self.entries["lock_height"][1], translations[self.current_language]["tooltips"]["lock_height"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "lock_direction", current_row, "lock_direction", add_separator= True)
-        self.entries["lock_direction"][1]['values'] = ("top", "bottom")
-        self.tooltips["lock_direction"] = ToolTip(self.entries["lock_direction"][1], translations[self.current_language]["tooltips"]["lock_direction"], self)
-        self.entries["lock_direction"][1].bind("<<ComboboxSelected>>", self.update_inputs)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "concealed_door_closer_name", current_row, "concealed_door_closer_name")
-        self.entries["concealed_door_closer_name"][1]['values'] = list(concealeds.keys())
-        self.tooltips["concealed_door_closer_name"] = ToolTip(self.entries["concealed_door_closer_name"][1], translations[self.current_language]["tooltips"]["concealed_door_closer_name"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "concealed_wood_width", current_row, add_separator=True)
-        self.tooltips["concealed_wood_width"] = ToolTip(self.entries["concealed_wood_width"][1], translations[self.current_language]["tooltips"]["concealed_wood_width"],self)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "slats_width", current_row)
-        self.tooltips["slats_width"] = ToolTip(self.entries["slats_width"][1], translations[self.current_language]["tooltips"]["slats_width"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "gap_width", current_row)
-        self.tooltips["gap_width"] = ToolTip(self.entries["gap_width"][1], translations[self.current_language]["tooltips"]["gap_width"], self)
-        # current_row= self.create_label_and_entry(self.entries_frame, "gap_wood_lock", current_row)
-        # self.tooltips["gap_wood_lock"] = ToolTip(self.entries["gap_wood_lock"][1], translations[self.current_language]["tooltips"]["gap_wood_lock"],self)
-        current_row= self.create_label_and_entry(self.entries_frame, "reinforce_wood", current_row)
-        self.tooltips["reinforce_wood"] = ToolTip(self.entries["reinforce_wood"][1], translations[self.current_language]["tooltips"]["reinforce_wood"],self)
-        
-        current_row= self.create_label_and_entry(self.entries_frame, "max_height", current_row)
-        self.tooltips["max_height"] = ToolTip(self.entries["max_height"][1], translations[self.current_language]["tooltips"]["max_height"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "min_height", current_row, add_separator=True)
-        self.tooltips["min_height"] = ToolTip(self.entries["min_height"][1], translations[self.current_language]["tooltips"]["min_height"], self)
-
-        current_row= self.create_label_and_entry(self.entries_frame, "lock_offset_bottom", current_row)
-        current_row= self.create_label_and_entry(self.entries_frame, "frame_height", current_row)
-        self.tooltips["frame_height"] = ToolTip(self.entries["frame_height"][1], translations[self.current_language]["tooltips"]["frame_height"], self)
-        current_row= self.create_label_and_entry(self.entries_frame, "frame_width", current_row)
-        self.tooltips["frame_width"] = ToolTip(self.entries["frame_width"][1], translations[self.current_language]["tooltips"]["frame_width"], self)
+        for key, entry_type, add_separator in FORM_FIELDS:
+            self.pending_fields[key] = (current_row, entry_type, add_separator)
+            current_row += 2 if add_separator else 1
+        for key in STARTUP_FIELDS:
+            self.build_field(key)
 
         self.calculate_button = ttk.Button(self.entries_frame, text=translations[self.current_language]["calculate"], command=self.calculate_material)
         self.calculate_button.grid(row=current_row, column=0, columnspan=2, padx=(0, 500))
         current_row +=1
         
+        # Progress and cancel of the calculation running in the background
+        self.progress_frame = ttk.Frame(self.entries_frame)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, length=200, maximum=1.0)
+        self.progress_bar.grid(row=0, column=0, padx=(0, 10))
+        self.cancel_button = ttk.Button(self.progress_frame, text=translations[self.current_language]["cancel"], command=self.cancel_calculation)
+        self.cancel_button.grid(row=0, column=1)
+        self.progress_row = current_row
+        
         scrollbar = ttk.Scrollbar(frame)
         # scrollbar.grid(row=current_row, column=2, sticky="nsew", padx=(0, 0), pady=(10, 10))
         
         # === Create Result Text (Left Side of Results Frame) ===
         self.result_text = tk.Text(self.results_frame, width=50, height=30, font=("Microsoft YaHei", 12), fg="dim gray", wrap="word", tabs="7c")
         self.result_text.grid(row=0, column=0, sticky="nsew", padx=(0, 0), pady=(5, 5))
+        # Text tags for the report styles of doorframe.report.STYLES
+        self.result_text.tag_configure("blackbold", foreground="black", font=("Microsoft YaHei", 14, "bold"))
+        self.result_text.tag_configure("black", foreground="black", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("khaki", foreground="chocolate3", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("blue", foreground="medium blue", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("green", foreground="lime green", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("purple", foreground="blue violet", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("orange", foreground="orange", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("brown", foreground="saddle brown", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("red", foreground="red2", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("magenta", foreground="magenta3", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("slategray", foreground="medium turquoise", font=("Microsoft YaHei", 12))
+        self.result_text.tag_configure("normal", font=("Microsoft YaHei", 12))
         
         # === Create Result Image (Right Side of Results Frame) ===
         self.result_image = tk.Text(self.results_frame, width=40, height=30)
         self.result_image.grid(row=0, column=1, sticky="nsew", padx=(0, 0), pady=(5, 5))
+        # One label for the diagram; showing a result only swaps its image
+        self.diagram_label = tk.Label(self.result_image)
+        self.result_image.window_create("end", window=self.diagram_label, padx=10, pady=10)
+        
+        # === Result History (below the results) ===
+        # Tk only draws the visible rows of a Listbox; the entries are capped at HISTORY_SIZE
+        self.history = ResultHistory(HISTORY_SIZE)
+        self.history_list = tk.Listbox(self.results_frame, height=6, font=("Microsoft YaHei", 10),
+                                       activestyle="none", exportselection=False)
+        self.history_list.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=(0, 0), pady=(0, 5))
+        self.history_list.bind("<<ListboxSelect>>", self.show_history_entry)
         
         # === Configure Layout Expansion ===
         self.root.grid_columnconfigure(0, weight=1)
@@ -372,6 +354,9 @@ class DoorFrameCalculator:
         trademark_label = ttk.Label(self.entries_frame, text="© 2024 HBB", font=("Microsoft YaHei", 8, "italic"))
         trademark_label.grid(row=current_row-1, column=0, columnspan=3, padx=(0, 1000))
         
+        # Live preview: every edit schedules a debounced recalculation
+        self.mode_selection.trace_add("write", self.schedule_preview)
+        
         self.update_inputs()
             
     def create_label_and_entry(self, entries_frame, key, row, entry_type="entry", add_separator=False):
@@ -395,6 +380,45 @@ class DoorFrameCalculator:
     
         return row + (2 if add_separator else 1)  # Increment rows correctly
 
+    def build_field(self, key):
+        """Create a field laid out by create_widgets, with its choices, tooltip and bindings."""
+        row, entry_type, add_separator = self.pending_fields.pop(key)
+        self.create_label_and_entry(self.entries_frame, key, row, entry_type, add_separator)
+        label, entry = self.entries[key]
+        if key != "category":
+            # Tab follows the stacking order: stack the field right after the nearest built one above it
+            previous = self.ub_mode_button
+            for other, _, _ in FORM_FIELDS:
+                if other == key:
+                    break
+                if other in self.entries:
+                    previous = self.entries[other][1]
+            label.lift(previous)
+            entry.lift(label)
+        if key in OPTION_FIELDS:
+            entry.bind("<<ComboboxSelected>>", self.update_inputs)
+        self.update_choices(key)
+        if key in translations[self.current_language]["tooltips"]:
+            self.tooltips[key] = ToolTip(entry, translations[self.current_language]["tooltips"][key], self)
+        entry.bind("<KeyRelease>", self.schedule_preview, add="+")
+        entry.bind("<<ComboboxSelected>>", self.schedule_preview, add="+")
+        for kind, field in CATALOG_FIELDS.items():
+            if field == key:
+                self.update_catalog_choices(kind)
+                # Lock and closer comboboxes narrow to the matching models while typing
+                entry.bind("<KeyRelease>", lambda event: self.filter_choices(key, event), add="+")
+
+    def update_choices(self, key):
+        """List the choices of an option or edge sealing combobox, options in the current language."""
+        if key in OPTION_CHOICES:
+            self.entries[key][1]['values'] = tuple(translations[self.current_language][option] for option in OPTION_CHOICES[key])
+        elif key == "edge_sealing_type":
+            self.entries[key][1]['values'] = EDGE_SEALING_TYPES
+
+    def field_text(self, key):
+        """The text of a form field; a field not built yet is still empty."""
+        return self.entries[key][1].get().strip() if key in self.entries else ""
+
     def update_inputs(self, *args):
         
         all_fields = [
@@ -405,50 +429,40 @@ class DoorFrameCalculator:
         ]
         self.show_entries(all_fields, False)
         
-        category = self.entries["category"][1].get().strip().lower()
-        structure_type = self.entries["structure_type"][1].get().strip().lower()
-        door_type = self.entries["door_type"][1].get().strip().lower()
-        lock_direction = self.entries["lock_direction"][1].get().strip().lower()
+        category = self.selected_option("category")
+        structure_type = self.selected_option("structure_type")
+        door_type = self.selected_option("door_type")
+        lock_direction = self.selected_option("lock_direction")
         mode = self.mode_selection.get()
-        if category == self.fireproof_label:
+        if category == FIREPROOF:
             self.show_entries(["door_type"], True)
             self.show_entries(["structure_type"], False)
-            self.entries["door_type"][1]['values'] = (
-                self.simple_label,
-                self.electric_lock_label,
-                self.box_lock_label
-            )
+            self.update_choices("door_type")
             self.ub_mode_button.grid()
             # self.entries["lock_direction"][1]['values'] = (
             #     self.top_label,
             #     self.bottom_label
             # )
-            if mode == "UB":
+            if mode == MODE_UB:
                 self.show_entries(["structure_type", "frame_height"], False)
                 self.show_entries(["num_doors", "right_vpiece_width", "left_vpiece_width", "door_type", "max_height", "min_height", "ub_wood_width"], True)
-                if door_type == self.simple_label:
+                if door_type == SIMPLE:
                     self.show_entries(["left_vpiece_width"], True)
-                elif door_type == self.electric_lock_label:
+                elif door_type == ELECTRIC_LOCK:
                     self.show_entries(["electric_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "concealed_wood_width"], True)
                     self.show_entries(["left_vpiece_width"], False)
-                    if lock_direction == self.bottom_label:
+                    if lock_direction == BOTTOM:
                         self.show_entries(["concealed_door_closer_name", "concealed_wood_width"], False)
-                        self.entries["concealed_door_closer_name"][1].delete(0, 'end')
-                        self.entries["concealed_door_closer_name"][1].insert(0, '')
-                        self.entries["concealed_wood_width"][1].delete(0, 'end')
-                        self.entries["concealed_wood_width"][1].insert(0, '')
-                    elif lock_direction == self.top_label:
+                        self.clear_entries(["concealed_door_closer_name", "concealed_wood_width"])
+                    elif lock_direction == TOP:
                         self.show_entries(["concealed_door_closer_name", "concealed_wood_width"], True)
-                elif door_type == self.box_lock_label:
+                elif door_type == BOX_LOCK:
                     self.show_entries(["box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name"], True)
                     self.show_entries(["left_vpiece_width"], False)
-                    if lock_direction == self.bottom_label:
+                    if lock_direction == BOTTOM:
                         self.show_entries(["concealed_door_closer_name", "concealed_wood_width"], False)
-                        self.entries["concealed_door_closer_name"][1].delete(0, 'end')
-                        self.entries["concealed_door_closer_name"][1].insert(0, '')
-                        self.entries["concealed_wood_width"][1].delete(0, 'end')
-                        self.entries["concealed_wood_width"][1].insert(0, '')
-                    elif lock_direction == self.top_label:
+                        self.clear_entries(["concealed_door_closer_name", "concealed_wood_width"])
+                    elif lock_direction == TOP:
                         self.show_entries(["concealed_door_closer_name", "concealed_wood_width"], True)
                 else:
                     self.show_entries(["electric_lock_name", "lock_length", "lock_height", "lock_direction", "lock_offset_bottom",
@@ -458,14 +472,14 @@ class DoorFrameCalculator:
                 self.show_entries(["structure_type", "door_type"], True)
                 self.show_entries(["num_doors", "right_vpiece_width", "left_vpiece_width", "frame_height"], True)
                 self.show_entries(["max_height", "min_height", "structure_type"], False)
-                if door_type == self.simple_label:
+                if door_type == SIMPLE:
                     self.show_entries(["left_vpiece_width"], True)
-                elif door_type == self.electric_lock_label:
+                elif door_type == ELECTRIC_LOCK:
                     self.show_entries(["electric_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "concealed_wood_width"], True)
                     self.show_entries(["left_vpiece_width"], False)
                 # elif door_type == self.ub_label:
                 #     self.show_entries(["max_height", "min_height"], True)
-                elif door_type == self.box_lock_label:
+                elif door_type == BOX_LOCK:
                     self.show_entries(["box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "concealed_wood_width"], True)
                     self.show_entries(["left_vpiece_width"], False)
                 else:
@@ -473,47 +487,43 @@ class DoorFrameCalculator:
                                         "max_height", "min_height", "box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "reinforce_wood", "concealed_wood_width"], False)
             
             
-        elif category == self.non_fireproof_label:
+        elif category == NON_FIREPROOF:
             self.show_entries(["door_type", "structure_type"], True)
-            self.entries["door_type"][1]['values'] = (
-                self.simple_label,
-                self.electric_lock_label,
-                self.box_lock_label
-            )
+            self.update_choices("door_type")
             self.normal_mode_button.grid()
             self.ub_mode_button.grid_remove()
-            self.mode_selection.set("Normal")
-            if structure_type == self.yipaiyikong_label:
+            self.mode_selection.set(MODE_NORMAL)
+            if structure_type == YIPAIYIKONG:
                 self.show_entries(["slats_width", "gap_width"], True)
-                if door_type == self.simple_label:
+                if door_type == SIMPLE:
                     self.show_entries(["left_vpiece_width"], True)
-                elif door_type == self.electric_lock_label:
+                elif door_type == ELECTRIC_LOCK:
                     self.show_entries(["electric_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
-                elif door_type == self.box_lock_label:
+                elif door_type == BOX_LOCK:
                     self.show_entries(["box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
                 else:
                     self.show_entries(["electric_lock_name", "lock_length", "lock_height", "lock_direction", "lock_offset_bottom",
                                         "max_height", "min_height", "box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "reinforce_wood", "concealed_wood_width"], False)
-            elif structure_type == self.honeycomb_board_label:
+            elif structure_type == HONEYCOMB_BOARD:
                 self.show_entries(["lock_height"], True)
                 self.show_entries(["slats_width"], False)
-                if door_type == self.simple_label:
+                if door_type == SIMPLE:
                     self.show_entries(["left_vpiece_width", "lock_height", "reinforce_wood"], True)
-                elif door_type == self.electric_lock_label:
+                elif door_type == ELECTRIC_LOCK:
                     self.show_entries(["electric_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
-                elif door_type == self.box_lock_label:
+                elif door_type == BOX_LOCK:
                     self.show_entries(["box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
                 else:
                     self.show_entries(["electric_lock_name", "lock_length", "lock_height", "lock_direction", "lock_offset_bottom",
                                         "max_height", "min_height", "box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "concealed_wood_width"], False)
-            elif structure_type == self.honeycomb_paper_label:
+            elif structure_type == HONEYCOMB_PAPER:
                 self.show_entries(["lock_height"], True)
                 self.show_entries(["slats_width"], False)
-                if door_type == self.simple_label:
+                if door_type == SIMPLE:
                     self.show_entries(["left_vpiece_width", "lock_height", "reinforce_wood"], True)
-                elif door_type == self.electric_lock_label:
+                elif door_type == ELECTRIC_LOCK:
                     self.show_entries(["electric_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
-                elif door_type == self.box_lock_label:
+                elif door_type == BOX_LOCK:
                     self.show_entries(["box_lock_name", "lock_height", "lock_direction", "concealed_door_closer_name", "left_vpiece_width", "concealed_wood_width"], True)
                 else:
                     self.show_entries(["electric_lock_name", "lock_length", "lock_height", "lock_direction", "lock_offset_bottom",
@@ -522,6 +532,8 @@ class DoorFrameCalculator:
 
     def show_entries(self, keys, show):
         for key in keys:
+            if show and key in self.pending_fields:
+                self.build_field(key)
             if key in self.entries:
                 label, widget = self.entries[key]
                 if show:
@@ -540,6 +552,11 @@ class DoorFrameCalculator:
                     else:
                         separator.grid_remove()
 
+    def clear_entries(self, keys):
+        for key in keys:
+            if key in self.entries:
+                self.entries[key][1].delete(0, 'end')
+
     def change_language(self, language):
         self.current_language = language
         self.update_language()
@@ -548,19 +565,66 @@ class DoorFrameCalculator:
         for key, tooltip in self.tooltips.items():
             tooltip.text = translations[self.current_language]["tooltips"][key]
 
-        
-        self.simple_label = translations[self.current_language]["simple"].lower()
-        self.electric_lock_label = translations[self.current_language]["electric lock"].lower()
-        self.ub_label = translations[self.current_language]["UB"].lower()
-        self.box_lock_label = translations[self.current_language]["box lock"].lower()
-        self.yipaiyikong_label = translations[self.current_language]["yipaiyikong"].lower()
-        self.top_label = translations[self.current_language]["top"].lower()
-        self.bottom_label = translations[self.current_language]["bottom"].lower()
-        self.concealed_label = translations[self.current_language]["concealed door closer"].lower()
-        self.fireproof_label = translations[self.current_language]["fireproof"].lower()
-        self.non_fireproof_label = translations[self.current_language]["non_fireproof"].lower()
-        self.honeycomb_paper_label = translations[self.current_language]["honeycomb_paper"].lower()
-        self.honeycomb_board_label = translations[self.current_language]["honeycomb_board"].lower()
+        self.update_option_keys()
+        # The history keeps report models, so the shown result and the list follow the language
+        if len(self.history):
+            selection = self.history_list.curselection()
+            self.history_list.delete(0, tk.END)
+            self.history_list.insert(tk.END, *(self.history_title(entry) for entry in self.history))
+            self.history_list.selection_set(selection[0] if selection else tk.END)
+            self.show_history_entry()
+
+    def update_option_keys(self):
+        # Map translated, lower-cased combobox selections back to engine values
+        self.option_keys = {translations[self.current_language][key].lower(): key for key in OPTION_KEYS}
+
+    def selected_option(self, key):
+        """The engine value (FIREPROOF, SIMPLE, TOP, ...) selected in an option combobox, in any language."""
+        label = self.field_text(key).lower()
+        return self.option_keys.get(label, label)
+
+    def read_door_spec(self):
+        """Build a language-neutral DoorSpec from the current form values."""
+        def text(key):
+            return self.field_text(key)
+
+        def number(key):
+            return safe_int(text(key))
+
+        try:
+            edge_sealing_thickness = float(text("edge_sealing_thickness"))
+        except ValueError:
+            edge_sealing_thickness = None
+
+        return DoorSpec(
+            category=self.selected_option("category"),
+            mode=self.mode_selection.get(),
+            structure_type=self.selected_option("structure_type"),
+            door_type=self.selected_option("door_type"),
+            num_doors=number("num_doors"),
+            right_vpiece_width=number("right_vpiece_width"),
+            left_vpiece_width=number("left_vpiece_width"),
+            upper_hpiece_width=number("upper_hpiece_width"),
+            lower_hpiece_width=number("lower_hpiece_width"),
+            ub_wood_width=number("ub_wood_width"),
+            edge_sealing_type=text("edge_sealing_type"),
+            edge_sealing_thickness=edge_sealing_thickness,
+            electric_lock_name=text("electric_lock_name"),
+            box_lock_name=text("box_lock_name"),
+            lock_length=number("lock_length"),
+            lock_offset_bottom=number("lock_offset_bottom"),
+            lock_height=number("lock_height"),
+            lock_direction=self.selected_option("lock_direction"),
+            concealed_door_closer_name=text("concealed_door_closer_name"),
+            concealed_wood_width=number("concealed_wood_width"),
+            slats_width=number("slats_width"),
+            gap_width=number("gap_width"),
+            reinforce_wood=number("reinforce_wood"),
+            max_height=number("max_height"),
+            min_height=number("min_height"),
+            frame_height=number("frame_height"),
+            frame_width=number("frame_width"),
+        )
 
     def update_language(self):
         self.root.title(translations[self.current_language]["app_title"])
@@ -571,6 +635,7 @@ class DoorFrameCalculator:
         self.edit_menu.entryconfig(3, label=translations[self.current_language]["remove_box_lock"])
         self.edit_menu.entryconfig(4, label=translations[self.current_language]["add_concealed_door_closer"])
         self.edit_menu.entryconfig(5, label=translations[self.current_language]["remove_concealed_door_closer"])
+        self.edit_menu.entryconfig(6, label=translations[self.current_language]["import_catalog"])
         
         self.menu_bar.entryconfig(2, label=translations[self.current_language]["language"])
         
@@ -583,8 +648,10 @@ class DoorFrameCalculator:
         
         self.menu_bar.entryconfig(4, label=translations[self.current_language]["Guidance"])
         self.view_menu.entryconfig(0, label=translations[self.current_language]["Enable_"])
+        self.view_menu.entryconfig(1, label=translations[self.current_language]["live_preview"])
         
         self.calculate_button.config(text=translations[self.current_language]["calculate"])
+        self.cancel_button.config(text=translations[self.current_language]["cancel"])
         
         for key, value in self.entries.items():
             if isinstance(value, tuple) and len(value) == 2:
@@ -597,30 +664,12 @@ class DoorFrameCalculator:
                         if values_key in translations[self.current_language]:
                             entry['values'] = translations[self.current_language][values_key]
                             
-        self.entries["category"][1]['values'] = (
-            translations[self.current_language]["fireproof"],
-            translations[self.current_language]["non_fireproof"]
-        )
-        self.entries["structure_type"][1]['values'] = (
-            translations[self.current_language]["honeycomb_paper"],
-            translations[self.current_language]["yipaiyikong"],
-            translations[self.current_language]["honeycomb_board"]
-        )
-        self.entries["door_type"][1]['values'] = (
-        translations[self.current_language]["simple"],
-        # translations[self.current_language]["UB"],
-        translations[self.current_language]["electric lock"],
-        translations[self.current_language]["box lock"]
-        # translations[self.current_language]["yipaiyikong"]
-        )
-        self.entries["edge_sealing_type"][1]['values'] = ("6mm 實木", "4mm 白木", "6mm 鋁封邊", "1mm 鐡封邊 + 1mm 石墨片", "1mm 鐡封邊", "1mm 不織布", "0.8mm 美耐板", "0.5mm ABS", "1mm 鋁封邊")
-        self.entries["electric_lock_name"][1]['values'] = list(electric_locks.keys())
-        self.entries["box_lock_name"][1]['values'] = list(box_locks.keys())
-        self.entries["concealed_door_closer_name"][1]['values'] = list(concealeds.keys())
-        self.entries["lock_direction"][1]['values'] = (
-        translations[self.current_language]["top"],
-        translations[self.current_language]["bottom"]
-        )
+        # Fields not built yet get their choices in the then current language
+        for key in (*OPTION_FIELDS, "edge_sealing_type"):
+            if key in self.entries:
+                self.update_choices(key)
+        for kind in CATALOG_FIELDS:
+            self.update_catalog_choices(kind)
         self.language_menu.entryconfig(0, label="English")
         self.language_menu.entryconfig(1, label="中文")
         self.language_menu.entryconfig(2, label="Bahasa")
@@ -632,800 +681,49 @@ class DoorFrameCalculator:
         if hasattr(self, "mode_selection"):
             self.mode_selection_label.config(text=translations[self.current_language]["mode_selection"])
         
-    def add_annotations(self, image_path, vertical_length, horizontal_length, door_type, outer_wood_upper, inner_wood_upper, outer_wood_bottom, 
-                        inner_wood_bottom, concealed_length, very_upper_horizontal_piece_length, concealed_door_closer_name, slats_count,
-                        category, gap_wood_lock_length, reinforce_wood, gap_length_bottom, gap_length_upper, gap_wood_lock, gap_length, mode, reinforce_concealed_wood_length):
-        # Open the image file
-        image = Image.open(image_path)
-        draw = ImageDraw.Draw(image)
-        structure_type = self.entries["structure_type"][1].get().strip().lower()
-        
-        # Define font and size
-        font = ImageFont.truetype("arial.ttf", 24)  # Ensure the font file is available
-        
-        if concealed_door_closer_name in concealeds:
-            concealed_length = concealeds[concealed_door_closer_name]['length']
-        else:
-            # Set default values if no concealed door closer is selected
-            concealed_length = 0
-
-        # Annotation positions can be adjusted based on door_type
-        '''################################################################### Fireproof!!!#########################################################'''
-        
-        if category == self.fireproof_label and mode != "UB" and door_type == self.simple_label:
-            annotations = {
-            "*mm (milimeter)": ((5, 5), "black"),
-            f"{horizontal_length}": ((190, 35), "red"),   # Position and color for horizontal length
-            f"{vertical_length}": ((40, 210), "mediumblue")     # Position and color for vertical length
-        }
-        elif category == self.fireproof_label and door_type == self.electric_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{very_upper_horizontal_piece_length}": ((160, 30), "magenta"),
-                f"{outer_wood_upper}": ((45, 190), "limegreen"),
-                f"{inner_wood_upper}": ((45, 80), "blueviolet"),
-                f"{outer_wood_bottom}": ((45, 280), "orange"),
-                f"{inner_wood_bottom}": ((45, 380), "saddlebrown"),
-                f"{vertical_length}": ((400, 260), "mediumblue"),
-                f"{horizontal_length}": ((200, 430), "red"),
-                f"{concealed_length}": ((300, 20), "black")
-            }
-        elif category == self.fireproof_label and door_type == self.electric_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((160, 30), "red"),
-                f"{outer_wood_upper}": ((45, 190), "limegreen"),
-                f"{inner_wood_upper}": ((45, 80), "blueviolet"),
-                f"{outer_wood_bottom}": ((45, 280), "orange"),
-                f"{inner_wood_bottom}": ((45, 380), "saddlebrown"),
-                f"{vertical_length}": ((400, 260), "mediumblue")
-            }
-        elif category == self.fireproof_label and door_type == self.box_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{very_upper_horizontal_piece_length}": ((160, 30), "fuchsia"),
-                f"{outer_wood_upper}": ((45, 190), "limegreen"),
-                f"{inner_wood_upper}": ((45, 80), "blueviolet"),
-                f"{outer_wood_bottom}": ((45, 280), "orange"),
-                f"{inner_wood_bottom}": ((45, 380), "saddlebrown"),
-                f"{vertical_length}": ((400, 260), "mediumblue"),
-                f"{horizontal_length}": ((200, 430), "red"),
-                f"{concealed_length}": ((300, 20), "black")
-            }
-        elif category == self.fireproof_label and door_type == self.box_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((160, 30), "red"),
-                f"{outer_wood_upper}": ((45, 190), "limegreen"),
-                f"{inner_wood_upper}": ((45, 80), "blueviolet"),
-                f"{outer_wood_bottom}": ((45, 280), "orange"),
-                f"{inner_wood_bottom}": ((45, 380), "saddlebrown"),
-                f"{vertical_length}": ((400, 260), "mediumblue")
-            }
-        elif category == self.fireproof_label and mode == "UB" and door_type == self.simple_label:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((120, 35), "red"),   # Position and color for horizontal length
-                f"{vertical_length}": ((10, 210), "mediumblue")
-                }
-            
-########################################## Non Fireproof!!##############################################
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_board_label and door_type == self.simple_label:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((170, 40), "red"),
-                f"{vertical_length}": ((40, 200), "mediumblue"),
-                f"{reinforce_wood}": ((370, 190), "limegreen"),
-                f"{gap_length_upper}": ((230,125), "saddlebrown"),
-                f"{gap_length_bottom}": ((230,325), "saddlebrown")
-                }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_board_label and door_type == self.electric_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((230,125), "saddlebrown"),
-                f"二{gap_length}": ((230,220), "saddlebrown"),
-                f"三{gap_length}": ((230,325), "saddlebrown")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_board_label and door_type == self.electric_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((230,125), "saddlebrown"),
-                f"二{gap_length}": ((230,220), "saddlebrown"),
-                f"三{gap_length}": ((230,325), "saddlebrown"),
-                f"{concealed_length}": ((280, 25), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{reinforce_concealed_wood_length}": ((390, 65), "black")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_board_label and door_type == self.box_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((230,125), "saddlebrown"),
-                f"二{gap_length}": ((230,220), "saddlebrown"),
-                f"三{gap_length}": ((230,325), "saddlebrown")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_board_label and door_type == self.box_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((230,125), "saddlebrown"),
-                f"二{gap_length}": ((230,220), "saddlebrown"),
-                f"三{gap_length}": ((230,325), "saddlebrown"),
-                f"{concealed_length}": ((280, 25), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{reinforce_concealed_wood_length}": ((390,65), "black")
-            }
-######################################################################################
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_paper_label and door_type == self.simple_label:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((180, 40), "red"),
-                f"{vertical_length}": ((40, 200), "mediumblue"),
-                f"{reinforce_wood}": ((370, 190), "limegreen"),
-                f"一{gap_length_upper}": ((190,100), "saddlebrown"),
-                f"二{gap_length_upper}": ((190,155), "saddlebrown"),
-                f"三{gap_length_bottom}": ((190,300), "saddlebrown"),
-                f"四{gap_length_bottom}": ((190,360), "saddlebrown")
-                }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_paper_label and door_type == self.electric_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((190,100), "saddlebrown"),
-                f"二{gap_length}": ((190,155), "saddlebrown"),
-                f"三{gap_length}": ((190,280), "saddlebrown"),
-                f"四{gap_length}": ((190,360), "saddlebrown"),
-                f"五{gap_length}": ((190,220), "saddlebrown")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_paper_label and door_type == self.electric_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((190,125), "saddlebrown"),
-                f"二{gap_length}": ((190,175), "saddlebrown"),
-                f"三{gap_length}": ((190,300), "saddlebrown"),
-                f"四{gap_length}": ((190,360), "saddlebrown"),
-                f"五{gap_length}": ((190,230), "saddlebrown"),
-                f"{concealed_length}": ((280, 25), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{reinforce_concealed_wood_length}": ((390,65), "black")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_paper_label and door_type == self.box_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((190,100), "saddlebrown"),
-                f"二{gap_length}": ((190,155), "saddlebrown"),
-                f"三{gap_length}": ((190,280), "saddlebrown"),
-                f"四{gap_length}": ((190,360), "saddlebrown"),
-                f"五{gap_length}": ((190,220), "saddlebrown")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.honeycomb_paper_label and door_type == self.box_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"{vertical_length}": ((390, 200), "mediumblue"),
-                f"一{gap_length}": ((190,125), "saddlebrown"),
-                f"二{gap_length}": ((190,175), "saddlebrown"),
-                f"三{gap_length}": ((190,300), "saddlebrown"),
-                f"四{gap_length}": ((190,360), "saddlebrown"),
-                f"五{gap_length}": ((190,230), "saddlebrown"),
-                f"{concealed_length}": ((280, 25), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{reinforce_concealed_wood_length}": ((390,65), "black")
-            }
-#####################################################################################
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label and door_type == self.simple_label:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((150, 30), "red"),   # Position and color for horizontal length
-                f"{vertical_length}": ((15, 210), "mediumblue"),
-                f"{slats_count} pcs": ((370, 260), "mediumturquoise")
-                }
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label and door_type == self.electric_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 190), "mediumblue"),
-                f"{slats_count} pcs": ((390, 320), "mediumturquoise")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label and door_type == self.electric_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 190), "mediumblue"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{concealed_length}": ((280, 20), "black"),
-                f"{slats_count} pcs": ((390, 320), "mediumturquoise"),
-                f"{reinforce_concealed_wood_length}": ((390,65), "black")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label and door_type == self.box_lock_label and concealed_length == 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{horizontal_length}": ((200, 33), "red"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 190), "mediumblue"),
-                f"{slats_count} pcs": ((390, 320), "mediumturquoise")
-            }
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label and door_type == self.box_lock_label and concealed_length > 0:
-            annotations = {
-                "*mm (milimeter)": ((5, 5), "black"),
-                f"{very_upper_horizontal_piece_length}": ((150, 30), "fuchsia"),
-                f"{outer_wood_upper}": ((10, 130), "limegreen"),
-                f"{outer_wood_bottom}": ((10, 320), "orange"),
-                f"{gap_wood_lock_length}": ((50, 430), "fuchsia"),
-                f"{vertical_length}": ((390, 190), "mediumblue"),
-                f"{horizontal_length}": ((300, 430), "red"),
-                f"{concealed_length}": ((280, 20), "black"),
-                f"{slats_count} pcs": ((390, 320), "mediumturquoise"),
-                f"{reinforce_concealed_wood_length}": ((390,65), "black")
-            }
-
-        for text, (position, color) in annotations.items():
-            draw.text(position, text, fill=color, font=font)
-
-        # Save the modified image
-        annotated_image_path = image_path.replace(".png", "_annotated.png")
-        image.save(annotated_image_path)
-        
-        return annotated_image_path
-
     def calculate_material(self):
         try:
-            mode = self.mode_selection.get()
-            # Initialize shared variables
-            frame_height = frame_width = max_height = min_height = concealed_wood_piece_width = None
-            
             self.validate_inputs()
             # Proceed with calculation if validation passes
-            # self.perform_calculation()
-        
-     
-            door_type = self.entries["door_type"][1].get().strip().lower()
-            category = self.entries["category"][1].get().strip().lower()
-            num_doors = safe_int(self.entries["num_doors"][1].get())
-            structure_type = self.entries["structure_type"][1].get().strip().lower()
-            category = self.entries["category"][1].get().strip().lower()
-            
-
-            right_vertical_piece_width = safe_int(self.entries["right_vpiece_width"][1].get())
-            if category == self.fireproof_label:
-                if door_type != self.electric_lock_label and door_type != self.box_lock_label:
-                    left_vertical_piece_width = safe_int(self.entries["left_vpiece_width"][1].get())
-                else:
-                    left_vertical_piece_width = 70
-            elif category == self.non_fireproof_label:
-                if door_type == self.electric_lock_label or door_type == self.box_lock_label:
-                    left_vertical_piece_width = safe_int(self.entries["left_vpiece_width"][1].get())
-                else:
-                    left_vertical_piece_width = safe_int(self.entries["left_vpiece_width"][1].get())
-
-                
-            upper_horizontal_piece_width = safe_int(self.entries["upper_hpiece_width"][1].get())
-            lower_horizontal_piece_width = safe_int(self.entries["lower_hpiece_width"][1].get())
-            ub_wood_piece_width = safe_int(self.entries["ub_wood_width"][1].get())
-            
-
-            
-            edge_sealing_options = {
-                "6mm 實木": 6,
-                "6mm 鋁封邊": 6,
-                "0.5mm ABS": 0.5,
-                "1mm 鐡封邊 + 1mm 石墨片": 2,
-                "1mm 鐡封邊": 1,
-                "4mm 白木": 4,
-                "0.8mm 美耐板": 0.8,
-                "1mm 不織布": 1,
-                "1mm 鋁封邊": 1
-            }
-
-            edge_sealing_type = self.entries["edge_sealing_type"][1].get().strip()
-            edge_sealing = edge_sealing_options.get(edge_sealing_type, None)
-
-            if edge_sealing is None:
-                edge_sealing = float(self.entries["edge_sealing_thickness"][1].get())
-
-            if right_vertical_piece_width == left_vertical_piece_width:
-                vertical_piece_width = right_vertical_piece_width
-            else:
-                vertical_piece_width = None
-
-            if upper_horizontal_piece_width == lower_horizontal_piece_width:
-                horizontal_piece_width = upper_horizontal_piece_width
-            else:
-                horizontal_piece_width = None
-
-            max_height = min_height = None
-            electric_lock_name = ""
-            lock_length = 0
-            electric_lock_height = 0
-            lock_direction = ""
-            lock_offset_bottom = 0
-            lock_offset_top = 0
-            concealed_door_closer_name = ""
-            concealed_length = 0
-            box_lock_name = ""
-            box_lock_height = 0
-            gap_width = 0
-            slats_width = 0
-            # gap_wood_lock = 0
-            reinforce_wood = 0
-            lock_height = 0
-            lock_length = 0
-
-            if category == self.fireproof_label and mode != "UB":
-                if door_type == self.box_lock_label:
-                    box_lock_name = self.entries["box_lock_name"][1].get().strip()
-                    concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                    if box_lock_name in box_locks:
-                        lock_length = box_locks[box_lock_name]['length']
-                        lock_offset_bottom = box_locks[box_lock_name]['offset_bottom']
-                        lock_offset_top = box_locks[box_lock_name]['offset_top']
-                    elif concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                    else:
-                        lock_length = safe_int(self.entries["lock_length"][1].get())
-                        lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                        lock_offset_top = lock_length - lock_offset_bottom
-                        # concealed_length = ""
-                    box_lock_height = safe_int(self.entries["lock_height"][1].get())
-                    lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                    frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                    frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                    concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                elif door_type == self.electric_lock_label:
-                    electric_lock_name = self.entries["electric_lock_name"][1].get().strip()
-                    concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                    if electric_lock_name in electric_locks:
-                        lock_length = electric_locks[electric_lock_name]['length']
-                        lock_offset_bottom = electric_locks[electric_lock_name]['offset_bottom']
-                        lock_offset_top = electric_locks[electric_lock_name]['offset_top']
-                    elif concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                    else:
-                        lock_length = safe_int(self.entries["lock_length"][1].get())
-                        lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                        lock_offset_top = lock_length - lock_offset_bottom
-                    electric_lock_height = safe_int(self.entries["lock_height"][1].get())
-                    lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                    frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                    frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                    concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                else:
-                    frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                    frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                        
-            elif category == self.fireproof_label and mode == "UB":
-                if door_type == self.box_lock_label:
-                    box_lock_name = self.entries["box_lock_name"][1].get().strip()
-                    concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                    if box_lock_name in box_locks:
-                        lock_length = box_locks[box_lock_name]['length']
-                        lock_offset_bottom = box_locks[box_lock_name]['offset_bottom']
-                        lock_offset_top = box_locks[box_lock_name]['offset_top']
-                    elif concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                    else:
-                        lock_length = safe_int(self.entries["lock_length"][1].get())
-                        lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                        lock_offset_top = lock_length - lock_offset_bottom
-                        # concealed_length = ""
-                    box_lock_height = safe_int(self.entries["lock_height"][1].get())
-                    lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                    # frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                    # frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                    max_height = safe_int(self.entries["max_height"][1].get())
-                    min_height = safe_int(self.entries["min_height"][1].get())
-                    frame_width = safe_int(self.entries["frame_width"][1].get())
-                    frame_height = max_height  # Frame height equals max height in UB mode
-                    concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                    if max_height - min_height > safe_int(self.entries["ub_wood_width"][1].get()):
-                        raise ValueError("the difference height should not exceed wood width\n 高度差異不應超過UB角材的寬度\n Perbedaan tinggi tidak boleh melebihi lebar kayu sisi")
-                elif door_type == self.electric_lock_label:
-                    electric_lock_name = self.entries["electric_lock_name"][1].get().strip()
-                    concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                    if electric_lock_name in electric_locks:
-                        lock_length = electric_locks[electric_lock_name]['length']
-                        lock_offset_bottom = electric_locks[electric_lock_name]['offset_bottom']
-                        lock_offset_top = electric_locks[electric_lock_name]['offset_top']
-                    elif concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                    else:
-                        lock_length = safe_int(self.entries["lock_length"][1].get())
-                        lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                        lock_offset_top = lock_length - lock_offset_bottom
-                    electric_lock_height = safe_int(self.entries["lock_height"][1].get())
-                    lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                    # frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                    # frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                    max_height = safe_int(self.entries["max_height"][1].get())
-                    min_height = safe_int(self.entries["min_height"][1].get())
-                    frame_width = safe_int(self.entries["frame_width"][1].get())
-                    frame_height = max_height  # Frame height equals max height in UB mode
-                    concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                    if max_height - min_height > safe_int(self.entries["ub_wood_width"][1].get()):
-                        raise ValueError("the difference height should not exceed wood width\n 高度差異不應超過UB角材的寬度\n Perbedaan tinggi tidak boleh melebihi lebar kayu sisi")
-                else:
-                    max_height = safe_int(self.entries["max_height"][1].get())
-                    min_height = safe_int(self.entries["min_height"][1].get())
-                    frame_height = max_height
-                    frame_width = safe_int(self.entries["frame_width"][1].get())
-                    if max_height - min_height > safe_int(self.entries["ub_wood_width"][1].get()):
-                        raise ValueError("the difference height should not exceed wood width\n 高度差異不應超過UB角材的寬度\n Perbedaan tinggi tidak boleh melebihi lebar kayu sisi bagian atas")
-
-
-            elif category == self.non_fireproof_label:            
-                if structure_type == self.yipaiyikong_label:
-                    if door_type == self.box_lock_label:
-                        box_lock_name = self.entries["box_lock_name"][1].get().strip()
-                        concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                        if box_lock_name in box_locks:
-                            lock_length = box_locks[box_lock_name]['length']
-                            lock_offset_bottom = box_locks[box_lock_name]['offset_bottom']
-                            lock_offset_top = box_locks[box_lock_name]['offset_top']
-                        elif concealed_door_closer_name in concealeds:
-                            concealed_length = concealeds[concealed_door_closer_name]['length']
-                        else:
-                            lock_length = safe_int(self.entries["lock_length"][1].get())
-                            lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                            lock_offset_top = lock_length - lock_offset_bottom
-                            # concealed_length = ""
-                        box_lock_height = safe_int(self.entries["lock_height"][1].get())
-                        lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                        frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                        frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                        gap_width = safe_int(self.entries["gap_width"][1].get())
-                        slats_width = safe_int(self.entries["slats_width"][1].get())
-                        concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                        # print("test4", gap_width)
-                        # gap_wood_lock = safe_int(self.entries["gap_wood_lock"][1].get())
-                    elif door_type == self.electric_lock_label:
-                        electric_lock_name = self.entries["electric_lock_name"][1].get().strip()
-                        concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                        if electric_lock_name in electric_locks:
-                            lock_length = electric_locks[electric_lock_name]['length']
-                            lock_offset_bottom = electric_locks[electric_lock_name]['offset_bottom']
-                            lock_offset_top = electric_locks[electric_lock_name]['offset_top']
-                        elif concealed_door_closer_name in concealeds:
-                            concealed_length = concealeds[concealed_door_closer_name]['length']
-                        else:
-                            lock_length = safe_int(self.entries["lock_length"][1].get())
-                            lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                            lock_offset_top = lock_length - lock_offset_bottom
-                        electric_lock_height = safe_int(self.entries["lock_height"][1].get())
-                        lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                        frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                        frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                        slats_width = safe_int(self.entries["slats_width"][1].get())
-                        gap_width = safe_int(self.entries["gap_width"][1].get())
-                        concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                    else:
-                        frame_height = safe_int(self.entries["frame_height"][1].get())
-                        frame_width = safe_int(self.entries["frame_width"][1].get())
-                        gap_width = safe_int(self.entries["gap_width"][1].get())
-
-                else:
-                    if door_type == self.box_lock_label:
-                        box_lock_name = self.entries["box_lock_name"][1].get().strip()
-                        concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                        if box_lock_name in box_locks:
-                            lock_length = box_locks[box_lock_name]['length']
-                            lock_offset_bottom = box_locks[box_lock_name]['offset_bottom']
-                            lock_offset_top = box_locks[box_lock_name]['offset_top']
-                        elif concealed_door_closer_name in concealeds:
-                            concealed_length = concealeds[concealed_door_closer_name]['length']
-                        else:
-                            lock_length = safe_int(self.entries["lock_length"][1].get())
-                            lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                            lock_offset_top = lock_length - lock_offset_bottom
-                            # concealed_length = ""
-                        box_lock_height = safe_int(self.entries["lock_height"][1].get())
-                        lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                        frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                        frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                        concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                        # lock_height = safe_int(self.entries["lock_height"][1].get()) if lock_height is None else lock_height
-                    elif door_type == self.electric_lock_label:
-                        electric_lock_name = self.entries["electric_lock_name"][1].get().strip()
-                        concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
-                        if electric_lock_name in electric_locks:
-                            lock_length = electric_locks[electric_lock_name]['length']
-                            lock_offset_bottom = electric_locks[electric_lock_name]['offset_bottom']
-                            lock_offset_top = electric_locks[electric_lock_name]['offset_top']
-                        elif concealed_door_closer_name in concealeds:
-                            concealed_length = concealeds[concealed_door_closer_name]['length']
-                        else:
-                            lock_length = safe_int(self.entries["lock_length"][1].get())
-                            lock_offset_bottom = safe_int(self.entries["lock_offset_bottom"][1].get())
-                            lock_offset_top = lock_length - lock_offset_bottom
-                        electric_lock_height = safe_int(self.entries["lock_height"][1].get())
-                        lock_direction = self.entries["lock_direction"][1].get().strip().lower()
-                        frame_height = safe_int(self.entries["frame_height"][1].get()) if frame_height is None else frame_height
-                        frame_width = safe_int(self.entries["frame_width"][1].get()) if frame_width is None else frame_width
-                        concealed_wood_piece_width = safe_int(self.entries["concealed_wood_width"][1].get()) if concealed_wood_piece_width is None else concealed_wood_piece_width
-                        # lock_height = safe_int(self.entries["lock_height"][1].get()) if lock_height is None else lock_height
-                        # gap_wood_lock = safe_int(self.entries["gap_wood_lock"][1].get())
-                    else:
-                        frame_height = safe_int(self.entries["frame_height"][1].get())
-                        frame_width = safe_int(self.entries["frame_width"][1].get())
-                        lock_height = safe_int(self.entries["lock_height"][1].get())
-                        reinforce_wood = safe_int(self.entries["reinforce_wood"][1].get())
-                        
-            if edge_sealing_type in ["1mm 鐡封邊 + 1mm 石墨片"]:
-                electric_lock_height += 3
-                box_lock_height += 3
-                
-            elif edge_sealing_type in ["1mm 鋁封邊"]:
-                electric_lock_height += 2
-                box_lock_height += 2
-                
-            elif edge_sealing_type in ["1mm 鐡封邊", "0.5mm ABS", "0.8mm 美耐板", "1mm 不織布"]:
-                electric_lock_height += 4
-                box_lock_height += 4
-                    
-            if edge_sealing_type in ["0.5mm ABS", "0.8mm 美耐板", "1mm 不織布"]:
-                frame_height += 10
-                frame_width += 10
-            elif edge_sealing_type in ["1mm 鐡封邊 + 1mm 石墨片", "1mm 鐡封邊"]:
-                frame_height += 5
-                frame_width += 5
-            elif edge_sealing_type in ["1mm 鋁封邊"]:
-                frame_height += 3
-                frame_width += 3
-
-            inner_width, slats_length, plywood_width, plywood_height, total_length_all_doors, vertical_piece_length, \
-                horizontal_pieces_length, frame_width, outer_wood_bottom, inner_wood_bottom, \
-                outer_wood_upper, inner_wood_upper,very_upper_horizontal_piece_length, gap_width, slats_width,\
-                    slats_count, total_blocks, gap_wood_lock, lock_height, reinforce_wood, gap_wood_lock_length,\
-                    gap_length_bottom, gap_length_upper, gap_length, reinforce_concealed_wood_length = self.calculate_material_requirements(
-                    door_type, num_doors, frame_height, right_vertical_piece_width, left_vertical_piece_width,
-                    upper_horizontal_piece_width, lower_horizontal_piece_width, edge_sealing, max_height, min_height,
-                    vertical_piece_width, horizontal_piece_width, frame_width, electric_lock_name, box_lock_name, lock_length,
-                    electric_lock_height, box_lock_height, lock_direction, concealed_door_closer_name, concealed_length,
-                    lock_offset_bottom, lock_offset_top, gap_width, slats_width, mode, category, structure_type, lock_height, reinforce_wood, ub_wood_piece_width, concealed_wood_piece_width)
-
-            report = self.generate_report(door_type, num_doors, inner_width, slats_length, gap_width, slats_count, total_blocks, plywood_width, plywood_height, total_length_all_doors,
-                                          vertical_piece_length, horizontal_pieces_length, right_vertical_piece_width,
-                                          left_vertical_piece_width, upper_horizontal_piece_width, lower_horizontal_piece_width,
-                                          edge_sealing, max_height, min_height, vertical_piece_width, horizontal_piece_width,
-                                          electric_lock_name, box_lock_name, lock_length, electric_lock_height, box_lock_height, lock_direction, concealed_door_closer_name, concealed_length,
-                                          outer_wood_bottom, inner_wood_bottom, outer_wood_upper, inner_wood_upper,very_upper_horizontal_piece_length,
-                                          frame_width, mode, category, structure_type, reinforce_wood, gap_length_bottom, gap_length_upper, gap_length, gap_wood_lock,
-                                          gap_wood_lock_length, ub_wood_piece_width, edge_sealing_type, concealed_wood_piece_width, reinforce_concealed_wood_length)
-            
-            # Determine the image to display based on door type
-            door_type = self.entries["door_type"][1].get().strip().lower()
-            
-            # Debugging output
-            # print(f"door_type: '{door_type}'")
-            # print(f"Expected: simple_label='{self.simple_label}', ub_label='{self.ub_label}', electric_lock_label='{self.electric_lock_label}', box_lock_label='{self.box_lock_label}'")
-
-            if concealed_door_closer_name in concealeds:
-                concealed_length = concealeds[concealed_door_closer_name]['length']
-            else:
-                # Set default values if no concealed door closer is selected
-                concealed_length = 0           
-            
-            if category == self.fireproof_label:
-                if mode == "UB":
-                    if door_type == self.simple_label:
-                        image_path = os.path.join(application_path, 'UB.png')
-                        
-                    elif door_type in [self.electric_lock_label, self.box_lock_label]:
-                        if lock_direction == self.top_label:
-                            if concealed_length > 0:
-                                image_path = os.path.join(application_path, 'UB_kunci_elektrik_menkongqi.png')
-                            else:
-                                image_path = os.path.join(application_path, 'UB_kunci_elektrik.png')
-                        elif lock_direction == self.bottom_label:
-                            image_path = os.path.join(application_path, 'UB_kunci_elektrik_bawah.png')
-                        
-                
-                else:
-                    if door_type == self.simple_label:
-                        image_path = os.path.join(application_path, 'simple.png')
-                    
-                    elif door_type in [self.electric_lock_label, self.box_lock_label]:
-                        if concealed_length > 0:
-                            image_path = os.path.join(application_path, 'kunci menkongqi.png')
-                        else:
-                            image_path = os.path.join(application_path, 'kunci.png')
-            
-            elif category == self.non_fireproof_label:
-                if structure_type == self.honeycomb_board_label:
-                    if door_type == self.simple_label:
-                        image_path = os.path.join(application_path, 'honeycomb_board_simple.png')
-                    elif door_type in [self.electric_lock_label, self.box_lock_label]:
-                        if concealed_length > 0:
-                            image_path = os.path.join(application_path, 'honeycomb_board_kunci_elektrik_menkongqi.png')
-                        else:
-                            image_path = os.path.join(application_path, 'honeycomb_board_kunci_elektrik.png')
-            
-                elif structure_type == self.honeycomb_paper_label:
-                    if door_type == self.simple_label:
-                        image_path = os.path.join(application_path, 'honeycomb_paper_simple.png')
-                    elif door_type in [self.electric_lock_label, self.box_lock_label]:
-                        if concealed_length > 0:
-                            image_path = os.path.join(application_path, 'honeycomb_paper_kunci_elektrik_menkongqi.png')
-                        else:
-                            image_path = os.path.join(application_path, 'honeycomb_paper_kunci_elektrik.png')
-            
-                elif structure_type == self.yipaiyikong_label:
-                    if door_type == self.simple_label:
-                        image_path = os.path.join(application_path, 'yipaiyikong_simple.png')
-                    elif door_type in [self.electric_lock_label, self.box_lock_label]:
-                        if concealed_length > 0:
-                            image_path = os.path.join(application_path, 'yipaiyikong_kunci_elektrik_menkongqi.png')
-                        else:
-                            image_path = os.path.join(application_path, 'yipaiyikong_kunci_elektrik.png')
-
-                        
-            else:
-                image_path = None
-            if image_path and os.path.exists(image_path):
-                image = Image.open(image_path)
-            else:
-                raise FileNotFoundError(f"Image file not found at {image_path}")
-            
-            # Annotate the image
-            annotated_image_path = self.add_annotations(image_path, vertical_piece_length, horizontal_pieces_length, door_type, outer_wood_upper, inner_wood_upper,
-                                                        outer_wood_bottom, inner_wood_bottom,concealed_length, very_upper_horizontal_piece_length, concealed_door_closer_name, slats_count,
-                                                        category, gap_wood_lock_length, reinforce_wood, gap_length_bottom, gap_length_upper, gap_wood_lock, gap_length, mode, reinforce_concealed_wood_length)
-            
-            # Configure text tags for styling
-            self.result_text.tag_configure("blackbold", foreground="black", font=("Microsoft YaHei", 14, "bold"))
-            self.result_text.tag_configure("black", foreground="black", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("khaki", foreground="chocolate3", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("blue", foreground="medium blue", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("green", foreground="lime green", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("purple", foreground="blue violet", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("orange", foreground="orange", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("brown", foreground="saddle brown", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("red", foreground="red2", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("magenta", foreground="magenta3", font=("Microsoft YaHei", 12))
-            self.result_text.tag_configure("slategray", foreground="medium turquoise", font=("Microsoft YaHei", 12))
-            
-            self.result_text.tag_configure("normal", font=("Microsoft YaHei", 12))
-            
-            lang = self.current_language
-            # Use translated terms for checking content
-            app_title_label = translations[lang]["app_title"]
-            door_type_label = translations[lang]["door_type"]
-            electric_lock_label = translations[lang]["electric_lock"]
-            plywood_dimensions_label = translations[lang]["plywood_dimensions"]
-            xisuangai_label = translations[lang]["xisuangai"]
-            vertical_length_label = translations[lang]["length_each_piecev"]
-            outer_wood_upper_label = translations[lang]["outer_wood_upper_part"]
-            inner_wood_upper_label = translations[lang]["inner_wood_upper_part"]
-            outer_wood_bottom_label = translations[lang]["outer_wood_bottom_part"]
-            inner_wood_bottom_label = translations[lang]["inner_wood_bottom_part"]
-            horizontal_length_label = translations[lang]["length_each_pieceh"]
-            very_upper_horizontal_piece_length_label = translations[lang]["very_upper_horizontal_piece_length"]
-            slats_count_label = translations[lang]["slats_count"]
-            total_blocks = translations[lang]["total_blocks"]
-            reinforce_wood = translations[lang]["reinforce_wood"]
-            slats_length = translations[lang]["slats_length"]
-            gap_length_bottom = translations[lang]["gap_length_bottom"]
-            gap_length_upper = translations[lang]["gap_length_upper"]
-            gap_length = translations[lang]["gap_length"]
-            gap_wood_lock_length = translations[lang]["gap_wood_lock_length"]
-            total_wood_label = translations[lang]["total_wood"]
-            total_wood_length_label = translations[lang]["total_wood_length"]
-            
-        
-            # Insert the report with different styles based on content
-            lines = report.split('\n')
-            for line in lines:
-                if app_title_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "blackbold")
-                elif door_type_label in line or electric_lock_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "black")  # Apply the "title" style
-                elif plywood_dimensions_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "khaki")
-                elif xisuangai_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "khaki")
-                elif horizontal_length_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "red")
-                elif vertical_length_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "blue")
-                elif outer_wood_upper_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "green")
-                elif inner_wood_upper_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "purple")
-                elif outer_wood_bottom_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "orange")
-                elif inner_wood_bottom_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "brown")
-                elif very_upper_horizontal_piece_length_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "magenta")
-                elif slats_count_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "slategray")
-                elif reinforce_wood in line:
-                    self.result_text.insert(tk.END, line + "\n", "green")
-                elif slats_length in line:
-                    self.result_text.insert(tk.END, line + "\n", "red")
-                elif gap_length_bottom in line:
-                    self.result_text.insert(tk.END, line + "\n", "brown")
-                elif gap_length_upper in line or gap_length in line:
-                    self.result_text.insert(tk.END, line + "\n", "brown")
-                elif gap_wood_lock_length in line:
-                    self.result_text.insert(tk.END, line + "\n", "magenta")
-                elif total_wood_length_label in line or total_wood_label in line:
-                    self.result_text.insert(tk.END, line + "\n", "black")
-                else:
-                    self.result_text.insert(tk.END, line + "\n", "normal")  # Default style
-            
-            # Display in Tkinter
-            # self.result_text.delete("1.0", tk.END)
-            
-            # Create a frame within the result text area
-            result_frame = ttk.Frame(self.result_text)
-            # result_frame.pack(fill="both", expand=True)
-            # result_frame.grid_columnconfigure(0, weight=1)  # Text column
-            # result_frame.grid_columnconfigure(3, weight=3)  # Image column
-            
-            result_imageframe = ttk.Frame(self.result_image)
-            
-            # Insert the calculated text result into a Label inside the frame
-            # text_result = tk.Label(result_frame, text=report, font=("Microsoft YaHei", 12), anchor="w", justify="left")
-            # text_result.grid(row=0, column=0, sticky="nsew", padx=(10, 10), pady=(10, 10))
-            
-            # Add the annotated image inside the same frame, next to the text
-            image = Image.open(annotated_image_path)
-            image = image.resize((300, 400), Image.LANCZOS)  # Resize as needed
-            photo = ImageTk.PhotoImage(image)
-            
-            image_label = tk.Label(result_imageframe, image=photo)
-            image_label.image = photo  # Keep a reference to avoid garbage collection
-            image_label.grid(row=0, column=3, sticky="nsew", padx=(10, 10), pady=(10, 10))
-            
-            self.result_text.window_create("end", window=result_frame)
-            self.result_image.window_create("end", window=result_imageframe)
-            
-
+            spec = self.read_door_spec()
+        except ValueError as ve:
+            messagebox.showerror("Input Error", str(ve))
+            print("Input validation error:", ve)
+            return
+        # A click while a calculation is running replaces it instead of queueing behind it
+        self.calculator.submit([spec], self.catalogs, DISPLAY_SIZE)
+        self.progress_bar.config(value=0)
+        self.progress_frame.grid(row=self.progress_row, column=0, columnspan=2, padx=(0, 500), pady=(5, 0))
+        if not self.polling:
+            self.polling = True
+            self.root.after(POLL_INTERVAL, self.poll_calculation)
+
+    def cancel_calculation(self):
+        self.calculator.cancel()
+
+    def poll_calculation(self):
+        """Follow the running calculation from the Tk event loop and show its result when done."""
+        calculation = self.calculator.current
+        self.progress_bar.config(value=calculation.progress)
+        if not calculation.future.done():
+            self.root.after(POLL_INTERVAL, self.poll_calculation)
+            return
+        self.polling = False
+        self.progress_frame.grid_remove()
+        if calculation.cancelled:
+            return
+        try:
+            job, report = calculation.future.result()
+            entry = self.history.add(job, report)
+            self.history_list.insert(tk.END, self.history_title(entry))
+            # The history dropped its oldest entries once full; drop their rows too
+            excess = self.history_list.size() - len(self.history)
+            if excess > 0:
+                self.history_list.delete(0, excess - 1)
+            self.history_list.selection_clear(0, tk.END)
+            self.history_list.selection_set(tk.END)
+            self.history_list.see(tk.END)
+            self.show_result(entry)
 
         except ValueError as ve:
             messagebox.showerror("Input Error", str(ve))
@@ -1443,1942 +741,161 @@ class DoorFrameCalculator:
             )
             print("Unexpected error details:", e)
 
-    def calculate_material_requirements(self, door_type, num_doors, frame_height, right_vertical_piece_width,
-                                        left_vertical_piece_width, upper_horizontal_piece_width, lower_horizontal_piece_width,
-                                        edge_sealing, max_height, min_height, vertical_piece_width, horizontal_piece_width,
-                                        frame_width, electric_lock_name, box_lock_name, lock_length, electric_lock_height, box_lock_height, lock_direction, concealed_door_closer_name, concealed_length, 
-                                        lock_offset_bottom, lock_offset_top, gap_width, slats_width, mode, category, structure_type, lock_height, reinforce_wood, ub_wood_piece_width, concealed_wood_piece_width):
-        slats_length = 0
-        total_blocks = 0
-        slats_count = 0
-        gap_length_bottom = 0
-        gap_length_upper = 0
-        middle_length = 0
-        inner_width = 0
-        plywood_height = 0
-        gap_wood_lock_length = 200
-        gap_wood_lock = 70
-        gap_length = 0  
-        slats_width = 0
-        reinforce_concealed_wood_length = 70
-        # concealed_wood_piece_width = 100
-        
-        if concealed_door_closer_name in concealeds:
-            concealed_length = concealeds[concealed_door_closer_name]['length']
+    def schedule_preview(self, *args):
+        """Recalculate the preview PREVIEW_DELAY ms after the last edit, if live preview is on."""
+        if self.preview_after is not None:
+            self.root.after_cancel(self.preview_after)
+            self.preview_after = None
+        if self.live_preview.get():
+            self.preview_after = self.root.after(PREVIEW_DELAY, self.update_preview)
+
+    def update_preview(self):
+        """Show the form as it is now; only the values and labels that changed are redrawn."""
+        self.preview_after = None
+        try:
+            changed = self.preview.update(self.read_door_spec())
+        except (ValueError, TypeError, ArithmeticError, OSError):
+            return  # Half-typed input; keep the last preview until it calculates again
+        if not changed:
+            return
+        # No cutting plan or nesting here: they are for Calculate, not for every keystroke
+        spans = merge_spans(render_spans(build_report(self.preview.job), translations[self.current_language]))
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, *(part for span in spans for part in span))
+
+        # PIL is imported on the first diagram shown, not at startup
+        from PIL import ImageTk
+
+        # Repainted in place: copy it into the same PhotoImage; a new diagram needs a new one
+        if self.preview_photo is not None and self.preview_photo_source is self.preview.image:
+            self.preview_photo.paste(self.preview.image)
         else:
-            # Set default values if no concealed door closer is selected
-            concealed_length = 0
-      
-        if category == self.fireproof_label:
-            if mode == "UB":
-                if door_type in [self.electric_lock_label, self.box_lock_label]:    
-                    if concealed_length == 0:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2)
-                        plywood_height = max_height - lower_horizontal_piece_width - upper_horizontal_piece_width - ub_wood_piece_width
-                    else:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2)
-                        plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width - concealed_wood_piece_width - ub_wood_piece_width
-                else:
-                    inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
-                    plywood_height = max_height - upper_horizontal_piece_width - lower_horizontal_piece_width - ub_wood_piece_width
-            else:
-                if door_type in [self.electric_lock_label, self.box_lock_label]:
-                    if concealed_length == 0:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2)
-                        plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width
-                    else:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2)
-                        plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width - concealed_wood_piece_width                    
-                else:
-                    inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
-                    plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width
-            
-        elif category == self.non_fireproof_label:
-            if structure_type == self.yipaiyikong_label:
-                if door_type in [self.electric_lock_label, self.box_lock_label]:
-                    if concealed_length == 0:
-                        plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        slats_count = plywood_height // (slats_width + gap_width)
-                        total_blocks = slats_count + 4
-                    else:
-                        plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width - concealed_wood_piece_width
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        slats_count = plywood_height // (slats_width + gap_width)
-                        total_blocks = slats_count + 4
-                else:
-                    plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
-                    inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
-                    slats_length = inner_width
-                    slats_width = lower_horizontal_piece_width
-                    slats_count = plywood_height // (slats_width + gap_width)
-                    total_blocks = slats_count + 4
-            elif structure_type == self.honeycomb_board_label:
-                # gap_width = 0
-                if door_type in [self.electric_lock_label, self.box_lock_label]:
-                    if concealed_length == 0:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        # plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        gap_width = (frame_height - (slats_width * 4)) / 3
-                        slats_count = 2
-                        gap_length = math.ceil((frame_height - upper_horizontal_piece_width - lower_horizontal_piece_width - (slats_count*slats_width))/3)
-                    else:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        # plywood_height = frame_height - lower_horizontal_piece_width  - upper_horizontal_piece_width - concealed_wood_piece_width
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        gap_width = (frame_height - (slats_width * 3) - upper_horizontal_piece_width) / 3
-                        slats_count = 2
-                        gap_length = math.ceil((frame_height - (slats_count*slats_width) - upper_horizontal_piece_width - lower_horizontal_piece_width - concealed_wood_piece_width) / 3)
-                    # slats_count = frame_height // (slats_width + gap_width)
-                    # total_blocks = slats_count
-                else:
-                    slats_length = inner_width
-                    slats_width = lower_horizontal_piece_width
-                    inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
-                    middle_length = reinforce_wood + (slats_width * 2)
-                    gap_length_bottom = lock_height - (middle_length / 2) - lower_horizontal_piece_width
-                    gap_length_upper = frame_height - gap_length_bottom - middle_length - upper_horizontal_piece_width - lower_horizontal_piece_width
-                    slats_count = 2
-                    # total_blocks = slats_count
-            elif structure_type == self.honeycomb_paper_label:
-                # gap_width = 0
-                if door_type in [self.electric_lock_label, self.box_lock_label]:
-                    if concealed_length == 0:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        # plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        gap_width = (frame_height - (slats_width * 6)) / 5
-                        slats_count = 4
-                        gap_length = (frame_height - upper_horizontal_piece_width - lower_horizontal_piece_width - (slats_count*slats_width))/5
-                    else:
-                        inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
-                        # plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
-                        slats_length = inner_width
-                        slats_width = lower_horizontal_piece_width
-                        gap_width = (frame_height - (slats_width * 6) - concealed_wood_piece_width) / 5
-                        slats_count = 4
-                        gap_length = (frame_height - (slats_count*slats_width) - upper_horizontal_piece_width - lower_horizontal_piece_width - concealed_wood_piece_width) / 5
-                else:
-                    slats_length = inner_width
-                    slats_width = lower_horizontal_piece_width
-                    inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
-                    middle_length = reinforce_wood + (slats_width * 2)
-                    gap_length_bottom = (lock_height - (middle_length / 2) - lower_horizontal_piece_width - slats_width) / 2
-                    gap_length_upper = (frame_height - gap_length_bottom - middle_length - upper_horizontal_piece_width - lower_horizontal_piece_width - slats_width) / 2
-                    slats_count = 4
-        
-        # gap_width = 0
-        slats_length = inner_width
-        plywood_width = inner_width
-        vertical_piece_length = frame_height
-        horizontal_pieces_length = inner_width
-        # print("test3", plywood_height)
-        very_upper_horizontal_piece_length = horizontal_pieces_length
-
-        total_length_per_door = vertical_piece_length * 2 + horizontal_pieces_length * 2    ############# kayaknya masih salah #################
-        total_length_all_doors = total_length_per_door * num_doors
-        
-        outer_wood_bottom = inner_wood_bottom = outer_wood_upper = inner_wood_upper = None
-        if category == self.fireproof_label:
-            if mode != "UB":
-                if door_type == self.electric_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = electric_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = frame_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 75
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = electric_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 75
-                        outer_wood_bottom = frame_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length
-                    #     print(f"\nConcealed Length: {concealed_length}")
-                    # print(f"\n222Very Upper Horizontal Piece Length: {very_upper_horizontal_piece_length}")
-        
-                    # if concealed_door_closer == "no":
-                    #     concealed_wood_piece_width = 0
-                    #     very_upper_horizontal_piece_length = 0
-                        
-                elif door_type == self.box_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = box_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = frame_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 30
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = box_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 30
-                        outer_wood_bottom = frame_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length
-            
-            else:
-                if door_type == self.electric_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = electric_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = max_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 75
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = electric_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 75
-                        outer_wood_bottom = max_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length
-                
-                elif door_type == self.box_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = box_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = max_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 30
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = box_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 30
-                        outer_wood_bottom = max_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length
-                        
-                    
-        elif category == self.non_fireproof_label:
-            if structure_type in [self.yipaiyikong_label, self.honeycomb_paper_label, self.honeycomb_board_label]:
-                if door_type == self.electric_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = electric_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = frame_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 75
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = electric_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 75
-                        outer_wood_bottom = frame_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                    
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length - reinforce_concealed_wood_length
-                    
-                elif door_type == self.box_lock_label:
-                    if lock_direction == self.bottom_label:
-                        outer_wood_bottom = box_lock_height - lock_offset_bottom
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        outer_wood_upper = frame_height - (outer_wood_bottom + lock_length)
-                        inner_wood_upper = outer_wood_upper - 30
-                    elif lock_direction == self.top_label:
-                        outer_wood_upper = box_lock_height - lock_offset_top
-                        inner_wood_upper = outer_wood_upper - 30
-                        outer_wood_bottom = frame_height - (outer_wood_upper + lock_length)
-                        inner_wood_bottom = outer_wood_bottom - 30
-                        
-                    if concealed_door_closer_name in concealeds:
-                        concealed_length = concealeds[concealed_door_closer_name]['length']
-                        # concealed_wood_piece_width = 100
-                        very_upper_horizontal_piece_length -= concealed_length
-                        very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length - reinforce_concealed_wood_length
-                        
-                    # print("test4", slats_width)
-        # print("test4", gap_width)
-
-        return inner_width, slats_length, plywood_width, plywood_height, total_length_all_doors, vertical_piece_length, \
-               horizontal_pieces_length, frame_width, outer_wood_bottom, inner_wood_bottom, outer_wood_upper, inner_wood_upper,\
-               very_upper_horizontal_piece_length, gap_width, slats_width, slats_count, total_blocks, gap_wood_lock, lock_height, reinforce_wood, gap_wood_lock_length,\
-               gap_length_bottom, gap_length_upper, gap_length, reinforce_concealed_wood_length
-
-
-    def generate_report(self, door_type, num_doors, inner_width, slats_length, gap_width, slats_count, total_blocks, plywood_width, plywood_height, total_length_all_doors,
-                        vertical_piece_length, horizontal_pieces_length, right_vertical_piece_width,
-                        left_vertical_piece_width, upper_horizontal_piece_width, lower_horizontal_piece_width,
-                        edge_sealing, max_height, min_height, vertical_piece_width, horizontal_piece_width,
-                        electric_lock_name, box_lock_name, lock_length, electric_lock_height, box_lock_height, lock_direction, concealed_door_closer_name, concealed_length, outer_wood_bottom,
-                        inner_wood_bottom, outer_wood_upper, inner_wood_upper,very_upper_horizontal_piece_length, frame_width,
-                        mode, category, structure_type, reinforce_wood, gap_length_bottom, gap_length_upper, gap_length, gap_wood_lock, gap_wood_lock_length, ub_wood_piece_width, edge_sealing_type, concealed_wood_piece_width,
-                        reinforce_concealed_wood_length):
-        lang = self.current_language
-        total_right_vertical_pieces = num_doors if right_vertical_piece_width else 0
-        total_left_vertical_pieces = num_doors if left_vertical_piece_width else 0
-        
-        if category == self.fireproof_label:
-            if mode == "UB" or mode != "UB":
-                if (door_type == self.electric_lock_label or door_type == self.box_lock_label):
-                    total_left_vertical_pieces = num_doors * 4
-
-        total_horizontal_pieces = num_doors * sum(h is not None for h in [upper_horizontal_piece_width, lower_horizontal_piece_width])
-        # total_horizontal_pieces_non_fireproof = num_doors * sum(h is not None for h in [upper_horizontal_piece_width, lower_horizontal_piece_width, slats_count])
-        # print("test 3",slats_length)
-
-
-        # if category == self.fireproof_label:
-        #     if mode == "UB":
-        #         total_horizontal_pieces += num_doors
-        slats_list = [slats_length for _ in range(slats_count)]
-        
-        
-        report = f"""                       {translations[lang]["app_title"]}
-        """
-        
-        if category == self.fireproof_label:
-            if mode != "UB":
-                if door_type == self.electric_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    
-        ‣ {translations[lang]["electric_lock"]}\t: {electric_lock_name}
-        ‣ {translations[lang]["electric_lock_height"]}\t: {electric_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-        """
-                    report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width} mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {vertical_piece_length*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil((vertical_piece_length*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_upper_part"]}\t: {inner_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_bottom_part"]}\t: {inner_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, inner_wood_upper, outer_wood_bottom, inner_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                    
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-          
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                    """
-                              
-                    report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                elif door_type == self.box_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    
-        ‣ {translations[lang]["box_lock"]}\t: {box_lock_name}
-        ‣ {translations[lang]["box_lock_height"]}\t: {box_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-        """
-                    report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width} mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["total_wood_length"]}\t: {vertical_piece_length*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil((vertical_piece_length*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_upper_part"]}\t: {inner_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_bottom_part"]}\t: {inner_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, inner_wood_upper, outer_wood_bottom, inner_wood_bottom])}
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                    
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-          
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                    """
-                    report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                    
-                else:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    """
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                        """
-                    if horizontal_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-        ‣ {translations[lang]["total_wood_length"]}\t: {total_length_all_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil((total_length_all_doors)/2400)}
-                            """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-        ‣ {translations[lang]["total_wood_length"]}\t: {total_length_all_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil((total_length_all_doors)/2400)}
-                            """
-                            
-            else:
-                if door_type == self.electric_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    
-        ‣ {translations[lang]["electric_lock"]}\t: {electric_lock_name}
-        ‣ {translations[lang]["electric_lock_height"]}\t: {electric_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width} mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {vertical_piece_length*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil((vertical_piece_length*num_doors)/2400)}
-        
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_upper_part"]}\t: {inner_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_bottom_part"]}\t: {inner_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, inner_wood_upper, outer_wood_bottom, inner_wood_bottom])}
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                    
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-          
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-                    """
-                              
-                    report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                elif door_type == self.box_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    
-        ‣ {translations[lang]["box_lock"]}\t: {box_lock_name}
-        ‣ {translations[lang]["box_lock_height"]}\t: {box_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width} mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}\
-          • {translations[lang]["total_wood_length"]}\t: {vertical_piece_length*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil((vertical_piece_length*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_upper_part"]}\t: {inner_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["inner_wood_bottom_part"]}\t: {inner_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, inner_wood_upper, outer_wood_bottom, inner_wood_bottom])}
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + inner_wood_upper + outer_wood_bottom + inner_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                    
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-          
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length +(horizontal_pieces_length * 2))*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + very_upper_horizontal_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                              """
-                              
-                    report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + inner_wood_bottom + outer_wood_upper + inner_wood_upper + vertical_piece_length + (horizontal_pieces_length * 2)) * num_doors) / 2400)}
-                """
-                else:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["plywood_dimensions"]}\t: {plywood_width} mm x {plywood_height} mm 
-        ‣ {translations[lang]["xisuangai"]}\t: {frame_width} mm x {vertical_piece_length} mm 
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                    """
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                        """
-                    if horizontal_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-        ‣ {translations[lang]["total_wood_length"]}\t: {total_length_all_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil((total_length_all_doors)/2400)}
-                            """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-        ‣ {translations[lang]["total_wood_length"]}\t: {total_length_all_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil((total_length_all_doors)/2400)}
-                            """
-                
-#################################### NON-FIREPROOF!! #########################################                
-        elif category == self.non_fireproof_label:
-            if structure_type == self.honeycomb_board_label:
-                if door_type == self.electric_lock_label:                    
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["electric_lock"]}\t: {electric_lock_name}
-        ‣ {translations[lang]["electric_lock_height"]}\t: {electric_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    
-                    report += f"""
-        ‣ {translations[lang]["gap_length"]}\t: {gap_length} mm
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-          """
-                                
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                  """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                      """
-                        report += f"""
-         ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-         ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                  """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                    """
-                elif door_type == self.box_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["box_lock"]}\t: {box_lock_name}
-        ‣ {translations[lang]["box_lock_height"]}\t: {box_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    
-                    report += f"""
-        ‣ {translations[lang]["gap_length"]}\t: {gap_length} mm
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-          """
-                                
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                  """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                      """
-                        report += f"""
-         ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-         ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                  """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                            """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                    """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                    """
-                else:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["reinforce_wood"]}\t: {reinforce_wood} mm
-        ‣ {translations[lang]["gap_length_bottom"]}\t: {gap_length_bottom} mm
-        ‣ {translations[lang]["gap_length_upper"]}\t: {gap_length_upper} mm
-        
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} 
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    """  
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                        """
-                    if horizontal_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-        ‣ {translations[lang]["total_wood_length"]}\t: {((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors))/2400)}
-                            """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-        ‣ {translations[lang]["total_wood_length"]}\t: {((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors))/2400)}
-                            """
-                    
-            elif structure_type == self.honeycomb_paper_label:
-                if door_type == self.electric_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["electric_lock"]}\t: {electric_lock_name}
-        ‣ {translations[lang]["electric_lock_height"]}\t: {electric_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    
-                    report += f"""
-        ‣ {translations[lang]["gap_length"]}\t: {gap_length} mm
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-          """
-                                
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                  """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                      """
-                        report += f"""
-         ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-         ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                  """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                                """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                    """
-                elif door_type == self.box_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["box_lock"]}\t: {box_lock_name}
-        ‣ {translations[lang]["box_lock_height"]}\t: {box_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-                    """
-                    
-                    report += f"""
-        ‣ {translations[lang]["gap_length"]}\t: {gap_length} mm
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-          """
-                    
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                  """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([inner_width, inner_width]))*num_doors}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-                      """
-                        report += f"""
-         ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-         ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                   """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                                """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                        """
-                    
-                else:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["reinforce_wood"]}\t: {reinforce_wood} mm
-        ‣ {translations[lang]["gap_length_bottom"]}\t: {gap_length_bottom} mm
-        ‣ {translations[lang]["gap_length_upper"]}\t: {gap_length_upper} mm
-        
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} 
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-                    """  
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                        """
-                    if horizontal_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                            """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-        ‣ {translations[lang]["total_wood_length"]}\t: {((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors))/2400)}
-                            """
-                    
-            elif structure_type == self.yipaiyikong_label:
-                if door_type == self.electric_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["electric_lock"]}\t: {electric_lock_name}
-        ‣ {translations[lang]["electric_lock_height"]}\t: {electric_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-        
-        ‣ {translations[lang]["gap_width"]}\t: {gap_width}
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-        ‣ {translations[lang]["yipaiyikong_note"]}
-        
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-                    """
-                    
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                  """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                      """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                  """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                                """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                    """
-                elif door_type == self.box_lock_label:
-                    report += f"""
-        ‣ {translations[lang]["structure_type"]}\t: {structure_type}
-
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-        
-        ‣ {translations[lang]["box_lock"]}\t: {box_lock_name}
-        ‣ {translations[lang]["box_lock_height"]}\t: {box_lock_height} mm
-        ‣ {translations[lang]["direction"]}\t: {lock_direction.capitalize()}
-        
-        ‣ {translations[lang]["gap_width"]}\t: {gap_width}
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-        ‣ {translations[lang]["yipaiyikong_note"]}
-        
-        ‣ {translations[lang]["gap_wood_lock"]} ({gap_wood_lock} mm):
-          • {translations[lang]["gap_wood_lock_length"]}\t: {gap_wood_lock_length} mm
-          • {translations[lang]["total_wood"]}\t: 4
-                    """
-                    
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-              """
-                    report += f"""
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width} mm):
-          • {translations[lang]["outer_wood_upper_part"]}\t: {outer_wood_upper} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["outer_wood_bottom_part"]}\t: {outer_wood_bottom} mm
-          • {translations[lang]["how_many"]}\t: {num_doors}
-          • {translations[lang]["total_num_pieces"]}\t: {(len([outer_wood_upper, outer_wood_bottom])) * total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([outer_wood_upper, outer_wood_bottom])}
-          • {translations[lang]["total_wood_length"]}\t: {(outer_wood_upper + outer_wood_bottom)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_upper + outer_wood_bottom)*num_doors)/2400)}
-                    """
-                    if concealed_door_closer_name in concealeds and concealed_wood_piece_width > 0:
-                        report += """
-                        """
-                        # Define dynamic widths
-                        unique_horizontal_widths = {
-                            concealed_wood_piece_width: {"length": very_upper_horizontal_piece_length},
-                            upper_horizontal_piece_width: {"length": horizontal_pieces_length},
-                        }
-                        
-                        # Add concealed wood width dynamically if concealed door closer is selected
-                        if concealed_door_closer_name in concealeds and concealed_wood_piece_width:
-                            unique_horizontal_widths[concealed_wood_piece_width] = {"length": very_upper_horizontal_piece_length}
-                        
-                        # Ensure only valid widths are kept (remove empty or None widths)
-                        unique_horizontal_widths = {width: data for width, data in unique_horizontal_widths.items() if width}
-                        
-                        # Add horizontal pieces information to the report
-                        for width, data in unique_horizontal_widths.items():
-                            report += f"""    
-        ‣ {translations[lang]["horizontal_pieces"]} ({width} mm)"""
-                        
-                            if concealed_door_closer_name in concealeds and width == concealed_wood_piece_width:
-                                report += f"""
-          • {translations[lang]["very_upper_horizontal_piece_length"]}\t: {very_upper_horizontal_piece_length} mm
-          • {translations[lang]["concealed_door_closer"]}\t: {concealed_door_closer_name}
-          • {translations[lang]["reinforce_concealed_wood_length"]}\t: {reinforce_concealed_wood_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {(len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([very_upper_horizontal_piece_length, reinforce_concealed_wood_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((very_upper_horizontal_piece_length + reinforce_concealed_wood_length)*num_doors)/2400)}
-        """
-                            else:
-                                report += f"""
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                      """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) + very_upper_horizontal_piece_length + (gap_wood_lock_length*4) +(horizontal_pieces_length * 2) +(slats_length *slats_count) + reinforce_concealed_wood_length) *num_doors)/2400)}
-                  """
-                    else:
-                        if horizontal_piece_width:
-                            report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-                                """
-                        else:
-                            report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-                        """
-                        report += f"""
-        ‣ {translations[lang]["total_wood_length"]}\t: {(outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors:.2f} mm 
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((outer_wood_bottom + outer_wood_upper + (vertical_piece_length*2) +(horizontal_pieces_length * 2) + (gap_wood_lock_length*4) +(slats_length *slats_count)) *num_doors)/2400)}
-                    """
-                else:
-                    report += f"""
-        ‣ {translations[lang]["door_type"]}\t: {door_type.upper()}
-        ‣ {translations[lang]["num_doors"]}\t: {num_doors}
-        ‣ {translations[lang]["edge_sealing"]}\t: {edge_sealing_type}
-                
-        ‣ {translations[lang]["gap_width"]}\t: {gap_width}
-        ‣ {translations[lang]["slats_length"]}\t: {slats_length} mm 
-          • {translations[lang]["total_num_pieces"]}\t: {slats_count * num_doors}
-          • {translations[lang]["slats_count"]}\t: {slats_count} pcs
-          • {translations[lang]["total_wood_length"]}\t: {(slats_length * slats_count)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((slats_length * slats_count)*num_doors)/2400)}
-        ‣ {translations[lang]["yipaiyikong_note"]}
-
-                    """
-                    if vertical_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["vertical_pieces"]} ({vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {len([vertical_piece_length, vertical_piece_length]) * num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length, vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length + vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length + vertical_piece_length)*num_doors)/2400)}
-                        """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["right_vertical_pieces"]} ({right_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_right_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-
-        ‣ {translations[lang]["left_vertical_pieces"]} ({left_vertical_piece_width}mm):
-          • {translations[lang]["length_each_piecev"]}\t: {vertical_piece_length} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_left_vertical_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([vertical_piece_length])}
-          • {translations[lang]["total_wood_length"]}\t: {(vertical_piece_length)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((vertical_piece_length)*num_doors)/2400)}
-                        """
-                    if horizontal_piece_width:
-                        report += f"""
-        ‣ {translations[lang]["horizontal_pieces"]} ({horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {total_horizontal_pieces}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width, inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width + inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width + inner_width)*num_doors)/2400)}
-        
-        ‣ {translations[lang]["total_wood_length"]}\t: {((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors))/2400)}
-                            """
-                    else:
-                        report += f"""
-        ‣ {translations[lang]["upper_horizontal_pieces"]} ({upper_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-
-        ‣ {translations[lang]["lower_horizontal_pieces"]} ({lower_horizontal_piece_width}mm):
-          • {translations[lang]["length_each_pieceh"]}\t: {inner_width} mm
-          • {translations[lang]["total_num_pieces"]}\t: {num_doors}
-          • {translations[lang]["num_pieces_per_door"]}\t: {len([inner_width])}
-          • {translations[lang]["total_wood_length"]}\t: {(inner_width)*num_doors:.2f} mm
-          • {translations[lang]["total_wood"]}\t: {math.ceil(((inner_width)*num_doors)/2400)}
-          
-        ‣ {translations[lang]["total_wood_length"]}\t: {((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors:.2f} mm
-        ‣ {translations[lang]["total_wood"]}\t: {math.ceil(((((inner_width * 2) + (slats_length * slats_count) + (vertical_piece_length * 2))*num_doors))/2400)}
-                            """
-
-        # if door_type == self.ub_label:
-        #     report += f"""
-        #     {translations[lang]["ub_note"]}
-        #     """
-            
+            self.preview_photo = ImageTk.PhotoImage(self.preview.image)
+            self.preview_photo_source = self.preview.image
+        self.diagram_label.config(image=self.preview_photo)
+        self.diagram_label.image = self.preview_photo
+
+    def import_catalog(self):
+        def run_import():
+            labels = {translations[self.current_language][key]: kind for kind, key in CATALOG_LABELS.items()}
+            kind = labels.get(kind_var.get())
+            if kind is None:
+                return
+            path = filedialog.askopenfilename(
+                parent=import_window, filetypes=[("CSV / Excel", " ".join(f"*{ext}" for ext in DATASHEET_EXTENSIONS))])
+            if not path:
+                return
+            try:
+                result = import_datasheet(path, kind)
+            except (ValueError, OSError, ImportError, sqlite3.Error) as e:
+                messagebox.showerror("Error", str(e), parent=import_window)
+                return
+            import_window.destroy()
+            if result.imported:
+                self.apply_reload(Reload({kind: catalog_store().load(kind)}, None))
+            summary = translations[self.current_language]["import_summary"].format(
+                added=len(result.added), updated=len(result.updated), unchanged=result.unchanged,
+                problems=len(result.problems))
+            # The first problems are enough to fix the sheet; the command line lists them all
+            details = "\n".join(str(problem) for problem in result.problems[:15])
+            messagebox.showinfo(translations[self.current_language]["import_catalog"],
+                                f"{summary}\n\n{details}" if details else summary)
+
+        import_window = tk.Toplevel(self.root)
+        import_window.title(translations[self.current_language]["import_catalog"])
+
+        kind_var = tk.StringVar(value=translations[self.current_language][CATALOG_LABELS["electric_locks"]])
+        kind_menu = ttk.Combobox(import_window, textvariable=kind_var, state="readonly", font=("Microsoft YaHei", 13))
+        kind_menu['values'] = [translations[self.current_language][key] for key in CATALOG_LABELS.values()]
+        kind_menu.grid(row=0, column=0, sticky=tk.W)
+
+        import_button = ttk.Button(import_window, text=translations[self.current_language]["import_catalog"], command=run_import)
+        import_button.grid(row=1, column=0, columnspan=2)
+
+    def update_catalog_choices(self, kind):
+        """Index a catalog for type-ahead and list all of it in its combobox."""
+        field = CATALOG_FIELDS[kind]
+        if field not in self.entries:
+            return  # Indexed when build_field creates the combobox
+        names = list(getattr(self.catalogs, kind).keys())
+        self.search_indexes[field] = CatalogIndex(names)
+        self.entries[field][1]['values'] = names
+
+    def filter_choices(self, field, event):
+        """List the models matching what has been typed, best first; Down opens the list."""
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        combobox = self.entries[field][1]
+        combobox['values'] = self.search_indexes[field].search(combobox.get())
+
+    def apply_reloads(self):
+        for reload in self.watcher.pending():
+            self.apply_reload(reload)
+        self.root.after(RELOAD_INTERVAL, self.apply_reloads)
+
+    def apply_reload(self, reload):
+        """Swap in catalogs and translations changed by another station."""
+        global electric_locks, box_locks, concealeds, translations
+        if reload.catalogs:
+            electric_locks = reload.catalogs.get("electric_locks", electric_locks)
+            box_locks = reload.catalogs.get("box_locks", box_locks)
+            concealeds = reload.catalogs.get("concealeds", concealeds)
+            # A new object rather than edits: a calculation already running keeps the catalogs it started with
+            self.catalogs = Catalogs(electric_locks, box_locks, concealeds)
+            self.preview.set_catalogs(self.catalogs)
+            for kind in reload.catalogs:
+                self.update_catalog_choices(kind)
+            self.schedule_preview()
+        if reload.translations is not None and self.current_language in reload.translations:
+            # Selected options are shown translated; keep their keys across the new texts
+            selected = {key: self.option_keys.get(self.field_text(key).lower()) for key in OPTION_FIELDS}
+            translations = reload.translations
+            self.change_language(self.current_language)
+            for key, option in selected.items():
+                if option is not None:
+                    self.entries[key][1].set(translations[self.current_language][option])
+
+    def history_title(self, entry):
+        spec = entry.spec
+        door_type = translations[self.current_language].get(spec.door_type, spec.door_type)
+        return f"{entry.number}. {door_type}  {spec.frame_width:g} x {spec.frame_height:g} mm  x {spec.num_doors}"
+
+    def show_result(self, entry):
+        """Show one history entry: its report in result_text and its diagram in the shared image label."""
+        spans = merge_spans(render_spans(entry.report, translations[self.current_language]))
         self.result_text.delete("1.0", tk.END)
-        self.result_image.delete("1.0", tk.END)
+        # The whole report in one insert, each line with the tag of its style
+        self.result_text.insert(tk.END, *(part for span in spans for part in span))
+
+        from PIL import ImageTk
 
-       
-        return report
+        # Annotated diagram at display size, cached for repeated specs
+        photo = ImageTk.PhotoImage(display_image(entry.result, DISPLAY_SIZE))
+        self.diagram_label.config(image=photo)
+        self.diagram_label.image = photo  # Keep a reference to avoid garbage collection
+
+    def show_history_entry(self, event=None):
+        selection = self.history_list.curselection()
+        if selection:
+            self.show_result(self.history[selection[0]])
 
     def add_electric_lock(self):
         def save_new_lock():
-            name = new_lock_name_entry.get().strip()
-            length = int(new_lock_length_entry.get().strip())
-            offset_bottom = int(new_lock_offset_bottom_entry.get().strip())
-            offset_top = int(new_lock_offset_top_entry.get().strip())
-            if name:
-                electric_locks[name] = {
-                    "length": length,
-                    "offset_bottom": offset_bottom,
-                    "offset_top": offset_top
-                }
-                save_electric_locks(electric_locks)
-                lock_window.destroy()
-                self.entries["electric_lock_name"][1]['values'] = list(electric_locks.keys())
-            else:
-                messagebox.showerror("Error", "Electric lock data cannot be empty.")
+            # Checked like datasheet rows: whole mm and offset_bottom + offset_top == length
+            try:
+                name, dimensions, _ = check_model("electric_locks", {
+                    "name": new_lock_name_entry.get(),
+                    "length": new_lock_length_entry.get(),
+                    "offset_bottom": new_lock_offset_bottom_entry.get(),
+                    "offset_top": new_lock_offset_top_entry.get(),
+                })
+            except ValueError as e:
+                messagebox.showerror("Error", f"Electric lock data: {e}")
+                return
+            catalog_store().upsert("electric_locks", name, dimensions)
+            lock_window.destroy()
+            # A new dict, swapped in like a reload: a running calculation keeps the catalogs it started with
+            self.apply_reload(Reload({"electric_locks": {**electric_locks, name: dimensions}}, None))
 
         lock_window = tk.Toplevel(self.root)
         lock_window.title(translations[self.current_language]["add_electric_lock"])
@@ -3403,10 +920,9 @@ class DoorFrameCalculator:
         def delete_lock():
             name = lock_to_remove_var.get().strip()
             if name in electric_locks:
-                del electric_locks[name]
-                save_electric_locks(electric_locks)
+                catalog_store().delete("electric_locks", name)
                 remove_window.destroy()
-                self.entries["electric_lock_name"][1]['values'] = list(electric_locks.keys())
+                self.apply_reload(Reload({"electric_locks": {key: value for key, value in electric_locks.items() if key != name}}, None))
             else:
                 messagebox.showerror("Error", "Electric lock not found.")
 
@@ -3426,21 +942,21 @@ class DoorFrameCalculator:
         
     def add_box_lock(self):
         def save_new_lock():
-            name = new_lock_name_entry.get().strip()
-            length = int(new_lock_length_entry.get().strip())
-            offset_bottom = int(new_lock_offset_bottom_entry.get().strip())
-            offset_top = int(new_lock_offset_top_entry.get().strip())
-            if name:
-                box_locks[name] = {
-                    "length": length,
-                    "offset_bottom": offset_bottom,
-                    "offset_top": offset_top
-                }
-                save_box_locks(box_locks)
-                lock_window.destroy()
-                self.entries["box_lock_name"][1]['values'] = list(box_locks.keys())
-            else:
-                messagebox.showerror("Error", "box lock data cannot be empty.")
+            # Checked like datasheet rows: whole mm and offset_bottom + offset_top == length
+            try:
+                name, dimensions, _ = check_model("box_locks", {
+                    "name": new_lock_name_entry.get(),
+                    "length": new_lock_length_entry.get(),
+                    "offset_bottom": new_lock_offset_bottom_entry.get(),
+                    "offset_top": new_lock_offset_top_entry.get(),
+                })
+            except ValueError as e:
+                messagebox.showerror("Error", f"box lock data: {e}")
+                return
+            catalog_store().upsert("box_locks", name, dimensions)
+            lock_window.destroy()
+            # A new dict, swapped in like a reload: a running calculation keeps the catalogs it started with
+            self.apply_reload(Reload({"box_locks": {**box_locks, name: dimensions}}, None))
 
         lock_window = tk.Toplevel(self.root)
         lock_window.title(translations[self.current_language]["add_box_lock"])
@@ -3465,10 +981,9 @@ class DoorFrameCalculator:
         def delete_lock():
             name = lock_to_remove_var.get().strip()
             if name in box_locks:
-                del box_locks[name]
-                save_box_locks(box_locks)
+                catalog_store().delete("box_locks", name)
                 remove_window.destroy()
-                self.entries["box_lock_name"][1]['values'] = list(box_locks.keys())
+                self.apply_reload(Reload({"box_locks": {key: value for key, value in box_locks.items() if key != name}}, None))
             else:
                 messagebox.showerror("Error", "box lock not found.")
 
@@ -3488,17 +1003,18 @@ class DoorFrameCalculator:
         
     def add_concealed(self):
         def save_new_concealed():
-            name = new_concealed_name_entry.get().strip()
-            length = int(new_concealed_length_entry.get().strip())
-            if name:
-                concealeds[name] = {
-                    "length": length,
-                }
-                save_concealed_door(concealeds)
-                concealed_window.destroy()
-                self.entries["concealed_door_closer_name"][1]['values'] = list(concealeds.keys())
-            else:
-                messagebox.showerror("Error", "Concealed door closer data cannot be empty.")
+            try:
+                name, dimensions, _ = check_model("concealeds", {
+                    "name": new_concealed_name_entry.get(),
+                    "length": new_concealed_length_entry.get(),
+                })
+            except ValueError as e:
+                messagebox.showerror("Error", f"Concealed door closer data: {e}")
+                return
+            catalog_store().upsert("concealeds", name, dimensions)
+            concealed_window.destroy()
+            # A new dict, swapped in like a reload: a running calculation keeps the catalogs it started with
+            self.apply_reload(Reload({"concealeds": {**concealeds, name: dimensions}}, None))
 
         concealed_window = tk.Toplevel(self.root)
         concealed_window.title(translations[self.current_language]["add_concealed"])
@@ -3517,10 +1033,9 @@ class DoorFrameCalculator:
         def delete_concealed():
             name = concealed_to_remove_var.get().strip()
             if name in concealeds:
-                del concealeds[name]
-                save_concealed_door(concealeds)
+                catalog_store().delete("concealeds", name)
                 remove_window.destroy()
-                self.entries["concealed_door_closer_name"][1]['values'] = list(concealeds.keys())
+                self.apply_reload(Reload({"concealeds": {key: value for key, value in concealeds.items() if key != name}}, None))
             else:
                 messagebox.showerror("Error", "Concealed Door Closer not found.")
 
@@ -3552,6 +1067,7 @@ class DoorFrameCalculator:
      
         # Load the image based on the current language
         image_path = self.guidance_images_simple.get(self.current_language, self.guidance_images_simple["en"])
+        from PIL import Image, ImageTk
         original_image = Image.open(image_path)
         photo = ImageTk.PhotoImage(original_image)
      
@@ -3583,6 +1099,7 @@ class DoorFrameCalculator:
         
         # Load the image based on the current language
         image_path = self.guidance_images_ub.get(self.current_language, self.guidance_images_ub["en"])
+        from PIL import Image, ImageTk
         original_image = Image.open(image_path)
         photo = ImageTk.PhotoImage(original_image)
         
@@ -3612,6 +1129,7 @@ class DoorFrameCalculator:
         
         # Load the image based on the current language
         image_path = self.guidance_images_electric.get(self.current_language, self.guidance_images_electric["en"])
+        from PIL import Image, ImageTk
         original_image = Image.open(image_path)
         photo = ImageTk.PhotoImage(original_image)
         
@@ -3641,6 +1159,7 @@ class DoorFrameCalculator:
         
         # Load the image based on the current language
         image_path = self.guidance_images_box.get(self.current_language, self.guidance_images_box["en"])
+        from PIL import Image, ImageTk
         original_image = Image.open(image_path)
         photo = ImageTk.PhotoImage(original_image)
         
@@ -3737,6 +1256,7 @@ class DoorFrameCalculator:
     
     def display_image(self, canvas):
         """Display image with the current display size."""
+        from PIL import ImageTk
         # Resize the image and convert it to PhotoImage
         resized_image = self.original_image.resize(self.image_display_size)
         self.photo = ImageTk.PhotoImage(resized_image)
@@ -3833,10 +1353,10 @@ class DoorFrameCalculator:
     
         # Determine the current mode and door type
         mode = self.mode_selection.get()
-        door_type = self.entries["door_type"][1].get().strip().lower()
-        category = self.entries["category"][1].get().strip().lower()
-        structure_type = self.entries["structure_type"][1].get().strip().lower()
-        concealed_door_closer_name = self.entries["concealed_door_closer_name"][1].get().strip()
+        door_type = self.selected_option("door_type")
+        category = self.selected_option("category")
+        structure_type = self.selected_option("structure_type")
+        concealed_door_closer_name = self.field_text("concealed_door_closer_name")
 
     
         if concealed_door_closer_name in concealeds:
@@ -3846,34 +1366,34 @@ class DoorFrameCalculator:
             concealed_length = 0
             
         # Map context to required fields
-        if mode == "UB" and door_type == self.simple_label:
+        if mode == MODE_UB and door_type == SIMPLE:
             context = "UB_simple"
-        elif mode == "UB" and door_type == self.electric_lock_label:
+        elif mode == MODE_UB and door_type == ELECTRIC_LOCK:
             if concealed_length == 0:
                 context = "UB_electric"
             else:
                 context = "UB_electric_concealed"
-        elif mode == "UB" and door_type == self.box_lock_label:
+        elif mode == MODE_UB and door_type == BOX_LOCK:
             if concealed_length == 0:
                 context = "UB_box"
             else:
                 context = "UB_box_concealed"
-        elif mode != "UB" and door_type == self.simple_label:
+        elif mode != MODE_UB and door_type == SIMPLE:
             context = "non_UB_simple"
-        elif mode != "UB" and door_type == self.electric_lock_label:
+        elif mode != MODE_UB and door_type == ELECTRIC_LOCK:
             if concealed_length == 0:
                 context = "non_UB_electric"
             else:
                 context = "non_UB_electric_concealed"
-        elif mode != "UB"and door_type == self.box_lock_label:
+        elif mode != MODE_UB and door_type == BOX_LOCK:
             if concealed_length ==0:
                 context = "non_UB_box"
             else:
                 context = "non_UB_box_concealed"
-        elif category == self.fireproof_label and structure_type in [self.honeycomb_board_label, self.honeycomb_paper_label]:
-            if door_type == self.simple_label:
+        elif category == FIREPROOF and structure_type in [HONEYCOMB_BOARD, HONEYCOMB_PAPER]:
+            if door_type == SIMPLE:
                 context = "non_fireproof_simple"
-            elif door_type == self.electric_lock_label:
+            elif door_type == ELECTRIC_LOCK:
                 if concealed_length == 0:
                     context = "non_fireproof_electric"
                 else:
@@ -3883,10 +1403,10 @@ class DoorFrameCalculator:
                     context = "non_fireproof_box"
                 else:
                     context = "non_fireproof_box_concealed"
-        elif category == self.non_fireproof_label and structure_type == self.yipaiyikong_label:
-            if door_type == self.simple_label:
+        elif category == NON_FIREPROOF and structure_type == YIPAIYIKONG:
+            if door_type == SIMPLE:
                 context = "non_fireproof_simple_yipaiyikong"
-            elif door_type == self.electric_lock_label:
+            elif door_type == ELECTRIC_LOCK:
                 if concealed_length == 0:
                     context = "non_fireproof_electric_yipaiyikong"
                 else:
@@ -3921,16 +1441,16 @@ class DoorFrameCalculator:
                         f"Harus memilih salah satu opsi untuk {translations[self.current_language][dropdown]}"
                     )
     
-        if door_type == self.electric_lock_label:
-            electric_lock_name = self.entries["electric_lock_name"][1].get().strip()
+        if door_type == ELECTRIC_LOCK:
+            electric_lock_name = self.field_text("electric_lock_name")
             if electric_lock_name not in electric_locks:
                 raise ValueError(
                     f"{translations[self.current_language]['electric_lock_name']} 必須選擇有效的電鎖名稱。\n"
                     f"Harus memilih nama kunci listrik yang valid untuk {translations[self.current_language]['electric_lock_name']}"
                     )
                 
-        if door_type == self.box_lock_label:
-            box_lock_name = self.entries["box_lock_name"][1].get().strip()
+        if door_type == BOX_LOCK:
+            box_lock_name = self.field_text("box_lock_name")
             if box_lock_name not in box_locks:
                 raise ValueError(
                     f"{translations[self.current_language]['electric_lock_name']} 必須選擇有效的電鎖名稱。\n"
@@ -3938,9 +1458,34 @@ class DoorFrameCalculator:
                     )
 
    
+def check_startup(root, report=None):
+    """Time the first paint and report slow phases on stderr; with ``report``, write the profile there and quit."""
+    root.update_idletasks()  # Finish drawing before the clock stops
+    startup.since("first_paint", _started)
+    for name, seconds, budget in startup.over_budget(startup.PHASES):
+        print(f"Startup phase {name} took {seconds:.2f} s, over its {budget:g} s budget", file=sys.stderr)
+    if report is not None:
+        # A fresh interpreter imports the GUI again under -X importtime; a packaged app has none
+        imports = []
+        if not getattr(sys, 'frozen', False):
+            try:
+                imports = startup.profile_imports()[0]
+            except RuntimeError as e:
+                print(e, file=sys.stderr)
+        startup.write_report(report, startup.report(startup.PHASES, imports))
+        root.destroy()
+
+
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Door Frame Material Calculator")
+    parser.add_argument("--profile-startup", nargs="?", const="startup-profile.json", metavar="FILE",
+                        help="time the startup phases, write them as JSON to FILE (default: %(const)s) and quit")
+    args = parser.parse_args()
     root = tk.Tk()
-    app = DoorFrameCalculator(root)
-    app.update_language()  # Initialize with the correct language
+    with startup.phase("widget_build"):
+        app = DoorFrameCalculator(root)
+        app.update_language()  # Initialize with the correct language
+    # Runs once the window has been drawn
+    root.after_idle(check_startup, root, args.profile_startup)
     root.mainloop()
-    
\ No newline at end of file
@@ -5,7 +5,7 @@ a = Analysis(
     ['Appmajor.py'],
     pathex=[],
     binaries=[],
-    datas=[('electric_locks.json', '.'), ('box_locks.json', '.'), ('translations.json', '.'), ('concealeds.json', '.'), ('*.png', '.')],
+    datas=[('electric_locks.json', '.'), ('box_locks.json', '.'), ('translations.json', '.'), ('concealeds.json', '.'), ('lang/*.json', 'lang'), ('*.png', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,11 @@
+"""Door frame material calculation, usable without the Tk GUI."""
+from .batch import BatchResult, calculate_batch, read_job_sheet, run_job_sheet
+from .catalog import CatalogStore, Catalogs, load_catalogs
+from .cutting import CuttingPlan, plan_cuts
+from .engine import DoorResult, DoorSpec, Piece, calculate, cut_list, sheet_panels
+from .nesting import NestingPlan, nest_panels
+from .report import Report, build_report
+
+__all__ = ["BatchResult", "CatalogStore", "Catalogs", "CuttingPlan", "DoorResult", "DoorSpec", "NestingPlan", "Piece", "Report",
+           "build_report", "calculate", "calculate_batch", "cut_list", "load_catalogs", "nest_panels", "plan_cuts",
+           "read_job_sheet", "run_job_sheet", "sheet_panels"]
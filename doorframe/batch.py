@@ -0,0 +1,270 @@
+"""Batch order mode: compute a whole job sheet of door specs in one pass.
+
+A job sheet is a CSV (or XLSX, with openpyxl installed) file with one door
+spec per row. Column names are the DoorSpec field names plus an optional
+``quantity`` (overrides ``num_doors``) and ``mark`` (free text, e.g. the
+door number on the drawings).
+"""
+import csv
+import os
+from dataclasses import asdict, dataclass, fields
+from typing import List, Tuple
+
+from .cutting import DEFAULT_KERF, plan_cuts
+from .engine import (MODE_NORMAL, MODE_UB, STOCK_LENGTH, DoorResult, DoorSpec, Piece, calculate, cut_list,
+                     default_catalogs, sheet_panels)
+from .nesting import GRAIN, SHEET_SIZE, nest_panels
+
+_SPEC_FIELDS = {f.name: f for f in fields(DoorSpec)}
+_EXTRA_COLUMNS = ("quantity", "mark")
+# Option columns whose values are compared case-insensitively
+_LOWER_CASE_COLUMNS = ("category", "structure_type", "door_type", "lock_direction")
+_MODES = {"normal": MODE_NORMAL, "ub": MODE_UB}
+
+
+@dataclass(frozen=True)
+class JobLine:
+    """One row of the job sheet and its calculation."""
+    row: int
+    mark: str
+    spec: DoorSpec
+    result: DoorResult
+    pieces: List[Piece]
+
+
+@dataclass(frozen=True)
+class CutListEntry:
+    """All pieces of one size across the job."""
+    width: float
+    length: float
+    count: int
+    names: Tuple[str, ...]
+
+    @property
+    def total_length(self):
+        return self.length * self.count
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    lines: List[JobLine]
+    cut_list: List[CutListEntry]
+
+    @property
+    def total_doors(self):
+        return sum(line.spec.num_doors for line in self.lines)
+
+    @property
+    def total_length(self):
+        return sum(entry.total_length for entry in self.cut_list)
+
+    def cutting_plan(self, stock_length=STOCK_LENGTH, kerf=DEFAULT_KERF, exact=False, time_budget=1.0):
+        """Lay the whole job's cut list out on stock boards."""
+        return plan_cuts(((entry.width, entry.length, entry.count) for entry in self.cut_list),
+                         stock_length, kerf, exact, time_budget)
+
+    def nesting_plan(self, name="plywood_dimensions", sheet_size=SHEET_SIZE, kerf=DEFAULT_KERF, grain=True,
+                     stock_offcuts=()):
+        """Nest the job's ``name`` panels (see sheet_panels) onto sheets."""
+        panels = [(width, height, line.spec.num_doors)
+                  for line in self.lines
+                  for panel_name, width, height in sheet_panels(line.result) if panel_name == name]
+        return nest_panels(panels, sheet_size, kerf, grain, stock_offcuts)
+
+    def sheet_plans(self, sheet_size=SHEET_SIZE, kerf=DEFAULT_KERF):
+        """Nesting plans of every sheet material in the job, as (name, plan)."""
+        names = []
+        for line in self.lines:
+            for name, _, _ in sheet_panels(line.result):
+                if name not in names:
+                    names.append(name)
+        return [(name, self.nesting_plan(name, sheet_size, kerf, GRAIN.get(name, True))) for name in names]
+
+    def to_dict(self, plan=None, sheets=()):
+        """Plain data for JSON: every line, the cut list and the given plans."""
+        def line_data(line):
+            result = asdict(line.result)
+            del result["spec"]
+            return {"row": line.row, "mark": line.mark, "spec": asdict(line.spec), "result": result,
+                    "pieces": [asdict(piece) for piece in line.pieces]}
+
+        data = {
+            "lines": [line_data(line) for line in self.lines],
+            "total_doors": self.total_doors,
+            "cut_list": [dict(asdict(entry), total_length=entry.total_length) for entry in self.cut_list],
+        }
+        if plan is not None:
+            data["cutting_plan"] = {
+                "stock_length": plan.stock_length,
+                "kerf": plan.kerf,
+                "board_count": plan.board_count,
+                "boards_needed": plan.boards_needed,
+                "waste_percent": round(plan.waste_percent, 2),
+                "optimal": plan.optimal,
+                "patterns": [{"width": board.width, "count": count, "cuts": list(board.cuts)}
+                             for board, count in plan.patterns()],
+                "oversize": [list(piece) for piece in plan.oversize],
+            }
+        data["sheets"] = {
+            name: {
+                "sheet_count": sheet_plan.sheet_count,
+                "utilisation": round(sheet_plan.utilisation, 2),
+                "layouts": [{"width": sheet.width, "height": sheet.height,
+                             "placements": [asdict(p) for p in sheet.placements],
+                             "offcuts": [list(rect) for rect in sheet.offcuts]} for sheet in sheet_plan.sheets],
+                "unplaced": [list(panel) for panel in sheet_plan.unplaced],
+            } for name, sheet_plan in sheets
+        }
+        return data
+
+
+def _normalise_column(name):
+    return str(name or "").strip().lower().replace(" ", "_")
+
+
+def _parse_value(column, value):
+    text = "" if value is None else str(value).strip()
+    if column == "edge_sealing_thickness":
+        return float(text) if text else None
+    if _SPEC_FIELDS[column].type is int:
+        # Spreadsheets like to store whole numbers as 1200.0
+        return int(float(text)) if text else 0
+    if column in _LOWER_CASE_COLUMNS:
+        return text.lower()
+    if column == "mode":
+        return _MODES.get(text.lower(), text or MODE_NORMAL)
+    return text
+
+
+def _row_to_spec(record):
+    values = {}
+    for column, value in record.items():
+        if column in _SPEC_FIELDS:
+            try:
+                values[column] = _parse_value(column, value)
+            except OverflowError:
+                raise ValueError(f"{column}: {value!r} is out of range") from None
+    quantity = str(record.get("quantity") or "").strip()
+    if quantity:
+        try:
+            values["num_doors"] = int(float(quantity))
+        except OverflowError:
+            raise ValueError(f"quantity: {quantity!r} is not a number of doors") from None
+    elif "num_doors" not in values or not values["num_doors"]:
+        values["num_doors"] = 1
+    return str(record.get("mark") or "").strip(), DoorSpec(**values)
+
+
+def _read_rows(path):
+    if hasattr(path, "read"):
+        return list(csv.reader(path))
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("Reading .xlsx job sheets needs openpyxl: pip install openpyxl") from None
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = list(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+        return rows
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        return list(csv.reader(file))
+
+
+def _check_columns(columns, source):
+    unknown = [name for name in columns if name and name not in _SPEC_FIELDS and name not in _EXTRA_COLUMNS]
+    if unknown:
+        raise ValueError(f"{source}: unknown column(s): {', '.join(unknown)}")
+
+
+def read_job_sheet(path):
+    """Read a CSV/XLSX job sheet and return a list of (row, mark, DoorSpec).
+
+    ``path`` may also be an open text file holding CSV, e.g. sys.stdin.
+    Raises ValueError naming the row for unknown columns or unreadable values.
+    """
+    source = getattr(path, "name", path)
+    rows = _read_rows(path)
+    if not rows:
+        return []
+    header = [_normalise_column(name) for name in rows[0]]
+    _check_columns(header, source)
+
+    lines = []
+    for row_number, row in enumerate(rows[1:], start=2):
+        if not any(str(value or "").strip() for value in row):
+            continue  # Skip blank rows
+        record = {name: value for name, value in zip(header, row) if name}
+        try:
+            mark, spec = _row_to_spec(record)
+        except ValueError as e:
+            raise ValueError(f"{source}, row {row_number}: {e}") from None
+        lines.append((row_number, mark, spec))
+    return lines
+
+
+def read_records(records, source="job"):
+    """Like read_job_sheet, for dicts keyed by column name (e.g. parsed JSON)."""
+    lines = []
+    for number, record in enumerate(records, start=1):
+        if not isinstance(record, dict):
+            raise ValueError(f"{source}, item {number}: expected an object, got {type(record).__name__}")
+        record = {_normalise_column(name): value for name, value in record.items()}
+        _check_columns(record, source)
+        try:
+            mark, spec = _row_to_spec(record)
+        except ValueError as e:
+            raise ValueError(f"{source}, item {number}: {e}") from None
+        lines.append((number, mark, spec))
+    return lines
+
+
+def consolidate(lines):
+    """Merge the pieces of all job lines into one cut list, by width and longest first."""
+    totals = {}
+    for line in lines:
+        for piece in line.pieces:
+            key = (piece.width, piece.length)
+            count, names = totals.get(key, (0, ()))
+            if piece.name not in names:
+                names += (piece.name,)
+            totals[key] = (count + piece.count * line.spec.num_doors, names)
+    entries = [CutListEntry(width, length, count, names)
+               for (width, length), (count, names) in totals.items() if count]
+    entries.sort(key=lambda entry: (entry.width, -entry.length))
+    return entries
+
+
+def calculate_batch(job, catalogs=None, progress=None):
+    """Calculate every line of ``job`` and build the consolidated cut list.
+
+    ``job`` holds DoorSpecs or (row, mark, DoorSpec) tuples as returned by
+    read_job_sheet. The catalogs are looked up once for the whole job.
+    ``progress`` is called with the number of lines done after each line.
+    """
+    if catalogs is None:
+        catalogs = default_catalogs()
+    lines = []
+    for index, item in enumerate(job, start=1):
+        if isinstance(item, tuple):
+            row, mark, spec = item
+            try:
+                result = calculate(spec, catalogs)
+            except ValueError as e:
+                raise ValueError(f"Row {row}{f' ({mark})' if mark else ''}: {e}") from None
+        else:
+            # A bare spec has no job sheet row to point at; its errors stay the engine's own
+            row, mark, spec = index, "", item
+            result = calculate(spec, catalogs)
+        lines.append(JobLine(row, mark, spec, result, cut_list(result)))
+        if progress is not None:
+            progress(len(lines))
+    return BatchResult(lines, consolidate(lines))
+
+
+def run_job_sheet(path, catalogs=None):
+    """Read the job sheet at ``path`` and calculate it."""
+    return calculate_batch(read_job_sheet(path), catalogs)
@@ -0,0 +1,400 @@
+"""Lock and door closer catalogs.
+
+The catalogs live in an SQLite database (catalog.db next to the JSON
+files), one row per model, so adding or removing a model writes that row
+in a transaction instead of rewriting a whole file. On first use the
+database is created from electric_locks.json, box_locks.json and
+concealeds.json, which stay the import/export format (see catalog_cli).
+
+Several stations may share the folder. Database writers queue on SQLite's
+lock; JSON files are written under an advisory ``<file>.lock`` and
+renamed into place, and update_json() merges into the file as it is on
+disk rather than overwriting it.
+"""
+import copy
+import glob
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Determine the path to the JSON files
+if getattr(sys, 'frozen', False):
+    application_path = sys._MEIPASS
+else:
+    application_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOCK_FILE = os.path.join(application_path, 'electric_locks.json')
+BOXLOCK_FILE = os.path.join(application_path, 'box_locks.json')
+CONCEALED_FILE = os.path.join(application_path, 'concealeds.json')
+CATALOG_DB = os.path.join(application_path, 'catalog.db')
+
+# Catalog kind (the Catalogs attribute) -> its JSON file
+KINDS = {"electric_locks": LOCK_FILE, "box_locks": BOXLOCK_FILE, "concealeds": CONCEALED_FILE}
+# Dimensions stored per model; door closers only have a length
+DIMENSIONS = ("length", "offset_bottom", "offset_top")
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    offset_bottom INTEGER,
+    offset_top INTEGER,
+    UNIQUE (kind, name)
+);
+CREATE INDEX IF NOT EXISTS components_brand ON components (kind, brand);
+"""
+
+
+def _load_json(path):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    return {}
+
+
+@contextmanager
+def _locked(path):
+    """Hold the advisory lock of ``path`` (a ``.lock`` file beside it) for writing it."""
+    with open(path + ".lock", "a+b") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            while True:
+                try:
+                    # Blocks for up to 10 s per attempt
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _replace(source, target, attempts=50):
+    # Windows refuses to replace a file another process has open for reading; wait for it
+    for attempt in range(attempts):
+        try:
+            os.replace(source, target)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.02)
+
+
+def _write_json(path, data):
+    # Called with the lock held. A temporary file is renamed over ``path``: readers
+    # see the old file or the new one, never a truncated one, also if the writer dies
+    directory, base = os.path.split(os.path.abspath(path))
+    prefix = f".{base}-"
+    # Only the lock holder writes these, so any left over are from a writer that died
+    for leftover in glob.glob(os.path.join(glob.escape(directory), glob.escape(prefix) + "*.tmp")):
+        os.remove(leftover)
+    descriptor, temporary = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        _replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _save_json(path, data):
+    with _locked(path):
+        _write_json(path, data)
+
+
+def update_json(path, changes):
+    """Apply ``changes`` ({name: dimensions, or None to remove}) to a JSON catalog file.
+
+    The file is read again under its lock, so models that another station
+    wrote in the meantime are kept.
+    """
+    with _locked(path):
+        data = _load_json(path)
+        for name, dimensions in changes.items():
+            if dimensions is None:
+                data.pop(name, None)
+            else:
+                data[name] = dimensions
+        _write_json(path, data)
+    return data
+
+
+def changes_between(base, ours):
+    """What ``ours`` changed relative to ``base``: {name: dimensions, or None if removed}."""
+    changes = {name: dimensions for name, dimensions in ours.items() if base.get(name) != dimensions}
+    changes.update((name, None) for name in base if name not in ours)
+    return changes
+
+
+def brand_of(name):
+    """The brand of a model name: its first word, e.g. "CISA" for "CISA 52710"."""
+    words = name.split()
+    return words[0] if words else ""
+
+
+def _row_values(dimensions):
+    values = []
+    for name in DIMENSIONS:
+        value = dimensions.get(name)
+        if value is None and name == "length":
+            raise ValueError("length is required")
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{name} must be a number")
+        values.append(value)
+    return values
+
+
+class CatalogStore:
+    """The catalogs in an SQLite database.
+
+    Every call opens its own short connection, so one store can be used
+    from any thread, process or station sharing the folder. Writes are
+    single ``BEGIN IMMEDIATE`` transactions: a second writer waits for the
+    first (up to ``timeout`` seconds) instead of failing, and a crash rolls
+    the transaction back.
+    """
+
+    def __init__(self, path=CATALOG_DB, json_files=None, timeout=30):
+        self.path = path
+        self.json_files = KINDS if json_files is None else json_files
+        self.timeout = timeout
+        self._ready = False
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        if not self._ready:
+            try:
+                if connection.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                    self._create(connection)
+            except BaseException:
+                connection.close()
+                raise
+            self._ready = True
+        return connection
+
+    def _create(self, connection):
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have created it while we waited for the lock
+            if connection.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        connection.execute(statement)
+                # A new database starts from the JSON catalogs
+                for kind, path in self.json_files.items():
+                    self._insert(connection, kind, _load_json(path))
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+
+    @contextmanager
+    def _transaction(self):
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    @staticmethod
+    def _check(kind):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown catalog: {kind!r}")
+
+    @staticmethod
+    def _insert(connection, kind, data):
+        connection.executemany(
+            "INSERT INTO components (kind, name, brand, length, offset_bottom, offset_top) VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (kind, name) DO UPDATE SET brand = excluded.brand, length = excluded.length,"
+            " offset_bottom = excluded.offset_bottom, offset_top = excluded.offset_top",
+            [(kind, name.strip(), dimensions.get("brand") or brand_of(name), *_row_values(dimensions))
+             for name, dimensions in data.items()])
+
+    @staticmethod
+    def _entries(rows):
+        return {name: {key: value for key, value in zip(DIMENSIONS, values) if value is not None}
+                for name, *values in rows}
+
+    def load(self, kind):
+        """All models of ``kind`` as {name: {"length": ..., ...}}, in the order they were added."""
+        self._check(kind)
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT name, length, offset_bottom, offset_top FROM components"
+                                      " WHERE kind = ? ORDER BY id", (kind,)).fetchall()
+        return self._entries(rows)
+
+    def load_all(self):
+        """Every catalog, read in one connection."""
+        catalogs = {kind: {} for kind in KINDS}
+        with closing(self._connect()) as connection:
+            for kind, name, *values in connection.execute(
+                    "SELECT kind, name, length, offset_bottom, offset_top FROM components ORDER BY id"):
+                catalogs[kind].update(self._entries([(name, *values)]))
+        return Catalogs(**catalogs)
+
+    def find(self, kind, brand):
+        """The models of one brand, using the brand index."""
+        self._check(kind)
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT name, length, offset_bottom, offset_top FROM components"
+                                      " WHERE kind = ? AND brand = ? ORDER BY id", (kind, brand)).fetchall()
+        return self._entries(rows)
+
+    def load_brands(self, kind):
+        """{name: brand} of every model of ``kind``."""
+        self._check(kind)
+        with closing(self._connect()) as connection:
+            return dict(connection.execute("SELECT name, brand FROM components WHERE kind = ?", (kind,)))
+
+    def brands(self, kind):
+        self._check(kind)
+        with closing(self._connect()) as connection:
+            return [brand for brand, in connection.execute(
+                "SELECT DISTINCT brand FROM components WHERE kind = ? ORDER BY brand", (kind,))]
+
+    def upsert(self, kind, name, dimensions, brand=None):
+        """Add or update one model."""
+        self._check(kind)
+        if not name.strip():
+            raise ValueError("name is required")
+        data = {name: dict(dimensions, brand=brand) if brand else dimensions}
+        with self._transaction() as connection:
+            self._insert(connection, kind, data)
+
+    def delete(self, kind, name):
+        """Remove one model; returns whether it existed."""
+        self._check(kind)
+        with self._transaction() as connection:
+            return connection.execute("DELETE FROM components WHERE kind = ? AND name = ?", (kind, name)).rowcount > 0
+
+    def apply(self, kind, changes):
+        """Apply {name: dimensions, or None to remove} in one transaction.
+
+        Models not named in ``changes`` are left as they are, so changes
+        made by other stations since the caller loaded the catalog survive.
+        """
+        self._check(kind)
+        with self._transaction() as connection:
+            removed = [(kind, name) for name, dimensions in changes.items() if dimensions is None]
+            connection.executemany("DELETE FROM components WHERE kind = ? AND name = ?", removed)
+            self._insert(connection, kind, {name: dimensions for name, dimensions in changes.items()
+                                            if dimensions is not None})
+
+    def replace(self, kind, data):
+        """Make ``kind`` hold exactly ``data``, in one transaction."""
+        self._check(kind)
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM components WHERE kind = ?", (kind,))
+            self._insert(connection, kind, data)
+
+    def import_json(self, kind, path=None):
+        """Add or update the models of a JSON catalog file; returns how many were read."""
+        self._check(kind)
+        data = _load_json(path or self.json_files[kind])
+        with self._transaction() as connection:
+            self._insert(connection, kind, data)
+        return len(data)
+
+    def export_json(self, kind, path=None):
+        """Write ``kind`` as a JSON catalog file, in the format of the bundled ones.
+
+        The file is replaced atomically under its lock.
+        """
+        data = self.load(kind)
+        _save_json(path or self.json_files[kind], data)
+        return len(data)
+
+
+_store = None
+# What the load_* functions last returned, the base of the save_* merges
+_loaded = {}
+
+
+def catalog_store():
+    """The store of the application's catalog database."""
+    global _store
+    if _store is None:
+        _store = CatalogStore()
+    return _store
+
+
+def _load(kind):
+    data = catalog_store().load(kind)
+    _loaded[kind] = copy.deepcopy(data)
+    return data
+
+
+def _save(kind, data):
+    # Only what the caller changed since its load is written, so two stations
+    # saving at once merge instead of the last one dropping the other's models
+    catalog_store().apply(kind, changes_between(_loaded.get(kind, {}), data))
+    _loaded[kind] = copy.deepcopy(data)
+
+
+# Load electric lock types
+def load_electric_locks():
+    return _load("electric_locks")
+
+# Save the changes made to the electric lock types
+def save_electric_locks(electric_locks):
+    _save("electric_locks", electric_locks)
+
+# Load box lock types
+def load_box_locks():
+    return _load("box_locks")
+
+# Save the changes made to the box lock types
+def save_box_locks(box_locks):
+    _save("box_locks", box_locks)
+
+# Load concealed door closer types
+def load_concealed_door():
+    return _load("concealeds")
+
+# Save the changes made to the concealed door closer types
+def save_concealed_door(concealeds):
+    _save("concealeds", concealeds)
+
+
+@dataclass
+class Catalogs:
+    """Lock and door closer dimensions, keyed by model name."""
+    electric_locks: dict = field(default_factory=dict)
+    box_locks: dict = field(default_factory=dict)
+    concealeds: dict = field(default_factory=dict)
+
+
+def load_catalogs():
+    """Read all component catalogs from the catalog database."""
+    return catalog_store().load_all()
@@ -0,0 +1,59 @@
+"""Import and export the component catalogs from the command line.
+
+    python -m doorframe.catalog_cli export electric_locks locks.json
+    python -m doorframe.catalog_cli import electric_locks supplier.json
+    python -m doorframe.catalog_cli import electric_locks datasheet.xlsx --dry-run
+
+JSON files are read and written in the format of the bundled catalogs;
+.csv and .xlsx supplier datasheets go through doorframe.importer.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+
+from .catalog import CATALOG_DB, KINDS, CatalogStore
+from .importer import DATASHEET_EXTENSIONS, import_datasheet
+
+
+def _import_datasheet(store, args):
+    result = import_datasheet(args.file, args.kind, store, update=not args.no_update, dry_run=args.dry_run)
+    for problem in result.problems:
+        print(f"{args.file}, {problem}", file=sys.stderr)
+    verb = "would import" if args.dry_run else "imported"
+    print(f"{verb} {args.kind}: {len(result.added)} added, {len(result.updated)} updated, "
+          f"{result.unchanged} unchanged, {result.duplicates} repeated, {len(result.problems)} with problems",
+          file=sys.stderr)
+    return 1 if result.problems else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m doorframe.catalog_cli",
+                                     description="Import or export the component catalogs as JSON, "
+                                                 "or import supplier datasheets (CSV/XLSX).")
+    parser.add_argument("action", choices=("import", "export"))
+    parser.add_argument("kind", choices=sorted(KINDS))
+    parser.add_argument("file", nargs="?", help="JSON file (default: the bundled file of the catalog), "
+                                                "or a .csv/.xlsx datasheet to import")
+    parser.add_argument("--db", default=CATALOG_DB, help="catalog database (default: %(default)s)")
+    parser.add_argument("--dry-run", action="store_true", help="check a datasheet without importing it")
+    parser.add_argument("--no-update", action="store_true",
+                        help="report datasheet models already in the catalog with other values instead of updating")
+    args = parser.parse_args(argv)
+    store = CatalogStore(args.db)
+    try:
+        if args.action == "import" and os.path.splitext(args.file or "")[1].lower() in DATASHEET_EXTENSIONS:
+            return _import_datasheet(store, args)
+        if args.action == "import":
+            count = store.import_json(args.kind, args.file)
+        else:
+            count = store.export_json(args.kind, args.file)
+    except (ValueError, OverflowError, OSError, ImportError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(f"{args.action}ed {count} {args.kind}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
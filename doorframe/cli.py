@@ -0,0 +1,187 @@
+"""Command-line interface: ``python -m doorframe``.
+
+Reads door specs from options, a JSON document or a CSV job sheet (a file
+or ``-`` for stdin) and writes a text or HTML report, a CSV piece table,
+a CSV cut list or JSON to stdout. Tk is never imported; PIL only when
+``--image`` is given.
+``--drawing`` writes true-to-size SVG/PDF drawings without PIL.
+``--save-job`` keeps the job with its catalogs pinned (see snapshot), and
+``--job`` recalculates such a job exactly as it was.
+"""
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import sys
+from dataclasses import fields
+
+from .batch import calculate_batch, read_job_sheet, read_records
+from .cutting import DEFAULT_KERF
+from .engine import STOCK_LENGTH, DoorSpec
+from .nesting import SHEET_SIZE
+from .report import build_report, render_csv, render_html, render_text
+from .snapshot import load_job, pin, save_job
+from .translations import load_translations
+
+FORMATS = ("report", "html", "table", "cutlist", "json")
+_RENDERERS = {"report": render_text, "html": render_html, "table": render_csv}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m doorframe",
+        description="Calculate door frame materials without the GUI.")
+    source = parser.add_argument_group("input")
+    source.add_argument("--json", metavar="FILE", help="JSON object or list of door specs ('-' for stdin)")
+    source.add_argument("--csv", metavar="FILE", help="CSV/XLSX job sheet ('-' for stdin)")
+    source.add_argument("--job", metavar="FILE", help="job saved with --save-job, recalculated with its pinned catalogs")
+    spec = parser.add_argument_group("door spec", "Describe a single door spec instead of a file.")
+    for field in fields(DoorSpec):
+        option = "--" + field.name.replace("_", "-")
+        kind = float if field.name == "edge_sealing_thickness" else field.type
+        spec.add_argument(option, dest=field.name, type=kind, metavar=field.name.upper())
+    spec.add_argument("--quantity", type=int, help="number of doors, same as --num-doors")
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--format", choices=FORMATS, default="report")
+    output.add_argument("--lang", default="en", help="report/html/table language: en, zh or id (default: en)")
+    output.add_argument("--stock-length", type=float, default=STOCK_LENGTH, help="timber stock length in mm")
+    output.add_argument("--kerf", type=float, default=DEFAULT_KERF, help="saw kerf in mm")
+    output.add_argument("--exact", action="store_true", help="search for the fewest boards within --time-budget")
+    output.add_argument("--time-budget", type=float, default=1.0, metavar="SECONDS")
+    output.add_argument("--sheet-size", type=float, nargs=2, default=SHEET_SIZE, metavar=("WIDTH", "HEIGHT"))
+    output.add_argument("--image", metavar="PNG",
+                        help="also save the annotated diagram (needs Pillow); one file per row for batches")
+    output.add_argument("--drawing", metavar="FILE",
+                        help="also save scaled vector drawings: one PDF page per row (.pdf) or one SVG per row")
+    output.add_argument("--save-job", metavar="FILE",
+                        help="also save the job with snapshots of the catalogs used, for --job later")
+    return parser
+
+
+def _open_input(path):
+    if path == "-":
+        return sys.stdin
+    return path
+
+
+def read_job(args):
+    """Turn the parsed arguments into job lines for calculate_batch."""
+    if args.json:
+        if args.json == "-":
+            document = json.load(sys.stdin)
+        else:
+            with open(args.json, encoding="utf-8") as file:
+                document = json.load(file)
+        records = document if isinstance(document, list) else [document]
+        return read_records(records, "stdin" if args.json == "-" else args.json)
+    if args.csv:
+        return read_job_sheet(_open_input(args.csv))
+    record = {field.name: getattr(args, field.name) for field in fields(DoorSpec)
+              if getattr(args, field.name) is not None}
+    if args.quantity is not None:
+        record["quantity"] = args.quantity
+    if not record:
+        raise ValueError("no door spec given; use --json, --csv or the door spec options (see --help)")
+    return read_records([record], "options")
+
+
+def check_options(args):
+    """Raise ValueError for plan options no plan can be made with."""
+    sizes = [("--stock-length", args.stock_length)] + [("--sheet-size", size) for size in args.sheet_size]
+    for option, value in sizes:
+        if not math.isfinite(value) or value <= 0:
+            raise ValueError(f"{option} must be a positive number of mm, got {value:g}")
+    if not math.isfinite(args.kerf) or args.kerf < 0:
+        raise ValueError(f"--kerf must be a non-negative number of mm, got {args.kerf:g}")
+    if not math.isfinite(args.time_budget) or args.time_budget < 0:
+        raise ValueError(f"--time-budget must be a non-negative number of seconds, got {args.time_budget:g}")
+
+
+def _plans(job, args):
+    plan = job.cutting_plan(args.stock_length, args.kerf, args.exact, args.time_budget)
+    return plan, job.sheet_plans(tuple(args.sheet_size), args.kerf)
+
+
+def format_json(job, plan, sheets):
+    return json.dumps(job.to_dict(plan, sheets), ensure_ascii=False, indent=2)
+
+
+def format_cutlist(job):
+    rows = [["width", "length", "count", "total_length", "parts"]]
+    for entry in job.cut_list:
+        rows.append([f"{entry.width:g}", f"{entry.length:g}", entry.count, f"{entry.total_length:g}",
+                     " ".join(entry.names)])
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+def format_report(job, plan, sheets, lang="en", stock_length=STOCK_LENGTH, renderer=render_text):
+    translations = load_translations().get(lang)
+    if translations is None:
+        raise ValueError(f"Unknown language: {lang!r}")
+    return renderer(build_report(job, plan, sheets, stock_length), translations).rstrip("\n")
+
+
+def save_images(job, path):
+    """Render the diagram of every job line; returns the paths written."""
+    from .diagram import render
+
+    stem, extension = os.path.splitext(path)
+    written = []
+    for line in job.lines:
+        output_path = path if len(job.lines) == 1 else f"{stem}_{line.row}{extension or '.png'}"
+        written.append(render(line.result, output_path=output_path))
+    return written
+
+
+def save_drawings(job, path):
+    """Write the vector drawings of every job line; returns the paths written."""
+    from .drawing import door_drawing, save
+
+    stem, extension = os.path.splitext(path)
+    drawings = [door_drawing(line.result, f"#{line.row}" + (f" {line.mark}" if line.mark else ""))
+                for line in job.lines]
+    if extension.lower() == ".pdf" or len(drawings) == 1:
+        return save(drawings, path)
+    written = []
+    for line, drawing in zip(job.lines, drawings):
+        written += save([drawing], f"{stem}_{line.row}{extension or '.svg'}")
+    return written
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        check_options(args)
+        if args.job:
+            lines, catalogs = load_job(args.job)
+        else:
+            # Pinned only when the job is saved: hashing the catalogs is not free
+            lines, catalogs = read_job(args), pin() if args.save_job else None
+        job = calculate_batch(lines, catalogs)
+        if args.save_job:
+            save_job(args.save_job, job, catalogs)
+        if args.format == "cutlist":
+            output = format_cutlist(job)
+        else:
+            plan, sheets = _plans(job, args)
+            if args.format == "json":
+                output = format_json(job, plan, sheets)
+            else:
+                output = format_report(job, plan, sheets, args.lang, args.stock_length, _RENDERERS[args.format])
+        if args.image:
+            for path in save_images(job, args.image):
+                print(path, file=sys.stderr)
+        if args.drawing:
+            for path in save_drawings(job, args.drawing):
+                print(path, file=sys.stderr)
+    except (ValueError, OSError, ImportError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(output)
+    return 0
@@ -0,0 +1,311 @@
+"""1D cutting-stock optimizer for the timber pieces of a cut list.
+
+Pieces are packed onto standard stock boards, one timber width at a time.
+First-fit-decreasing is the default; ``exact=True`` then runs a
+branch-and-bound search for fewer boards until the time budget runs out.
+"""
+import bisect
+import math
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .engine import STOCK_LENGTH
+
+# Saw blade kerf lost with every cut (mm)
+DEFAULT_KERF = 3
+# Tolerance for float piece lengths
+_EPS = 1e-6
+# Search nodes between two looks at the clock; a node can cost a pass over every open board
+_CLOCK_NODES = 64
+
+
+@dataclass(frozen=True)
+class Board:
+    """One stock board and the piece lengths cut from it."""
+    width: float
+    stock_length: float
+    kerf: float
+    cuts: Tuple[float, ...]
+
+    @property
+    def used_length(self):
+        return sum(self.cuts) + self.kerf * (len(self.cuts) - 1)
+
+    @property
+    def offcut(self):
+        return self.stock_length - self.used_length
+
+
+@dataclass(frozen=True)
+class CuttingPlan:
+    stock_length: float
+    kerf: float
+    boards: List[Board]
+    # (width, length, count) of pieces longer than the stock
+    oversize: List[Tuple[float, float, int]]
+    # True when no plan with fewer boards exists
+    optimal: bool
+
+    @property
+    def board_count(self):
+        return len(self.boards)
+
+    @property
+    def boards_needed(self):
+        """Stock boards plus one longer board for every oversize piece."""
+        return len(self.boards) + sum(count for _, _, count in self.oversize)
+
+    @property
+    def waste_percent(self):
+        stock = self.stock_length * len(self.boards)
+        if not stock:
+            return 0.0
+        return (stock - sum(sum(board.cuts) for board in self.boards)) / stock * 100
+
+    def patterns(self):
+        """Identical boards merged: a list of (board, how many), widest first."""
+        counts = {}
+        for board in self.boards:
+            counts[board] = counts.get(board, 0) + 1
+        return sorted(counts.items(), key=lambda item: (-item[0].width, -item[0].used_length))
+
+
+def lower_bound(lengths, capacity, kerf):
+    """Fewest boards any plan can use (Martello-Toth L2 bound)."""
+    room = capacity + kerf
+    counts = {}
+    for length in lengths:
+        counts[length + kerf] = counts.get(length + kerf, 0) + 1
+    if not counts:
+        return 0
+    best = math.ceil(sum(size * count for size, count in counts.items()) / room - _EPS)
+    half = room / 2
+    # Pieces over half a board never share; small ones fill what they leave
+    large = sorted(size for size in counts if size > half + _EPS)
+    small = sorted(size for size in counts if size <= half + _EPS)
+    boards = sum(counts[size] for size in large)
+    # spare[i]: room left by the i smallest large pieces; filling[i]: length of small pieces from the i-th on
+    spare = [0]
+    for size in large:
+        spare.append(spare[-1] + (room - size) * counts[size])
+    filling = [0] * (len(small) + 1)
+    for i in range(len(small) - 1, -1, -1):
+        filling[i] = filling[i + 1] + small[i] * counts[small[i]]
+    for alpha in [0] + small:
+        usable = spare[bisect.bisect_right(large, room - alpha + _EPS)]
+        pieces = filling[bisect.bisect_left(small, alpha - _EPS)]
+        best = max(best, boards + max(0, math.ceil((pieces - usable) / room - _EPS)))
+    return best
+
+
+def _check_lengths(lengths, capacity):
+    for length in lengths:
+        if not length > 0:
+            raise ValueError(f"piece length must be positive, got {length!r}")
+        if length > capacity + _EPS:
+            raise ValueError(f"a {length:g} mm piece is longer than the {capacity:g} mm stock")
+
+
+def first_fit_decreasing(lengths, capacity, kerf=0):
+    """Pack ``lengths`` onto boards of ``capacity``; returns a list of cut lists.
+
+    Raises ValueError for a piece that fits on no board (plan_cuts sets
+    those apart as oversize).
+
+    Identical lengths are placed together, which gives the same packing as
+    placing them one at a time but stays fast for thousands of pieces. The
+    first board with room is found in a tree of the boards' free space
+    instead of by trying every open board.
+    """
+    _check_lengths(lengths, capacity)
+    counts = {}
+    for length in lengths:
+        counts[length] = counts.get(length, 0) + 1
+
+    # Every piece consumes its kerf; the last cut of a board does not
+    room = capacity + kerf
+    bins = []
+    # tree[leaves + i] is the free space of board i, every other node the most of its two children
+    leaves = 1
+    while leaves < sum(counts.values()):
+        leaves *= 2
+    tree = [-math.inf] * (2 * leaves)
+
+    def set_free(index, free):
+        node = leaves + index
+        tree[node] = free
+        while node > 1:
+            node //= 2
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+    for length in sorted(counts, reverse=True):
+        size = length + kerf
+        left = counts[length]
+        while left and tree[1] + _EPS >= size:
+            # Leftmost board the piece fits on
+            node = 1
+            while node < leaves:
+                node = 2 * node if tree[2 * node] + _EPS >= size else 2 * node + 1
+            fit = min(left, int((tree[node] + _EPS) // size))
+            if not fit:
+                break
+            index = node - leaves
+            bins[index].extend([length] * fit)
+            set_free(index, tree[node] - size * fit)
+            left -= fit
+        per_board = int((room + _EPS) // size)
+        while left:
+            fit = min(left, per_board)
+            bins.append([length] * fit)
+            set_free(len(bins) - 1, room - size * fit)
+            left -= fit
+    return bins
+
+
+def _search(sizes, room, target, deadline):
+    """Depth-first search for a packing of ``sizes`` into ``target`` boards.
+
+    Returns the assignment of pieces to boards, None when no such packing
+    exists, or False when the deadline passed first.
+    """
+    n = len(sizes)
+    remaining = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        remaining[i] = remaining[i + 1] + sizes[i]
+
+    free = []
+    # sum(free), kept up to date as pieces go in and out
+    free_total = 0
+    assign = [0] * n
+    opened = [False] * n
+    choices = [None] * n
+    position = [0] * n
+    depth = 0
+    nodes = 0
+    while True:
+        if depth == n:
+            return assign
+        nodes += 1
+        if nodes % _CLOCK_NODES == 0 and time.perf_counter() > deadline:
+            return False
+
+        size = sizes[depth]
+        if choices[depth] is None:
+            # Bound: the open boards' free space cannot hold what is left
+            overflow = remaining[depth] - free_total
+            needed = len(free) + (math.ceil(overflow / room - _EPS) if overflow > _EPS else 0)
+            candidates = []
+            if needed <= target:
+                seen = set()
+                # Identical pieces go in board order to skip mirrored packings
+                start = assign[depth - 1] if depth and sizes[depth - 1] == size else 0
+                for board in range(start, len(free)):
+                    space = round(free[board], 6)
+                    if free[board] + _EPS >= size and space not in seen:
+                        seen.add(space)
+                        candidates.append(board)
+                if len(free) < target:
+                    candidates.append(len(free))
+            choices[depth] = candidates
+            position[depth] = 0
+        else:
+            # Take the piece back out before trying its next board
+            free[assign[depth]] += size
+            free_total += size
+            if opened[depth]:
+                free.pop()
+                free_total -= room
+
+        if position[depth] < len(choices[depth]):
+            board = choices[depth][position[depth]]
+            position[depth] += 1
+            opened[depth] = board == len(free)
+            if opened[depth]:
+                free.append(room)
+                free_total += room
+            free[board] -= size
+            free_total -= size
+            assign[depth] = board
+            depth += 1
+        else:
+            choices[depth] = None
+            depth -= 1
+            if depth < 0:
+                return None
+
+
+def branch_and_bound(lengths, capacity, kerf=0, time_budget=1.0, deadline=None, bins=None, bound=None):
+    """Improve on first-fit-decreasing until optimal or out of time.
+
+    ``bins`` and ``bound`` are the first-fit-decreasing packing and the
+    lower bound when the caller has them already; ``deadline`` (a
+    perf_counter() reading) replaces ``time_budget``.
+    Returns (cut lists, optimal); raises ValueError like first_fit_decreasing.
+    """
+    _check_lengths(lengths, capacity)
+    if deadline is None:
+        deadline = time.perf_counter() + time_budget
+    if bins is None:
+        bins = first_fit_decreasing(lengths, capacity, kerf)
+    if bound is None:
+        bound = lower_bound(lengths, capacity, kerf)
+    if len(bins) <= bound:
+        return bins, True
+    if time.perf_counter() >= deadline:
+        return bins, False
+
+    ordered = sorted(lengths, reverse=True)
+    sizes = [length + kerf for length in ordered]
+    room = capacity + kerf
+    target = len(bins) - 1
+    while target >= bound:
+        assign = _search(sizes, room, target, deadline)
+        if assign is False:
+            return bins, False
+        if assign is None:
+            return bins, True
+        packed = [[] for _ in range(max(assign) + 1)]
+        for length, board in zip(ordered, assign):
+            packed[board].append(length)
+        bins = packed
+        target = len(bins) - 1
+    return bins, True
+
+
+def plan_cuts(pieces, stock_length=STOCK_LENGTH, kerf=DEFAULT_KERF, exact=False, time_budget=1.0):
+    """Lay out ``pieces`` on stock boards and return a CuttingPlan.
+
+    ``pieces`` is an iterable of (width, length, count). Only pieces of the
+    same width share a board. With ``exact`` a branch-and-bound search
+    improves on the fast packing until ``time_budget`` seconds after the
+    call, shared among the widths.
+    """
+    by_width = {}
+    oversize = []
+    for width, length, count in pieces:
+        if count <= 0 or length <= 0:
+            continue
+        if length > stock_length + _EPS:
+            oversize.append((width, length, count))
+            continue
+        by_width.setdefault(width, []).extend([length] * count)
+
+    deadline = time.perf_counter() + time_budget
+    boards = []
+    optimal = True
+    widths = sorted(by_width)
+    for index, width in enumerate(widths):
+        lengths = by_width[width]
+        bins = first_fit_decreasing(lengths, stock_length, kerf)
+        bound = lower_bound(lengths, stock_length, kerf)
+        proven = len(bins) <= bound
+        if exact and not proven:
+            # Share what is left of the budget among the widths still to do
+            now = time.perf_counter()
+            share = max(0.0, deadline - now) / (len(widths) - index)
+            bins, proven = branch_and_bound(lengths, stock_length, kerf, deadline=now + share, bins=bins,
+                                            bound=bound)
+        optimal = optimal and proven
+        boards.extend(Board(width, stock_length, kerf, tuple(sorted(cuts, reverse=True))) for cuts in bins)
+    return CuttingPlan(stock_length, kerf, boards, oversize, optimal)
@@ -0,0 +1,433 @@
+"""Door diagrams: the template image for a door spec and the dimensions
+written on it.
+
+Choosing the template and the labels is plain Python; PIL is only imported
+when an annotated image is actually rendered. Images for the screen are
+drawn in memory at the display size and kept in a small LRU cache, so
+calculating the same door again does not touch the disk. The templates
+themselves are decoded and scaled once, ahead of time by start_preload().
+"""
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
+
+from .catalog import application_path
+from .engine import (BOX_LOCK, BOTTOM, ELECTRIC_LOCK, FIREPROOF, HONEYCOMB_BOARD, HONEYCOMB_PAPER, LOCK_DOOR_TYPES,
+                     MODE_UB, NON_FIREPROOF, SIMPLE, TOP, YIPAIYIKONG)
+
+# Font used for the dimension labels
+FONT_FILE = "arial.ttf"
+FONT_SIZE = 24
+# Size of the diagram in the result panel
+DISPLAY_SIZE = (300, 400)
+# Annotated images kept in memory
+CACHE_SIZE = 64
+
+_STRUCTURE_PREFIXES = {HONEYCOMB_BOARD: 'honeycomb_board', HONEYCOMB_PAPER: 'honeycomb_paper',
+                       YIPAIYIKONG: 'yipaiyikong'}
+# Every template template_name() can return
+TEMPLATES = ('simple.png', 'kunci.png', 'kunci menkongqi.png', 'UB.png', 'UB_kunci_elektrik.png',
+             'UB_kunci_elektrik_menkongqi.png', 'UB_kunci_elektrik_bawah.png') + tuple(
+    f'{prefix}_{suffix}' for prefix in _STRUCTURE_PREFIXES.values()
+    for suffix in ('simple.png', 'kunci_elektrik.png', 'kunci_elektrik_menkongqi.png'))
+
+_fonts = {}
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+# (template path, size) -> (scaled template, (x scale, y scale))
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def template_name(result):
+    """Return the file name of the diagram template for ``result``, or None."""
+    spec = result.spec
+    category = spec.category
+    structure_type = spec.structure_type
+    door_type = spec.door_type
+    concealed_length = result.concealed_closer_length
+    if category == FIREPROOF:
+        if spec.mode == MODE_UB:
+            if door_type == SIMPLE:
+                return 'UB.png'
+            if door_type in LOCK_DOOR_TYPES:
+                if result.lock_direction == TOP:
+                    return 'UB_kunci_elektrik_menkongqi.png' if concealed_length > 0 else 'UB_kunci_elektrik.png'
+                if result.lock_direction == BOTTOM:
+                    return 'UB_kunci_elektrik_bawah.png'
+        else:
+            if door_type == SIMPLE:
+                return 'simple.png'
+            if door_type in LOCK_DOOR_TYPES:
+                return 'kunci menkongqi.png' if concealed_length > 0 else 'kunci.png'
+    elif category == NON_FIREPROOF:
+        prefix = _STRUCTURE_PREFIXES.get(structure_type)
+        if prefix:
+            if door_type == SIMPLE:
+                return f'{prefix}_simple.png'
+            if door_type in LOCK_DOOR_TYPES:
+                return f'{prefix}_kunci_elektrik_menkongqi.png' if concealed_length > 0 else f'{prefix}_kunci_elektrik.png'
+    return None
+
+
+def template_path(result):
+    """Full path of the diagram template for ``result``, or None."""
+    name = template_name(result)
+    return os.path.join(application_path, name) if name else None
+
+
+# Labels drawn on each template, by layout_key(). Every label is a
+# (text, (x, y), colour) with the text formatted from the DoorResult
+# fields; positions are in template pixels.
+_MM = ("*mm (milimeter)", (5, 5), "black")
+_FIREPROOF_LOCK = (
+    _MM,
+    ("{horizontal_pieces_length}", (160, 30), "red"),
+    ("{outer_wood_upper}", (45, 190), "limegreen"),
+    ("{inner_wood_upper}", (45, 80), "blueviolet"),
+    ("{outer_wood_bottom}", (45, 280), "orange"),
+    ("{inner_wood_bottom}", (45, 380), "saddlebrown"),
+    ("{vertical_piece_length}", (400, 260), "mediumblue"),
+)
+
+
+def _fireproof_lock_concealed(colour):
+    return (
+        _MM,
+        ("{very_upper_horizontal_piece_length}", (160, 30), colour),
+        ("{outer_wood_upper}", (45, 190), "limegreen"),
+        ("{inner_wood_upper}", (45, 80), "blueviolet"),
+        ("{outer_wood_bottom}", (45, 280), "orange"),
+        ("{inner_wood_bottom}", (45, 380), "saddlebrown"),
+        ("{vertical_piece_length}", (400, 260), "mediumblue"),
+        ("{horizontal_pieces_length}", (200, 430), "red"),
+        ("{concealed_closer_length}", (300, 20), "black"),
+    )
+
+
+_LOCK_FRAME = (
+    ("{outer_wood_upper}", (10, 130), "limegreen"),
+    ("{outer_wood_bottom}", (10, 320), "orange"),
+    ("{gap_wood_lock_length}", (50, 430), "fuchsia"),
+)
+_HONEYCOMB_BOARD_GAPS = (
+    ("一{gap_length}", (230, 125), "saddlebrown"),
+    ("二{gap_length}", (230, 220), "saddlebrown"),
+    ("三{gap_length}", (230, 325), "saddlebrown"),
+)
+_HONEYCOMB_PAPER_GAPS = (
+    ("一{gap_length}", (190, 100), "saddlebrown"),
+    ("二{gap_length}", (190, 155), "saddlebrown"),
+    ("三{gap_length}", (190, 280), "saddlebrown"),
+    ("四{gap_length}", (190, 360), "saddlebrown"),
+    ("五{gap_length}", (190, 220), "saddlebrown"),
+)
+_HONEYCOMB_PAPER_CONCEALED_GAPS = (
+    ("一{gap_length}", (190, 125), "saddlebrown"),
+    ("二{gap_length}", (190, 175), "saddlebrown"),
+    ("三{gap_length}", (190, 300), "saddlebrown"),
+    ("四{gap_length}", (190, 360), "saddlebrown"),
+    ("五{gap_length}", (190, 230), "saddlebrown"),
+)
+_HONEYCOMB_CONCEALED = (
+    ("{concealed_closer_length}", (280, 25), "black"),
+    ("{very_upper_horizontal_piece_length}", (150, 30), "fuchsia"),
+    ("{reinforce_concealed_wood_length}", (390, 65), "black"),
+)
+
+
+def _honeycomb_lock(gaps):
+    return ((_MM, ("{horizontal_pieces_length}", (200, 33), "red")) + _LOCK_FRAME
+            + (("{vertical_piece_length}", (390, 200), "mediumblue"),) + gaps)
+
+
+def _honeycomb_lock_concealed(gaps):
+    return ((_MM, ("{horizontal_pieces_length}", (300, 430), "red")) + _LOCK_FRAME
+            + (("{vertical_piece_length}", (390, 200), "mediumblue"),) + gaps + _HONEYCOMB_CONCEALED)
+
+
+_YIPAIYIKONG_LOCK = (
+    (_MM, ("{horizontal_pieces_length}", (200, 33), "red")) + _LOCK_FRAME + (
+        ("{vertical_piece_length}", (390, 190), "mediumblue"),
+        ("{slats_count} pcs", (390, 320), "mediumturquoise"),
+    ))
+_YIPAIYIKONG_LOCK_CONCEALED = (
+    (_MM, ("{very_upper_horizontal_piece_length}", (150, 30), "fuchsia")) + _LOCK_FRAME + (
+        ("{vertical_piece_length}", (390, 190), "mediumblue"),
+        ("{horizontal_pieces_length}", (300, 430), "red"),
+        ("{concealed_closer_length}", (280, 20), "black"),
+        ("{slats_count} pcs", (390, 320), "mediumturquoise"),
+        ("{reinforce_concealed_wood_length}", (390, 65), "black"),
+    ))
+
+LAYOUTS = {
+    (FIREPROOF, None, SIMPLE, False, None): (
+        _MM,
+        ("{horizontal_pieces_length}", (190, 35), "red"),
+        ("{vertical_piece_length}", (40, 210), "mediumblue"),
+    ),
+    (FIREPROOF, None, SIMPLE, True, None): (
+        _MM,
+        ("{horizontal_pieces_length}", (120, 35), "red"),
+        ("{vertical_piece_length}", (10, 210), "mediumblue"),
+    ),
+    (FIREPROOF, None, ELECTRIC_LOCK, None, False): _FIREPROOF_LOCK,
+    (FIREPROOF, None, ELECTRIC_LOCK, None, True): _fireproof_lock_concealed("magenta"),
+    (FIREPROOF, None, BOX_LOCK, None, False): _FIREPROOF_LOCK,
+    (FIREPROOF, None, BOX_LOCK, None, True): _fireproof_lock_concealed("fuchsia"),
+
+    (NON_FIREPROOF, HONEYCOMB_BOARD, SIMPLE, None, None): (
+        _MM,
+        ("{horizontal_pieces_length}", (170, 40), "red"),
+        ("{vertical_piece_length}", (40, 200), "mediumblue"),
+        ("{reinforce_wood}", (370, 190), "limegreen"),
+        ("{gap_length_upper}", (230, 125), "saddlebrown"),
+        ("{gap_length_bottom}", (230, 325), "saddlebrown"),
+    ),
+    (NON_FIREPROOF, HONEYCOMB_BOARD, ELECTRIC_LOCK, None, False): _honeycomb_lock(_HONEYCOMB_BOARD_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_BOARD, ELECTRIC_LOCK, None, True): _honeycomb_lock_concealed(_HONEYCOMB_BOARD_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_BOARD, BOX_LOCK, None, False): _honeycomb_lock(_HONEYCOMB_BOARD_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_BOARD, BOX_LOCK, None, True): _honeycomb_lock_concealed(_HONEYCOMB_BOARD_GAPS),
+
+    (NON_FIREPROOF, HONEYCOMB_PAPER, SIMPLE, None, None): (
+        _MM,
+        ("{horizontal_pieces_length}", (180, 40), "red"),
+        ("{vertical_piece_length}", (40, 200), "mediumblue"),
+        ("{reinforce_wood}", (370, 190), "limegreen"),
+        ("一{gap_length_upper}", (190, 100), "saddlebrown"),
+        ("二{gap_length_upper}", (190, 155), "saddlebrown"),
+        ("三{gap_length_bottom}", (190, 300), "saddlebrown"),
+        ("四{gap_length_bottom}", (190, 360), "saddlebrown"),
+    ),
+    (NON_FIREPROOF, HONEYCOMB_PAPER, ELECTRIC_LOCK, None, False): _honeycomb_lock(_HONEYCOMB_PAPER_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_PAPER, ELECTRIC_LOCK, None, True): _honeycomb_lock_concealed(_HONEYCOMB_PAPER_CONCEALED_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_PAPER, BOX_LOCK, None, False): _honeycomb_lock(_HONEYCOMB_PAPER_GAPS),
+    (NON_FIREPROOF, HONEYCOMB_PAPER, BOX_LOCK, None, True): _honeycomb_lock_concealed(_HONEYCOMB_PAPER_CONCEALED_GAPS),
+
+    (NON_FIREPROOF, YIPAIYIKONG, SIMPLE, None, None): (
+        _MM,
+        ("{horizontal_pieces_length}", (150, 30), "red"),
+        ("{vertical_piece_length}", (15, 210), "mediumblue"),
+        ("{slats_count} pcs", (370, 260), "mediumturquoise"),
+    ),
+    (NON_FIREPROOF, YIPAIYIKONG, ELECTRIC_LOCK, None, False): _YIPAIYIKONG_LOCK,
+    (NON_FIREPROOF, YIPAIYIKONG, ELECTRIC_LOCK, None, True): _YIPAIYIKONG_LOCK_CONCEALED,
+    (NON_FIREPROOF, YIPAIYIKONG, BOX_LOCK, None, False): _YIPAIYIKONG_LOCK,
+    (NON_FIREPROOF, YIPAIYIKONG, BOX_LOCK, None, True): _YIPAIYIKONG_LOCK_CONCEALED,
+}
+
+
+def layout_key(result):
+    """The LAYOUTS key of ``result``: (category, structure type, door type, UB, concealed closer).
+
+    Parts that do not change the layout are None: the structure type of
+    fireproof doors, UB for lock doors and the closer for simple doors.
+    """
+    spec = result.spec
+    lock = spec.door_type in LOCK_DOOR_TYPES
+    return (spec.category,
+            spec.structure_type if spec.category == NON_FIREPROOF else None,
+            spec.door_type,
+            spec.mode == MODE_UB if spec.category == FIREPROOF and not lock else None,
+            result.concealed_closer_length > 0 if lock else None)
+
+
+def _compile(labels):
+    """Split each label text into (prefix, field, suffix) once, at import."""
+    compiled = []
+    for text, position, colour in labels:
+        (prefix, field, _, _), *rest = Formatter().parse(text)
+        suffix = rest[0][0] if rest else ""
+        compiled.append((prefix, field, suffix, (position, colour)))
+    return tuple(compiled)
+
+
+_COMPILED_LAYOUTS = {key: _compile(labels) for key, labels in LAYOUTS.items()}
+
+
+def annotations(result):
+    """Return the dimension labels for ``result`` as {text: ((x, y), colour)}."""
+    return {f"{prefix}{getattr(result, field)}{suffix}" if field else prefix: place
+            for prefix, field, suffix, place in _COMPILED_LAYOUTS.get(layout_key(result), ())}
+
+
+def _font(size):
+    font = _fonts.get(size)
+    if font is None:
+        from PIL import ImageFont
+
+        font = _fonts[size] = ImageFont.truetype(FONT_FILE, size)  # Ensure the font file is available
+    return font
+
+
+@lru_cache(maxsize=1024)
+def _text_box(size, text):
+    """Bounding box of ``text`` drawn at (0, 0) in the label font of ``size``."""
+    return _font(size).getbbox(text)
+
+
+def _font_size(scale):
+    return max(1, round(FONT_SIZE * min(scale)))
+
+
+def _draw(image, labels, scale=(1, 1), origin=(0, 0)):
+    """Draw ``labels`` on ``image``; ``origin`` is where the image sits on the full diagram."""
+    from PIL import ImageDraw
+
+    draw = ImageDraw.Draw(image)
+    sx, sy = scale
+    ox, oy = origin
+    font = _font(_font_size(scale))
+    for text, ((x, y), color) in labels:
+        draw.text((round(x * sx) - ox, round(y * sy) - oy), text, fill=color, font=font)
+
+
+def render(result, image_path=None, output_path=None):
+    """Draw the dimension labels on the template and save it as a PNG.
+
+    Returns the path written, by default the template name with an
+    ``_annotated`` suffix.
+    """
+    from PIL import Image
+
+    if image_path is None:
+        image_path = template_path(result)
+    if not image_path or not os.path.exists(image_path):
+        raise FileNotFoundError(f"Image file not found at {image_path}")
+    image = Image.open(image_path)
+    _draw(image, annotations(result).items())
+
+    if output_path is None:
+        output_path = image_path.replace(".png", "_annotated.png")
+    image.save(output_path)
+    return output_path
+
+
+def display_image(result, size=DISPLAY_SIZE):
+    """The annotated diagram of ``result`` scaled to ``size``, as a PIL image.
+
+    The template is scaled first and the labels drawn on it at the matching
+    positions and font size. Results are cached by template and label
+    values; treat the returned image as read-only.
+    """
+    image_path = template_path(result)
+    size = tuple(size)
+    labels = tuple(annotations(result).items())
+    key = (image_path, size, labels)
+    with _cache_lock:
+        image = _cache.get(key)
+        if image is not None:
+            _cache.move_to_end(key)
+            return image
+
+    image, scale = scaled_template(image_path, size)
+    _draw(image, labels, scale)
+
+    with _cache_lock:
+        _cache[key] = image
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return image
+
+
+def repaint(image, previous, result, size=DISPLAY_SIZE):
+    """Turn ``image``, a writable copy of display_image(previous, size), into the diagram of ``result``.
+
+    Only the boxes of labels whose text changed are drawn again, from the
+    clean template, so the image ends up as display_image(result) would
+    draw it. Returns False without touching ``image`` when the template or
+    the label layout differ; render the whole image then.
+    """
+    image_path = template_path(result)
+    old = tuple(annotations(previous).items())
+    new = tuple(annotations(result).items())
+    if image_path != template_path(previous) or [place for _, place in old] != [place for _, place in new]:
+        return False
+    template, scale = _scaled(image_path, tuple(size))
+    font_size = _font_size(scale)
+    sx, sy = scale
+
+    def box(text, x, y):
+        left, top, right, bottom = _text_box(font_size, text)
+        return x + left, y + top, x + right, y + bottom
+
+    placed = []
+    for label in new:
+        text, ((x, y), _) = label
+        placed.append((label, box(text, round(x * sx), round(y * sy))))
+    for (old_text, ((x, y), _)), (new_text, _) in zip(old, new):
+        if old_text == new_text:
+            continue
+        x, y = round(x * sx), round(y * sy)
+        old_box, new_box = box(old_text, x, y), box(new_text, x, y)
+        region_box = (max(0, min(old_box[0], new_box[0])), max(0, min(old_box[1], new_box[1])),
+                      min(image.width, max(old_box[2], new_box[2])), min(image.height, max(old_box[3], new_box[3])))
+        if region_box[0] >= region_box[2] or region_box[1] >= region_box[3]:
+            continue
+        # Every label reaching into the region is redrawn, in order, so overlapping labels stay right
+        region = template.crop(region_box)
+        _draw(region, [label for label, (left, top, right, bottom) in placed
+                       if left < region_box[2] and right > region_box[0] and top < region_box[3] and bottom > region_box[1]],
+              scale, region_box[:2])
+        image.paste(region, region_box[:2])
+    return True
+
+
+def _scaled(image_path, size):
+    """The stored (template scaled to ``size``, scale); the image must not be drawn on."""
+    with _templates_lock:
+        entry = _templates.get((image_path, size))
+    if entry is None:
+        from PIL import Image
+
+        if not image_path or not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found at {image_path}")
+        with Image.open(image_path) as template:
+            entry = (template.resize(size, Image.LANCZOS), (size[0] / template.width, size[1] / template.height))
+        with _templates_lock:
+            _templates[(image_path, size)] = entry
+    return entry
+
+
+def scaled_template(image_path, size=DISPLAY_SIZE):
+    """A copy of the template scaled to ``size``, ready to draw on, and its scale.
+
+    Each template is decoded and scaled only once; later calls copy the
+    stored image.
+    """
+    image, scale = _scaled(image_path, tuple(size))
+    return image.copy(), scale
+
+
+def preload_templates(size=DISPLAY_SIZE):
+    """Decode and scale every template found and load its label font.
+
+    Returns how many templates are ready.
+    """
+    ready = 0
+    for name in TEMPLATES:
+        try:
+            _, scale = scaled_template(os.path.join(application_path, name), size)
+            _font(_font_size(scale))
+        except OSError:
+            continue  # Missing or broken; display_image reports it when needed
+        ready += 1
+    return ready
+
+
+def start_preload(size=DISPLAY_SIZE):
+    """Run preload_templates in a daemon thread and return the thread."""
+    thread = threading.Thread(target=preload_templates, args=(size,), name="template-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_cache():
+    """Forget the cached templates and display images, e.g. after the templates changed."""
+    with _templates_lock:
+        _templates.clear()
+    with _cache_lock:
+        _cache.clear()
+    _text_box.cache_clear()
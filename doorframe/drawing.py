@@ -0,0 +1,366 @@
+"""Vector drawings of a door frame, built from its calculated dimensions.
+
+Unlike the PNG diagrams, which stamp numbers on a fixed template, these
+drawings place every piece at its real size: stiles, rails, the split lock
+side, gap wood blocks, slats, the concealed closer pocket and the panel.
+They are written as SVG or PDF with nothing but the standard library, so a
+whole job can be drawn in a fraction of a second.
+"""
+import os
+import zlib
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from .engine import FIREPROOF, HONEYCOMB_BOARD, HONEYCOMB_PAPER, LOCK_DOOR_TYPES, MODE_UB, SIMPLE, YIPAIYIKONG
+
+# Colours of the piece families, matching the PNG diagram labels
+COLOURS = {
+    "vertical": "#0000cd",      # mediumblue
+    "horizontal": "#ff0000",    # red
+    "outer_upper": "#32cd32",   # limegreen
+    "inner_upper": "#8a2be2",   # blueviolet
+    "outer_bottom": "#ffa500",  # orange
+    "inner_bottom": "#8b4513",  # saddlebrown
+    "concealed": "#ff00ff",     # magenta
+    "gap_wood": "#ff00ff",      # fuchsia
+    "slats": "#48d1cc",         # mediumturquoise
+    "reinforce": "#32cd32",     # limegreen
+    "ub": "#808080",            # gray
+    "panel": "#deb887",         # burlywood
+    "text": "#000000",
+}
+# How much of the piece colour goes into its fill; the rest is white
+FILL_TINT = 0.25
+# A4 portrait in points
+PAGE_SIZE = (595, 842)
+PAGE_MARGIN = 36
+
+
+@dataclass(frozen=True)
+class Part:
+    """One piece of the frame, in mm from the bottom left corner of the door."""
+    name: str
+    x: float
+    y: float
+    width: float
+    height: float
+    colour: str
+    label: str = ""
+    # Drawn as an outline only, e.g. the closer pocket
+    hollow: bool = False
+
+
+@dataclass(frozen=True)
+class Label:
+    text: str
+    x: float
+    y: float
+    colour: str = "text"
+    vertical: bool = False
+
+
+@dataclass(frozen=True)
+class Drawing:
+    width: float
+    height: float
+    parts: List[Part]
+    labels: List[Label] = field(default_factory=list)
+    # Dashed lines as (x1, y1, x2, y2)
+    guides: List[Tuple[float, float, float, float]] = field(default_factory=list)
+    title: str = ""
+
+    @property
+    def text_size(self):
+        return max(self.width, self.height) / 45
+
+
+def _number(value):
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def _stack(parts, name, colour, x, width, y, steps, label_gaps=True):
+    """Lay slats upwards from ``y``: ``steps`` alternate (gap, slat) heights.
+
+    Returns the y after the last step; gaps get a label, slats a part.
+    """
+    labels = []
+    for index, height in enumerate(steps):
+        if height is None:
+            continue
+        if index % 2 == 0:
+            if label_gaps and height > 0:
+                labels.append(Label(_number(height), x + width / 2, y + height / 2, "inner_bottom"))
+        elif height > 0:
+            parts.append(Part(name, x, y, width, height, colour))
+        y += height
+    return y, labels
+
+
+def door_drawing(result, title=""):
+    """Lay out the pieces of one door of ``result`` and return a Drawing."""
+    spec = result.spec
+    width, height = result.frame_width, result.vertical_piece_length
+    left, right = result.left_vertical_piece_width, result.right_vertical_piece_width
+    upper, lower = result.upper_horizontal_piece_width, result.lower_horizontal_piece_width
+    inner = result.inner_width
+    is_lock_door = spec.door_type in LOCK_DOOR_TYPES
+    split = is_lock_door and result.outer_wood_upper is not None
+    fireproof = spec.category == FIREPROOF
+    parts = []
+    labels = []
+    guides = []
+
+    parts.append(Part("right_vertical_pieces", width - right, 0, right, height, "vertical", _number(height)))
+    if fireproof and split:
+        # The lock side is two layers of split parts instead of one stile
+        x0 = 2 * left
+        parts += [
+            Part("outer_wood_bottom_part", 0, 0, left, result.outer_wood_bottom, "outer_bottom",
+                 _number(result.outer_wood_bottom)),
+            Part("outer_wood_upper_part", 0, height - result.outer_wood_upper, left, result.outer_wood_upper,
+                 "outer_upper", _number(result.outer_wood_upper)),
+            Part("inner_wood_bottom_part", left, 0, left, result.inner_wood_bottom, "inner_bottom",
+                 _number(result.inner_wood_bottom)),
+            Part("inner_wood_upper_part", left, height - result.inner_wood_upper, left, result.inner_wood_upper,
+                 "inner_upper", _number(result.inner_wood_upper)),
+        ]
+    else:
+        x0 = left
+        parts.append(Part("left_vertical_pieces", 0, 0, left, height, "vertical", _number(height)))
+        if split:
+            # Outer parts beside the stile, then the gap wood blocks around the lock
+            x0 = 2 * left + result.gap_wood_lock
+            lock_bottom = result.outer_wood_bottom
+            lock_top = height - result.outer_wood_upper
+            block = result.gap_wood_lock_length
+            parts += [
+                Part("outer_wood_bottom_part", left, 0, left, result.outer_wood_bottom, "outer_bottom",
+                     _number(result.outer_wood_bottom)),
+                Part("outer_wood_upper_part", left, lock_top, left, result.outer_wood_upper, "outer_upper",
+                     _number(result.outer_wood_upper)),
+            ]
+            for index, y in enumerate((lock_bottom - 2 * block, lock_bottom - block, lock_top, lock_top + block)):
+                parts.append(Part("gap_wood_lock", 2 * left, y, result.gap_wood_lock, block, "gap_wood",
+                                  _number(block) if index in (1, 2) else ""))
+
+    parts.append(Part("lower_horizontal_pieces", x0, 0, inner, lower, "horizontal", _number(inner)))
+    parts.append(Part("upper_horizontal_pieces", x0, height - upper, inner, upper, "horizontal", _number(inner)))
+
+    # Bands under the top rail: concealed closer, then the UB piece
+    top = height - upper
+    concealed_width = result.concealed_wood_piece_width or 0
+    if is_lock_door and result.has_concealed_closer and concealed_width > 0:
+        top -= concealed_width
+        very_upper = result.very_upper_horizontal_piece_length
+        pocket = result.concealed_closer_length
+        parts.append(Part("very_upper_horizontal_piece_length", x0, top, very_upper, concealed_width, "concealed",
+                          _number(very_upper)))
+        parts.append(Part("concealed_door_closer", x0 + very_upper, top, pocket, concealed_width, "text",
+                          _number(pocket), hollow=True))
+        if not fireproof:
+            reinforce = result.reinforce_concealed_wood_length
+            parts.append(Part("reinforce_concealed_wood_length", x0 + very_upper + pocket, top, reinforce,
+                              concealed_width, "text", _number(reinforce)))
+    if fireproof and spec.mode == MODE_UB:
+        top -= result.ub_wood_piece_width
+        parts.append(Part("ub_wood", x0, top, inner, result.ub_wood_piece_width, "ub"))
+        if result.min_height is not None and result.max_height is not None:
+            low = result.min_height - (result.max_height - height)
+            guides.append((0, low, width, low))
+            labels.append(Label(f"min {_number(result.min_height)}", width / 2, low, "ub"))
+
+    # Infill between the rails
+    slat = result.slats_width
+    if fireproof:
+        parts.insert(0, Part("plywood_dimensions", x0, lower, result.plywood_width, result.plywood_height, "panel",
+                             f"{_number(result.plywood_width)} x {_number(result.plywood_height)}"))
+    elif spec.structure_type == YIPAIYIKONG:
+        steps = []
+        for _ in range(result.slats_count):
+            steps += [result.gap_width, slat]
+        _, found = _stack(parts, "slats_length", "slats", x0, inner, lower, steps, label_gaps=False)
+        labels += found
+        if result.slats_count:
+            labels.append(Label(f"{result.slats_count} pcs", x0 + inner / 2, lower + (top - lower) / 2, "slats"))
+    elif spec.structure_type in (HONEYCOMB_BOARD, HONEYCOMB_PAPER) and spec.door_type == SIMPLE:
+        below, above = result.gap_length_bottom, result.gap_length_upper
+        if spec.structure_type == HONEYCOMB_BOARD:
+            bottom_steps, top_steps = [below], [above]
+        else:
+            bottom_steps, top_steps = [below, slat, below], [above, slat, above]
+        # Slats around the reinforced band at the lock height, gaps from both rails
+        y, found = _stack(parts, "slats_length", "slats", x0, inner, lower, bottom_steps + [slat])
+        labels += found
+        parts.append(Part("reinforce_wood", x0, y, inner, result.reinforce_wood, "reinforce",
+                          _number(result.reinforce_wood)))
+        _stack(parts, "slats_length", "slats", x0, inner, y + result.reinforce_wood, [0, slat])
+        down = top - sum(top_steps)
+        _, found_top = _stack(parts, "slats_length", "slats", x0, inner, down, list(reversed(top_steps)))
+        labels += found_top
+    elif spec.structure_type in (HONEYCOMB_BOARD, HONEYCOMB_PAPER):
+        steps = [result.gap_length]
+        for _ in range(result.slats_count):
+            steps += [slat, result.gap_length]
+        _, found = _stack(parts, "slats_length", "slats", x0, inner, lower, steps)
+        labels += found
+
+    parts = [part for part in parts if part.width > 0 and part.height > 0]
+    return Drawing(width, height, parts, labels, guides, title)
+
+
+def _tint(colour, amount=FILL_TINT):
+    value = COLOURS.get(colour, colour).lstrip("#")
+    rgb = [int(value[i:i + 2], 16) for i in (0, 2, 4)]
+    return "#" + "".join(f"{round(255 - (255 - c) * amount):02x}" for c in rgb)
+
+
+def _rgb(colour):
+    value = colour.lstrip("#")
+    return " ".join(f"{int(value[i:i + 2], 16) / 255:.3f}" for i in (0, 2, 4))
+
+
+def _part_labels(drawing):
+    """Labels of all parts, turned to run along tall pieces."""
+    labels = []
+    for part in drawing.parts:
+        if part.label:
+            labels.append(Label(part.label, part.x + part.width / 2, part.y + part.height / 2, part.colour,
+                                vertical=part.height > part.width))
+    return labels + drawing.labels
+
+
+def _dimension_labels(drawing):
+    size = drawing.text_size
+    return [Label(_number(drawing.width), drawing.width / 2, -2 * size),
+            Label(_number(drawing.height), drawing.width + 2 * size, drawing.height / 2, vertical=True)]
+
+
+def _escape_xml(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def to_svg(drawing):
+    """Return ``drawing`` as an SVG document; one user unit is one mm."""
+    size = drawing.text_size
+    margin = 4 * size
+    width, height = drawing.width, drawing.height
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{(width + 2 * margin):g}mm" '
+           f'height="{(height + 2 * margin):g}mm" viewBox="{-margin:g} {-margin:g} {(width + 2 * margin):g} '
+           f'{(height + 2 * margin):g}" font-family="Helvetica, Arial, sans-serif" font-size="{size:.1f}" '
+           f'text-anchor="middle" dominant-baseline="middle">']
+    if drawing.title:
+        out.append(f'<title>{_escape_xml(drawing.title)}</title>')
+    # SVG counts y downwards from the top
+    for part in drawing.parts:
+        colour = COLOURS.get(part.colour, part.colour)
+        fill = "none" if part.hollow else _tint(part.colour)
+        dash = f' stroke-dasharray="{size / 2:.1f}"' if part.hollow else ""
+        out.append(f'<rect x="{part.x:g}" y="{height - part.y - part.height:g}" width="{part.width:g}" '
+                   f'height="{part.height:g}" fill="{fill}" stroke="{colour}" stroke-width="{size / 10:.2f}"{dash}/>')
+    for x1, y1, x2, y2 in drawing.guides:
+        out.append(f'<line x1="{x1:g}" y1="{height - y1:g}" x2="{x2:g}" y2="{height - y2:g}" stroke="#808080" '
+                   f'stroke-width="{size / 10:.2f}" stroke-dasharray="{size / 2:.1f}"/>')
+    for label in _part_labels(drawing) + _dimension_labels(drawing):
+        x, y = label.x, height - label.y
+        rotate = f' transform="rotate(-90 {x:g} {y:g})"' if label.vertical else ""
+        out.append(f'<text x="{x:g}" y="{y:g}" fill="{COLOURS.get(label.colour, label.colour)}"{rotate}>'
+                   f'{_escape_xml(label.text)}</text>')
+    if drawing.title:
+        out.append(f'<text x="0" y="{-2 * size:g}" text-anchor="start">{_escape_xml(drawing.title)}</text>')
+    out.append('</svg>')
+    return "\n".join(out) + "\n"
+
+
+def _text_width(text, size):
+    """Approximate Helvetica width: digits and most letters are 0.556 em."""
+    narrow = sum(1 for char in text if char in " .,:;il|")
+    return ((len(text) - narrow) * 0.556 + narrow * 0.278) * size
+
+
+def _escape_pdf(text):
+    # The standard fonts only cover Latin-1
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _pdf_page(drawing, page_size=PAGE_SIZE):
+    """Content stream drawing ``drawing`` scaled to fit the page."""
+    size = drawing.text_size
+    margin = 4 * size
+    page_width, page_height = page_size
+    scale = min((page_width - 2 * PAGE_MARGIN) / (drawing.width + 2 * margin),
+                (page_height - 2 * PAGE_MARGIN) / (drawing.height + 2 * margin))
+    x_offset = (page_width - (drawing.width + 2 * margin) * scale) / 2 + margin * scale
+    y_offset = (page_height - (drawing.height + 2 * margin) * scale) / 2 + margin * scale
+    out = []
+    if drawing.title:
+        out.append(f"BT /F1 12 Tf 0 0 0 rg {PAGE_MARGIN} {page_height - PAGE_MARGIN} Td "
+                   f"({_escape_pdf(drawing.title)}) Tj ET")
+    out.append(f"q {scale:.5f} 0 0 {scale:.5f} {x_offset:.2f} {y_offset:.2f} cm {size / 10:.2f} w")
+    for part in drawing.parts:
+        colour = _rgb(COLOURS.get(part.colour, part.colour))
+        rect = f"{part.x:g} {part.y:g} {part.width:g} {part.height:g} re"
+        if part.hollow:
+            out.append(f"[{size / 2:.1f}] 0 d {colour} RG {rect} S [] 0 d")
+        else:
+            out.append(f"{_rgb(_tint(part.colour))} rg {colour} RG {rect} B")
+    for x1, y1, x2, y2 in drawing.guides:
+        out.append(f"[{size / 2:.1f}] 0 d 0.5 0.5 0.5 RG {x1:g} {y1:g} m {x2:g} {y2:g} l S [] 0 d")
+    for label in _part_labels(drawing) + _dimension_labels(drawing):
+        half = _text_width(label.text, size) / 2
+        # Centre the text on its point, along the text direction
+        if label.vertical:
+            matrix = f"0 1 -1 0 {label.x + size / 3:.1f} {label.y - half:.1f}"
+        else:
+            matrix = f"1 0 0 1 {label.x - half:.1f} {label.y - size / 3:.1f}"
+        out.append(f"BT /F1 {size:.1f} Tf {_rgb(COLOURS.get(label.colour, label.colour))} rg {matrix} Tm "
+                   f"({_escape_pdf(label.text)}) Tj ET")
+    out.append("Q")
+    return "\n".join(out).encode("latin-1")
+
+
+def to_pdf(drawings, page_size=PAGE_SIZE):
+    """Return a PDF with one page per drawing, each scaled to fit the page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for drawing in drawings:
+        stream = zlib.compress(_pdf_page(drawing, page_size))
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+        kids.append(len(objects) + 1)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> "
+                       b"/Contents %d 0 R >>" % (page_size[0], page_size[1], len(objects)))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def save(drawings, path):
+    """Write drawings to ``path``: one multi-page PDF, or one SVG per drawing.
+
+    SVG files after the first get ``_2``, ``_3``... before the extension.
+    Returns the paths written.
+    """
+    drawings = list(drawings)
+    stem, extension = os.path.splitext(path)
+    if extension.lower() == ".pdf":
+        with open(path, "wb") as file:
+            file.write(to_pdf(drawings))
+        return [path]
+    written = []
+    for index, drawing in enumerate(drawings, start=1):
+        output_path = path if index == 1 else f"{stem}_{index}{extension or '.svg'}"
+        with open(output_path, "w", encoding="utf-8") as file:
+            file.write(to_svg(drawing))
+        written.append(output_path)
+    return written
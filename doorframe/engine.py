@@ -0,0 +1,627 @@
+"""Headless door frame calculation engine.
+
+Everything here is plain Python: no Tk root and no PIL are needed, so door
+specs can be computed in bulk from scripts or worker processes.
+"""
+import math
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from .catalog import load_catalogs
+
+# Internal option values. They match the translation keys so the GUI can
+# map a translated combobox label back to them.
+FIREPROOF = "fireproof"
+NON_FIREPROOF = "non_fireproof"
+
+MODE_NORMAL = "Normal"
+MODE_UB = "UB"
+
+HONEYCOMB_PAPER = "honeycomb_paper"
+YIPAIYIKONG = "yipaiyikong"
+HONEYCOMB_BOARD = "honeycomb_board"
+
+SIMPLE = "simple"
+ELECTRIC_LOCK = "electric lock"
+BOX_LOCK = "box lock"
+LOCK_DOOR_TYPES = (ELECTRIC_LOCK, BOX_LOCK)
+
+TOP = "top"
+BOTTOM = "bottom"
+
+EDGE_SEALING_OPTIONS = {
+    "6mm 實木": 6,
+    "6mm 鋁封邊": 6,
+    "0.5mm ABS": 0.5,
+    "1mm 鐡封邊 + 1mm 石墨片": 2,
+    "1mm 鐡封邊": 1,
+    "4mm 白木": 4,
+    "0.8mm 美耐板": 0.8,
+    "1mm 不織布": 1,
+    "1mm 鋁封邊": 1
+}
+
+# Fixed piece sizes used by the non-fireproof structures (mm)
+GAP_WOOD_LOCK_LENGTH = 200
+GAP_WOOD_LOCK = 70
+REINFORCE_CONCEALED_WOOD_LENGTH = 70
+# Left vertical piece width of fireproof lock doors (mm)
+FIREPROOF_LOCK_LEFT_WIDTH = 70
+
+# Standard timber stock length the board counts are based on (mm)
+STOCK_LENGTH = 2400
+
+UB_HEIGHT_ERROR = "the difference height should not exceed wood width\n 高度差異不應超過UB角材的寬度\n Perbedaan tinggi tidak boleh melebihi lebar kayu sisi"
+
+
+@dataclass(frozen=True)
+class DoorSpec:
+    """What the operator types in for one door, in language-neutral values.
+
+    Field names match the entry keys of the GUI form. Fields that do not
+    apply to the selected category/structure/door type are ignored.
+    """
+    category: str = ""
+    mode: str = MODE_NORMAL
+    structure_type: str = ""
+    door_type: str = ""
+    num_doors: int = 0
+    right_vpiece_width: int = 0
+    left_vpiece_width: int = 0
+    upper_hpiece_width: int = 0
+    lower_hpiece_width: int = 0
+    ub_wood_width: int = 0
+    edge_sealing_type: str = ""
+    edge_sealing_thickness: Optional[float] = None
+    electric_lock_name: str = ""
+    box_lock_name: str = ""
+    lock_length: int = 0
+    lock_offset_bottom: int = 0
+    lock_height: int = 0
+    lock_direction: str = ""
+    concealed_door_closer_name: str = ""
+    concealed_wood_width: int = 0
+    slats_width: int = 0
+    gap_width: int = 0
+    reinforce_wood: int = 0
+    max_height: int = 0
+    min_height: int = 0
+    frame_height: int = 0
+    frame_width: int = 0
+
+
+@dataclass(frozen=True)
+class DoorResult:
+    """Resolved inputs and computed piece lengths for one door spec."""
+    spec: DoorSpec
+    # Inputs after catalog lookup and edge sealing allowances
+    num_doors: int
+    right_vertical_piece_width: int
+    left_vertical_piece_width: int
+    upper_horizontal_piece_width: int
+    lower_horizontal_piece_width: int
+    vertical_piece_width: Optional[int]
+    horizontal_piece_width: Optional[int]
+    ub_wood_piece_width: int
+    edge_sealing_type: str
+    edge_sealing: float
+    frame_height: int
+    frame_width: int
+    max_height: Optional[int]
+    min_height: Optional[int]
+    electric_lock_name: str
+    box_lock_name: str
+    lock_length: int
+    lock_offset_bottom: int
+    lock_offset_top: int
+    electric_lock_height: int
+    box_lock_height: int
+    lock_direction: str
+    concealed_door_closer_name: str
+    concealed_length: int
+    concealed_wood_piece_width: Optional[int]
+    has_concealed_closer: bool
+    # Length of the selected concealed door closer, 0 without one
+    concealed_closer_length: int
+    # Computed dimensions
+    inner_width: float
+    slats_length: float
+    plywood_width: float
+    plywood_height: float
+    total_length_all_doors: float
+    vertical_piece_length: int
+    horizontal_pieces_length: float
+    outer_wood_bottom: Optional[int]
+    inner_wood_bottom: Optional[int]
+    outer_wood_upper: Optional[int]
+    inner_wood_upper: Optional[int]
+    very_upper_horizontal_piece_length: float
+    gap_width: float
+    slats_width: int
+    slats_count: int
+    total_blocks: int
+    gap_wood_lock: int
+    lock_height: int
+    reinforce_wood: int
+    gap_wood_lock_length: int
+    gap_length_bottom: float
+    gap_length_upper: float
+    gap_length: float
+    reinforce_concealed_wood_length: int
+
+
+# Spec fields that pick the layout (template, labels and formulas); a change may affect every output
+LAYOUT_FIELDS = ("category", "mode", "structure_type", "door_type", "edge_sealing_type", "electric_lock_name",
+                 "box_lock_name", "lock_direction", "concealed_door_closer_name")
+_WIDTHS = ("inner_width", "plywood_width", "slats_length", "horizontal_pieces_length",
+           "very_upper_horizontal_piece_length", "total_length_all_doors")
+_LOCK_SPLIT = ("outer_wood_upper", "inner_wood_upper", "outer_wood_bottom", "inner_wood_bottom")
+_GAPS = ("gap_width", "gap_length", "gap_length_upper", "gap_length_bottom", "slats_count", "total_blocks")
+# Every other spec field -> the DoorResult fields it can change
+DEPENDENCIES = {
+    "num_doors": ("num_doors", "total_length_all_doors"),
+    "right_vpiece_width": ("right_vertical_piece_width", "vertical_piece_width") + _WIDTHS,
+    "left_vpiece_width": ("left_vertical_piece_width", "vertical_piece_width") + _WIDTHS,
+    "upper_hpiece_width": ("upper_horizontal_piece_width", "horizontal_piece_width", "plywood_height") + _GAPS,
+    "lower_hpiece_width": ("lower_horizontal_piece_width", "horizontal_piece_width", "plywood_height",
+                           "slats_width") + _GAPS,
+    "ub_wood_width": ("ub_wood_piece_width", "plywood_height"),
+    "edge_sealing_thickness": ("edge_sealing",),
+    "lock_length": ("lock_length", "lock_offset_top") + _LOCK_SPLIT,
+    "lock_offset_bottom": ("lock_offset_bottom", "lock_offset_top") + _LOCK_SPLIT,
+    "lock_height": ("lock_height", "electric_lock_height", "box_lock_height") + _LOCK_SPLIT + _GAPS,
+    "concealed_wood_width": ("concealed_wood_piece_width", "plywood_height") + _GAPS,
+    "slats_width": (),
+    "gap_width": ("gap_width", "slats_count", "total_blocks"),
+    "reinforce_wood": ("reinforce_wood",) + _GAPS,
+    "max_height": ("max_height", "frame_height", "vertical_piece_length", "plywood_height",
+                   "total_length_all_doors") + _LOCK_SPLIT,
+    "min_height": ("min_height",),
+    "frame_height": ("frame_height", "vertical_piece_length", "plywood_height", "total_length_all_doors")
+                    + _LOCK_SPLIT + _GAPS,
+    "frame_width": ("frame_width",) + _WIDTHS,
+}
+
+
+def affected_outputs(previous, spec):
+    """The DoorResult fields that can differ between the results of two specs, or None for all of them."""
+    changed = [field.name for field in fields(DoorSpec) if getattr(previous, field.name) != getattr(spec, field.name)]
+    if any(name in LAYOUT_FIELDS for name in changed):
+        return None
+    return {output for name in changed for output in DEPENDENCIES[name]}
+
+
+@dataclass(frozen=True)
+class Piece:
+    """``count`` pieces of ``width`` x ``length`` mm timber needed for one door.
+
+    ``name`` is the translation key of the part, e.g. "right_vertical_pieces".
+    """
+    name: str
+    width: float
+    length: float
+    count: int
+
+
+_default_catalogs = None
+
+
+def default_catalogs():
+    """Catalogs loaded from the bundled JSON files, read on first use."""
+    global _default_catalogs
+    if _default_catalogs is None:
+        _default_catalogs = load_catalogs()
+    return _default_catalogs
+
+
+def _lock_dimensions(spec, lock_catalog, lock_name, concealed_door_closer_name, concealeds):
+    """Return (lock_length, offset_bottom, offset_top, concealed_length) for a lock door."""
+    if lock_name in lock_catalog:
+        lock = lock_catalog[lock_name]
+        return lock['length'], lock['offset_bottom'], lock['offset_top'], 0
+    if concealed_door_closer_name in concealeds:
+        return 0, 0, 0, concealeds[concealed_door_closer_name]['length']
+    # Manual lock dimensions when no catalog entry is selected
+    return spec.lock_length, spec.lock_offset_bottom, spec.lock_length - spec.lock_offset_bottom, 0
+
+
+def _check_dimensions(spec, catalogs):
+    """Raise ValueError naming the first dimension ``spec`` needs but lacks."""
+    if spec.door_type not in (SIMPLE,) + LOCK_DOOR_TYPES:
+        raise ValueError(f"Unknown door type: {spec.door_type!r}")
+    if spec.category == NON_FIREPROOF and spec.structure_type not in (HONEYCOMB_PAPER, YIPAIYIKONG, HONEYCOMB_BOARD):
+        raise ValueError(f"Unknown structure type: {spec.structure_type!r}")
+    is_lock_door = spec.door_type in LOCK_DOOR_TYPES
+    required = ["num_doors", "right_vpiece_width", "upper_hpiece_width", "lower_hpiece_width", "frame_width"]
+    if spec.category == NON_FIREPROOF or not is_lock_door:
+        required.append("left_vpiece_width")
+    ub = spec.category == FIREPROOF and spec.mode == MODE_UB
+    required += ["max_height", "min_height", "ub_wood_width"] if ub else ["frame_height"]
+    optional = ["edge_sealing_thickness"]
+    if is_lock_door:
+        required.append("lock_height")
+        lock_catalog = catalogs.box_locks if spec.door_type == BOX_LOCK else catalogs.electric_locks
+        lock_name = spec.box_lock_name if spec.door_type == BOX_LOCK else spec.electric_lock_name
+        closer_name = spec.concealed_door_closer_name.strip()
+        if closer_name in catalogs.concealeds:
+            required.append("concealed_wood_width")
+        elif lock_name.strip() not in lock_catalog:
+            # Manual lock dimensions
+            if spec.lock_length <= 0:
+                name_field = "box_lock_name" if spec.door_type == BOX_LOCK else "electric_lock_name"
+                raise ValueError(f"{name_field} {lock_name.strip()!r} is not in the catalog; give lock_length "
+                                 f"and lock_offset_bottom for a lock that is not")
+            required.append("lock_length")
+            optional.append("lock_offset_bottom")
+    elif spec.category == NON_FIREPROOF:
+        if spec.structure_type == YIPAIYIKONG:
+            required.append("gap_width")
+        else:
+            required.append("lock_height")
+            optional.append("reinforce_wood")
+    for name in required + optional:
+        value = getattr(spec, name)
+        if value is None and name in optional:
+            continue
+        if (isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value)
+                or value < 0 or (value == 0 and name in required)):
+            kind = "positive" if name in required else "non-negative"
+            raise ValueError(f"{name} must be a {kind} number, got {value!r}")
+    if ub and spec.min_height > spec.max_height:
+        raise ValueError(f"min_height ({spec.min_height}) must not exceed max_height ({spec.max_height})")
+    if "lock_length" in required and spec.lock_offset_bottom > spec.lock_length:
+        raise ValueError(f"lock_offset_bottom ({spec.lock_offset_bottom}) must not exceed "
+                         f"lock_length ({spec.lock_length})")
+
+
+def calculate(spec, catalogs=None):
+    """Compute the material requirements of ``spec`` and return a DoorResult.
+
+    Raises ValueError for inputs that cannot be calculated.
+    """
+    if catalogs is None:
+        catalogs = default_catalogs()
+
+    category = spec.category
+    mode = spec.mode
+    structure_type = spec.structure_type
+    door_type = spec.door_type
+    is_lock_door = door_type in LOCK_DOOR_TYPES
+
+    if category == FIREPROOF:
+        left_vertical_piece_width = FIREPROOF_LOCK_LEFT_WIDTH if is_lock_door else spec.left_vpiece_width
+    elif category == NON_FIREPROOF:
+        left_vertical_piece_width = spec.left_vpiece_width
+    else:
+        raise ValueError(f"Unknown door category: {category!r}")
+    _check_dimensions(spec, catalogs)
+
+    right_vertical_piece_width = spec.right_vpiece_width
+    upper_horizontal_piece_width = spec.upper_hpiece_width
+    lower_horizontal_piece_width = spec.lower_hpiece_width
+    ub_wood_piece_width = spec.ub_wood_width
+
+    edge_sealing_type = spec.edge_sealing_type.strip()
+    edge_sealing = EDGE_SEALING_OPTIONS.get(edge_sealing_type, None)
+    if edge_sealing is None:
+        if spec.edge_sealing_thickness is None:
+            raise ValueError("Edge sealing thickness is required when no edge sealing type is selected")
+        edge_sealing = float(spec.edge_sealing_thickness)
+
+    vertical_piece_width = right_vertical_piece_width if right_vertical_piece_width == left_vertical_piece_width else None
+    horizontal_piece_width = upper_horizontal_piece_width if upper_horizontal_piece_width == lower_horizontal_piece_width else None
+
+    frame_height = frame_width = concealed_wood_piece_width = None
+    max_height = min_height = None
+    electric_lock_name = ""
+    box_lock_name = ""
+    lock_length = 0
+    electric_lock_height = 0
+    box_lock_height = 0
+    lock_direction = ""
+    lock_offset_bottom = 0
+    lock_offset_top = 0
+    concealed_door_closer_name = ""
+    concealed_length = 0
+    gap_width = 0
+    reinforce_wood = 0
+    lock_height = 0
+
+    if is_lock_door:
+        concealed_door_closer_name = spec.concealed_door_closer_name.strip()
+        if door_type == BOX_LOCK:
+            box_lock_name = spec.box_lock_name.strip()
+            lock_length, lock_offset_bottom, lock_offset_top, concealed_length = _lock_dimensions(
+                spec, catalogs.box_locks, box_lock_name, concealed_door_closer_name, catalogs.concealeds)
+            box_lock_height = spec.lock_height
+        else:
+            electric_lock_name = spec.electric_lock_name.strip()
+            lock_length, lock_offset_bottom, lock_offset_top, concealed_length = _lock_dimensions(
+                spec, catalogs.electric_locks, electric_lock_name, concealed_door_closer_name, catalogs.concealeds)
+            electric_lock_height = spec.lock_height
+        lock_direction = spec.lock_direction
+        concealed_wood_piece_width = spec.concealed_wood_width
+
+    if category == FIREPROOF and mode == MODE_UB:
+        max_height = spec.max_height
+        min_height = spec.min_height
+        frame_width = spec.frame_width
+        frame_height = max_height  # Frame height equals max height in UB mode
+        if max_height - min_height > spec.ub_wood_width:
+            raise ValueError(UB_HEIGHT_ERROR if is_lock_door else UB_HEIGHT_ERROR + " bagian atas")
+    else:
+        frame_height = spec.frame_height
+        frame_width = spec.frame_width
+        if category == NON_FIREPROOF:
+            if structure_type == YIPAIYIKONG:
+                gap_width = spec.gap_width
+            elif not is_lock_door:
+                lock_height = spec.lock_height
+                reinforce_wood = spec.reinforce_wood
+
+    if edge_sealing_type in ["1mm 鐡封邊 + 1mm 石墨片"]:
+        electric_lock_height += 3
+        box_lock_height += 3
+    elif edge_sealing_type in ["1mm 鋁封邊"]:
+        electric_lock_height += 2
+        box_lock_height += 2
+    elif edge_sealing_type in ["1mm 鐡封邊", "0.5mm ABS", "0.8mm 美耐板", "1mm 不織布"]:
+        electric_lock_height += 4
+        box_lock_height += 4
+
+    if edge_sealing_type in ["0.5mm ABS", "0.8mm 美耐板", "1mm 不織布"]:
+        frame_height += 10
+        frame_width += 10
+    elif edge_sealing_type in ["1mm 鐡封邊 + 1mm 石墨片", "1mm 鐡封邊"]:
+        frame_height += 5
+        frame_width += 5
+    elif edge_sealing_type in ["1mm 鋁封邊"]:
+        frame_height += 3
+        frame_width += 3
+
+    pieces = _material_requirements(
+        door_type=door_type, num_doors=spec.num_doors, frame_height=frame_height, frame_width=frame_width,
+        right_vertical_piece_width=right_vertical_piece_width, left_vertical_piece_width=left_vertical_piece_width,
+        upper_horizontal_piece_width=upper_horizontal_piece_width,
+        lower_horizontal_piece_width=lower_horizontal_piece_width, max_height=max_height,
+        lock_length=lock_length, electric_lock_height=electric_lock_height, box_lock_height=box_lock_height,
+        lock_direction=lock_direction, concealed_door_closer_name=concealed_door_closer_name,
+        concealeds=catalogs.concealeds, lock_offset_bottom=lock_offset_bottom, lock_offset_top=lock_offset_top,
+        gap_width=gap_width, mode=mode, category=category, structure_type=structure_type,
+        lock_height=lock_height, reinforce_wood=reinforce_wood, ub_wood_piece_width=ub_wood_piece_width,
+        concealed_wood_piece_width=concealed_wood_piece_width)
+    if pieces["inner_width"] <= 0:
+        raise ValueError(f"frame_width ({spec.frame_width}) leaves no room between the vertical pieces")
+    if pieces["plywood_height"] < 0:
+        height = "max_height" if category == FIREPROOF and mode == MODE_UB else "frame_height"
+        raise ValueError(f"{height} ({getattr(spec, height)}) leaves no room between the horizontal pieces")
+
+    return DoorResult(
+        spec=spec,
+        num_doors=spec.num_doors,
+        right_vertical_piece_width=right_vertical_piece_width,
+        left_vertical_piece_width=left_vertical_piece_width,
+        upper_horizontal_piece_width=upper_horizontal_piece_width,
+        lower_horizontal_piece_width=lower_horizontal_piece_width,
+        vertical_piece_width=vertical_piece_width,
+        horizontal_piece_width=horizontal_piece_width,
+        ub_wood_piece_width=ub_wood_piece_width,
+        edge_sealing_type=edge_sealing_type,
+        edge_sealing=edge_sealing,
+        max_height=max_height,
+        min_height=min_height,
+        electric_lock_name=electric_lock_name,
+        box_lock_name=box_lock_name,
+        lock_length=lock_length,
+        lock_offset_bottom=lock_offset_bottom,
+        lock_offset_top=lock_offset_top,
+        electric_lock_height=electric_lock_height,
+        box_lock_height=box_lock_height,
+        lock_direction=lock_direction,
+        concealed_door_closer_name=concealed_door_closer_name,
+        concealed_length=concealed_length,
+        concealed_wood_piece_width=concealed_wood_piece_width,
+        has_concealed_closer=concealed_door_closer_name in catalogs.concealeds,
+        concealed_closer_length=catalogs.concealeds.get(concealed_door_closer_name, {}).get('length', 0),
+        frame_height=frame_height,
+        **pieces)
+
+
+def _material_requirements(door_type, num_doors, frame_height, frame_width, right_vertical_piece_width,
+                           left_vertical_piece_width, upper_horizontal_piece_width, lower_horizontal_piece_width,
+                           max_height, lock_length, electric_lock_height, box_lock_height, lock_direction,
+                           concealed_door_closer_name, concealeds, lock_offset_bottom, lock_offset_top, gap_width,
+                           mode, category, structure_type, lock_height, reinforce_wood, ub_wood_piece_width,
+                           concealed_wood_piece_width):
+    slats_length = 0
+    total_blocks = 0
+    slats_count = 0
+    gap_length_bottom = 0
+    gap_length_upper = 0
+    middle_length = 0
+    inner_width = 0
+    plywood_height = 0
+    gap_wood_lock_length = GAP_WOOD_LOCK_LENGTH
+    gap_wood_lock = GAP_WOOD_LOCK
+    gap_length = 0
+    slats_width = 0
+    reinforce_concealed_wood_length = REINFORCE_CONCEALED_WOOD_LENGTH
+    is_lock_door = door_type in LOCK_DOOR_TYPES
+
+    if concealed_door_closer_name in concealeds:
+        concealed_length = concealeds[concealed_door_closer_name]['length']
+    else:
+        # Set default values if no concealed door closer is selected
+        concealed_length = 0
+
+    if category == FIREPROOF:
+        if is_lock_door:
+            inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2)
+        else:
+            inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
+        if mode == MODE_UB:
+            if is_lock_door and concealed_length > 0:
+                plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width - concealed_wood_piece_width - ub_wood_piece_width
+            else:
+                plywood_height = max_height - lower_horizontal_piece_width - upper_horizontal_piece_width - ub_wood_piece_width
+        else:
+            plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
+            if is_lock_door and concealed_length > 0:
+                plywood_height -= concealed_wood_piece_width
+
+    elif category == NON_FIREPROOF:
+        if structure_type == YIPAIYIKONG:
+            plywood_height = frame_height - lower_horizontal_piece_width - upper_horizontal_piece_width
+            if is_lock_door:
+                if concealed_length > 0:
+                    plywood_height -= concealed_wood_piece_width
+                inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
+            else:
+                inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
+            slats_width = lower_horizontal_piece_width
+            slats_count = plywood_height // (slats_width + gap_width)
+            total_blocks = slats_count + 4
+        elif structure_type == HONEYCOMB_BOARD:
+            slats_width = lower_horizontal_piece_width
+            slats_count = 2
+            if is_lock_door:
+                inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
+                if concealed_length == 0:
+                    gap_width = (frame_height - (slats_width * 4)) / 3
+                    gap_length = math.ceil((frame_height - upper_horizontal_piece_width - lower_horizontal_piece_width - (slats_count * slats_width)) / 3)
+                else:
+                    gap_width = (frame_height - (slats_width * 3) - upper_horizontal_piece_width) / 3
+                    gap_length = math.ceil((frame_height - (slats_count * slats_width) - upper_horizontal_piece_width - lower_horizontal_piece_width - concealed_wood_piece_width) / 3)
+            else:
+                inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
+                middle_length = reinforce_wood + (slats_width * 2)
+                gap_length_bottom = lock_height - (middle_length / 2) - lower_horizontal_piece_width
+                gap_length_upper = frame_height - gap_length_bottom - middle_length - upper_horizontal_piece_width - lower_horizontal_piece_width
+        elif structure_type == HONEYCOMB_PAPER:
+            slats_width = lower_horizontal_piece_width
+            slats_count = 4
+            if is_lock_door:
+                inner_width = frame_width - right_vertical_piece_width - (left_vertical_piece_width * 2) - gap_wood_lock
+                if concealed_length == 0:
+                    gap_width = (frame_height - (slats_width * 6)) / 5
+                    gap_length = (frame_height - upper_horizontal_piece_width - lower_horizontal_piece_width - (slats_count * slats_width)) / 5
+                else:
+                    gap_width = (frame_height - (slats_width * 6) - concealed_wood_piece_width) / 5
+                    gap_length = (frame_height - (slats_count * slats_width) - upper_horizontal_piece_width - lower_horizontal_piece_width - concealed_wood_piece_width) / 5
+            else:
+                inner_width = frame_width - right_vertical_piece_width - left_vertical_piece_width
+                middle_length = reinforce_wood + (slats_width * 2)
+                gap_length_bottom = (lock_height - (middle_length / 2) - lower_horizontal_piece_width - slats_width) / 2
+                gap_length_upper = (frame_height - gap_length_bottom - middle_length - upper_horizontal_piece_width - lower_horizontal_piece_width - slats_width) / 2
+
+    slats_length = inner_width
+    plywood_width = inner_width
+    vertical_piece_length = frame_height
+    horizontal_pieces_length = inner_width
+    very_upper_horizontal_piece_length = horizontal_pieces_length
+
+    total_length_per_door = vertical_piece_length * 2 + horizontal_pieces_length * 2
+    total_length_all_doors = total_length_per_door * num_doors
+
+    outer_wood_bottom = inner_wood_bottom = outer_wood_upper = inner_wood_upper = None
+    # Lock doors split the left vertical piece around the lock. UB doors
+    # measure from the max height instead of the frame height.
+    lock_doors_split = (
+        (category == FIREPROOF)
+        or (category == NON_FIREPROOF and structure_type in [YIPAIYIKONG, HONEYCOMB_PAPER, HONEYCOMB_BOARD])
+    )
+    if lock_doors_split and is_lock_door:
+        split_height = max_height if (category == FIREPROOF and mode == MODE_UB) else frame_height
+        lock_centre_height = electric_lock_height if door_type == ELECTRIC_LOCK else box_lock_height
+        # Electric locks need a deeper cut-out above the lock
+        inner_upper_cut = 75 if door_type == ELECTRIC_LOCK else 30
+        if lock_direction == BOTTOM:
+            outer_wood_bottom = lock_centre_height - lock_offset_bottom
+            inner_wood_bottom = outer_wood_bottom - 30
+            outer_wood_upper = split_height - (outer_wood_bottom + lock_length)
+            inner_wood_upper = outer_wood_upper - inner_upper_cut
+        elif lock_direction == TOP:
+            outer_wood_upper = lock_centre_height - lock_offset_top
+            inner_wood_upper = outer_wood_upper - inner_upper_cut
+            outer_wood_bottom = split_height - (outer_wood_upper + lock_length)
+            inner_wood_bottom = outer_wood_bottom - 30
+
+        if concealed_door_closer_name in concealeds:
+            concealed_length = concealeds[concealed_door_closer_name]['length']
+            very_upper_horizontal_piece_length = horizontal_pieces_length - concealed_length
+            if category == NON_FIREPROOF:
+                very_upper_horizontal_piece_length -= reinforce_concealed_wood_length
+
+    return dict(
+        inner_width=inner_width, slats_length=slats_length, plywood_width=plywood_width,
+        plywood_height=plywood_height, total_length_all_doors=total_length_all_doors,
+        vertical_piece_length=vertical_piece_length, horizontal_pieces_length=horizontal_pieces_length,
+        frame_width=frame_width, outer_wood_bottom=outer_wood_bottom, inner_wood_bottom=inner_wood_bottom,
+        outer_wood_upper=outer_wood_upper, inner_wood_upper=inner_wood_upper,
+        very_upper_horizontal_piece_length=very_upper_horizontal_piece_length, gap_width=gap_width,
+        slats_width=slats_width, slats_count=slats_count, total_blocks=total_blocks, gap_wood_lock=gap_wood_lock,
+        lock_height=lock_height, reinforce_wood=reinforce_wood, gap_wood_lock_length=gap_wood_lock_length,
+        gap_length_bottom=gap_length_bottom, gap_length_upper=gap_length_upper, gap_length=gap_length,
+        reinforce_concealed_wood_length=reinforce_concealed_wood_length)
+
+
+def cut_list(result):
+    """Return the timber pieces one door of ``result`` is made of.
+
+    Mirrors the piece sections of the GUI report, so the lengths summed over
+    the list give the report's total wood length per door.
+    """
+    spec = result.spec
+    is_lock_door = spec.door_type in LOCK_DOOR_TYPES
+    has_concealed = result.has_concealed_closer and (result.concealed_wood_piece_width or 0) > 0
+    pieces = []
+
+    if spec.category == NON_FIREPROOF and result.slats_count:
+        pieces.append(Piece("slats_length", result.slats_width, result.slats_length, result.slats_count))
+    if spec.category == NON_FIREPROOF and is_lock_door:
+        pieces.append(Piece("gap_wood_lock", result.gap_wood_lock, result.gap_wood_lock_length, 4))
+
+    # Fireproof lock doors replace the left vertical piece with the split
+    # parts; non-fireproof lock doors keep it and add the outer parts.
+    if spec.category == FIREPROOF and is_lock_door:
+        pieces.append(Piece("right_vertical_pieces", result.right_vertical_piece_width, result.vertical_piece_length, 1))
+    elif result.vertical_piece_width:
+        pieces.append(Piece("vertical_pieces", result.vertical_piece_width, result.vertical_piece_length, 2))
+    else:
+        pieces.append(Piece("right_vertical_pieces", result.right_vertical_piece_width, result.vertical_piece_length, 1))
+        pieces.append(Piece("left_vertical_pieces", result.left_vertical_piece_width, result.vertical_piece_length, 1))
+
+    if is_lock_door and result.outer_wood_upper is not None:
+        left = result.left_vertical_piece_width
+        pieces.append(Piece("outer_wood_upper_part", left, result.outer_wood_upper, 1))
+        if spec.category == FIREPROOF:
+            pieces.append(Piece("inner_wood_upper_part", left, result.inner_wood_upper, 1))
+        pieces.append(Piece("outer_wood_bottom_part", left, result.outer_wood_bottom, 1))
+        if spec.category == FIREPROOF:
+            pieces.append(Piece("inner_wood_bottom_part", left, result.inner_wood_bottom, 1))
+
+    if is_lock_door and has_concealed:
+        width = result.concealed_wood_piece_width
+        pieces.append(Piece("very_upper_horizontal_piece_length", width, result.very_upper_horizontal_piece_length, 1))
+        if spec.category == NON_FIREPROOF:
+            pieces.append(Piece("reinforce_concealed_wood_length", width, result.reinforce_concealed_wood_length, 1))
+
+    if result.horizontal_piece_width:
+        pieces.append(Piece("horizontal_pieces", result.horizontal_piece_width, result.inner_width, 2))
+    else:
+        pieces.append(Piece("upper_horizontal_pieces", result.upper_horizontal_piece_width, result.inner_width, 1))
+        pieces.append(Piece("lower_horizontal_pieces", result.lower_horizontal_piece_width, result.inner_width, 1))
+
+    return pieces
+
+
+def sheet_panels(result):
+    """Return the sheet panels of one door as (name, width, height).
+
+    Only fireproof doors are faced with plywood and fireproof board; names
+    are the report's translation keys.
+    """
+    if result.spec.category != FIREPROOF:
+        return []
+    return [("plywood_dimensions", result.plywood_width, result.plywood_height),
+            ("xisuangai", result.frame_width, result.vertical_piece_length)]
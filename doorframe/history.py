@@ -0,0 +1,60 @@
+"""Bounded history of the calculations made in one GUI session.
+
+Every Calculate adds an Entry; once HISTORY_SIZE entries are kept the
+oldest is dropped, so a long shift never grows the history. Entries hold
+only the calculated job and its report model. The text and the diagram
+are rendered when an entry is shown, and the diagrams themselves live in
+diagram.display_image()'s LRU cache.
+"""
+from collections import deque
+from dataclasses import dataclass
+
+from .batch import BatchResult
+from .report import Report
+
+HISTORY_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Entry:
+    number: int
+    job: BatchResult
+    report: Report
+
+    @property
+    def result(self):
+        return self.job.lines[0].result
+
+    @property
+    def spec(self):
+        return self.job.lines[0].spec
+
+
+class ResultHistory:
+    """The last ``capacity`` entries, oldest first."""
+
+    def __init__(self, capacity=HISTORY_SIZE):
+        self._entries = deque(maxlen=capacity)
+        self._count = 0
+
+    @property
+    def capacity(self):
+        return self._entries.maxlen
+
+    def add(self, job, report):
+        self._count += 1
+        entry = Entry(self._count, job, report)
+        self._entries.append(entry)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def __iter__(self):
+        return iter(self._entries)
@@ -0,0 +1,188 @@
+"""Bulk import of supplier datasheets into the catalogs.
+
+A datasheet is a CSV or XLSX sheet with one model per row: name, length,
+offset_bottom and offset_top (door closers only name and length), and
+optionally brand. Column names are matched like job sheets, ignoring case
+and spaces, and a few supplier spellings are accepted ("model",
+"top_offset", ...); other columns such as prices are ignored. Rows are
+streamed and checked:
+
+- the name is present and the length is a positive whole number of mm
+- locks have both offsets, neither negative, and
+  offset_bottom + offset_top == length
+
+Names are compared with width and case folded, so "ＣＩＳＡ 52710" is the
+same model as "CISA 52710". A name repeated in the sheet with the same
+values is counted once; with other values the repeat is a problem and the
+first row is kept. Models already in the catalog with the same values are
+skipped; with other values they are updated unless ``update=False``.
+Everything accepted is written in one transaction, and rows with problems
+are reported instead of imported.
+"""
+import csv
+import os
+from dataclasses import dataclass, field
+from typing import List
+
+from .catalog import KINDS, catalog_store
+from .search import normalize
+
+DATASHEET_EXTENSIONS = (".csv", ".xlsx", ".xlsm")
+# Longest lock or closer dimension accepted from a datasheet (mm); more is a typo or a unit mix-up
+MAX_MILLIMETRES = 3000
+
+_COLUMNS = {
+    "name": "name", "model": "name", "model_name": "name", "brand": "brand",
+    "length": "length", "lock_length": "length",
+    "offset_bottom": "offset_bottom", "bottom_offset": "offset_bottom",
+    "offset_top": "offset_top", "top_offset": "offset_top",
+}
+
+
+@dataclass(frozen=True)
+class Problem:
+    row: int
+    message: str
+
+    def __str__(self):
+        return f"row {self.row}: {self.message}"
+
+
+@dataclass
+class ImportResult:
+    kind: str
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    duplicates: int = 0
+    problems: List[Problem] = field(default_factory=list)
+
+    @property
+    def imported(self):
+        return len(self.added) + len(self.updated)
+
+
+def _normalise_column(name):
+    return str(name or "").strip().lower().replace(" ", "_")
+
+
+def _stream_rows(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("Reading .xlsx datasheets needs openpyxl: pip install openpyxl") from None
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as file:
+            yield from csv.reader(file)
+
+
+def read_datasheet(path):
+    """Yield (row number, {column: value}) for the filled rows of a datasheet.
+
+    Raises ValueError when the name or length column is missing.
+    """
+    rows = _stream_rows(path)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = [_COLUMNS.get(_normalise_column(name)) for name in header]
+    missing = [name for name in ("name", "length") if name not in columns]
+    if missing:
+        raise ValueError(f"{path}: missing column(s): {', '.join(missing)}")
+    for number, row in enumerate(rows, start=2):
+        if not any(str(value or "").strip() for value in row):
+            continue  # Skip blank rows
+        yield number, {column: value for column, value in zip(columns, row) if column}
+
+
+def _millimetres(record, column):
+    value = record.get(column)
+    text = "" if value is None else str(value).strip()
+    if not text:
+        return None
+    try:
+        number = float(text)
+    except ValueError:
+        raise ValueError(f"{column} is not a number: {text!r}") from None
+    # Spreadsheets like to store whole numbers as 180.0
+    if not number.is_integer():
+        raise ValueError(f"{column} must be whole millimetres, got {text}")
+    if abs(number) > MAX_MILLIMETRES:
+        raise ValueError(f"{column} is out of range: {text} mm, at most {MAX_MILLIMETRES} mm")
+    return int(number)
+
+
+def check_model(kind, record):
+    """Return (name, dimensions, brand) for one datasheet row; raises ValueError naming what is wrong."""
+    name = " ".join(str(record.get("name") or "").split())
+    if not name:
+        raise ValueError("name is empty")
+    length = _millimetres(record, "length")
+    if length is None or length <= 0:
+        raise ValueError("length must be a positive number")
+    dimensions = {"length": length}
+    if kind != "concealeds":
+        bottom = _millimetres(record, "offset_bottom")
+        top = _millimetres(record, "offset_top")
+        if bottom is None or top is None:
+            raise ValueError("offset_bottom and offset_top are required")
+        if bottom < 0 or top < 0:
+            raise ValueError("offsets cannot be negative")
+        if bottom + top != length:
+            raise ValueError(f"offset_bottom + offset_top ({bottom} + {top}) is not the length ({length})")
+        dimensions.update(offset_bottom=bottom, offset_top=top)
+    brand = str(record.get("brand") or "").strip() or None
+    return name, dimensions, brand
+
+
+def import_datasheet(path, kind, store=None, update=True, dry_run=False):
+    """Check a datasheet and add its models to catalog ``kind`` in one transaction.
+
+    With ``dry_run`` nothing is written; the result tells what would be.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown catalog: {kind!r}")
+    store = store or catalog_store()
+    existing = store.load(kind)
+    brands = store.load_brands(kind)
+    names = {normalize(name): name for name in existing}
+    result = ImportResult(kind)
+    seen = {}
+    changes = {}
+    for number, record in read_datasheet(path):
+        try:
+            name, dimensions, brand = check_model(kind, record)
+        except ValueError as e:
+            result.problems.append(Problem(number, str(e)))
+            continue
+        key = normalize(name)
+        if key in seen:
+            first, first_dimensions, first_brand = seen[key]
+            if (first_dimensions, first_brand) == (dimensions, brand):
+                result.duplicates += 1
+            else:
+                result.problems.append(Problem(number, f"{name} repeats row {first} with other values"))
+            continue
+        seen[key] = number, dimensions, brand
+        current = names.get(key)
+        if current is None:
+            changes[name] = dict(dimensions, brand=brand) if brand else dimensions
+            result.added.append(name)
+        elif existing[current] == dimensions and brand in (None, brands[current]):
+            result.unchanged += 1
+        elif update:
+            # Without a brand column the model keeps the brand it has
+            changes[current] = dict(dimensions, brand=brand or brands[current])
+            result.updated.append(current)
+        else:
+            result.problems.append(Problem(number, f"{name} is already in the catalog with other values"))
+    if changes and not dry_run:
+        store.apply(kind, changes)
+    return result
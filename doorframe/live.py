@@ -0,0 +1,64 @@
+"""Live preview: recalculate while the operator types.
+
+LivePreview keeps the last spec, result and diagram. update() looks the
+edited spec fields up in engine.DEPENDENCIES and compares only the
+outputs they can change. The diagram is repainted in place: only the
+labels whose text changed are drawn again. Layout fields (category, door
+type, lock, closer, ...) still redraw the whole diagram.
+
+The calculation itself is one call to engine.calculate(), which takes
+microseconds; the graph decides what has to be shown again.
+"""
+from dataclasses import fields
+
+from .batch import BatchResult, JobLine, consolidate
+from .diagram import DISPLAY_SIZE, display_image, repaint
+from .engine import DoorResult, affected_outputs, calculate, cut_list
+
+_OUTPUTS = tuple(field.name for field in fields(DoorResult) if field.name != "spec")
+
+
+class LivePreview:
+    def __init__(self, catalogs=None, size=DISPLAY_SIZE):
+        self.catalogs = catalogs
+        self.size = tuple(size)
+        self.spec = None
+        self.result = None
+        # Writable diagram of ``result``; update() changes it in place
+        self.image = None
+
+    def set_catalogs(self, catalogs):
+        """Use reloaded catalogs; the next update() compares every output again."""
+        self.catalogs = catalogs
+        self.spec = None
+
+    def update(self, spec):
+        """Show ``spec``; returns the names of the DoorResult fields that changed.
+
+        An empty tuple means nothing on screen needs to change. Raises what
+        engine.calculate() raises for specs that cannot be calculated.
+        """
+        if self.spec is None:
+            affected = None
+        else:
+            affected = affected_outputs(self.spec, spec)
+            if affected is not None and not affected:
+                self.spec = spec
+                return ()
+        result = calculate(spec, self.catalogs)
+        if self.result is None:
+            changed = _OUTPUTS
+        else:
+            changed = tuple(name for name in (_OUTPUTS if affected is None else affected)
+                            if getattr(result, name) != getattr(self.result, name))
+        if changed:
+            if self.image is None or not repaint(self.image, self.result, result, self.size):
+                self.image = display_image(result, self.size).copy()
+        self.spec, self.result = spec, result
+        return changed
+
+    @property
+    def job(self):
+        """The previewed door as a one-line BatchResult, for build_report()."""
+        lines = [JobLine(1, "", self.spec, self.result, cut_list(self.result))]
+        return BatchResult(lines, consolidate(lines))
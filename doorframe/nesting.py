@@ -0,0 +1,161 @@
+"""Guillotine 2D nesting of door panels onto plywood / fireproof board sheets.
+
+Panels are placed largest first into the free rectangle that leaves the
+least area over (best area fit), and every placement splits the rectangle
+with one straight cut, so each layout can be cut on a panel saw. Free
+rectangles stay available on every open sheet, so later small panels reuse
+the offcuts of earlier sheets before a new sheet is opened.
+"""
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .cutting import DEFAULT_KERF
+
+# Standard sheet size, width x height (mm); the grain runs along the height
+SHEET_SIZE = (1220, 2440)
+# Offcuts smaller than this on either side are not worth keeping (mm)
+MIN_OFFCUT = 100
+# Whether each sheet material has a grain; fireproof board panels may be turned
+GRAIN = {"plywood_dimensions": True, "xisuangai": False}
+
+
+@dataclass(frozen=True)
+class Placement:
+    """A panel on a sheet. ``width``/``height`` are as laid out on the sheet."""
+    x: float
+    y: float
+    width: float
+    height: float
+    rotated: bool
+
+
+@dataclass(frozen=True)
+class Sheet:
+    width: float
+    height: float
+    placements: Tuple[Placement, ...]
+    # Usable leftover rectangles as (x, y, width, height)
+    offcuts: Tuple[Tuple[float, float, float, float], ...]
+    # True when the sheet is a stock offcut passed in, not a new sheet
+    from_stock: bool = False
+
+    @property
+    def utilisation(self):
+        used = sum(p.width * p.height for p in self.placements)
+        return used / (self.width * self.height) * 100
+
+
+@dataclass(frozen=True)
+class NestingPlan:
+    kerf: float
+    sheets: List[Sheet]
+    # (width, height, count) of panels larger than any sheet
+    unplaced: List[Tuple[float, float, int]]
+
+    @property
+    def sheet_count(self):
+        """New sheets to buy; reused stock offcuts are not counted."""
+        return sum(1 for sheet in self.sheets if not sheet.from_stock)
+
+    @property
+    def utilisation(self):
+        area = sum(sheet.width * sheet.height for sheet in self.sheets)
+        if not area:
+            return 0.0
+        used = sum(p.width * p.height for sheet in self.sheets for p in sheet.placements)
+        return used / area * 100
+
+
+class _OpenSheet:
+    def __init__(self, width, height, kerf, from_stock=False):
+        self.width = width
+        self.height = height
+        self.from_stock = from_stock
+        # Free rectangles grow by one kerf: the last cut against an edge needs none
+        self.free = [(0, 0, width + kerf, height + kerf)]
+        self.placements = []
+
+
+def _fits(panel_width, panel_height, rect):
+    return panel_width <= rect[2] and panel_height <= rect[3]
+
+
+def _place(sheet, index, x, y, width, height, kerf, rotated):
+    """Put a panel in free rectangle ``index`` and split the rest with one cut."""
+    fx, fy, fw, fh = sheet.free.pop(index)
+    used_w, used_h = width + kerf, height + kerf
+    leftover_w, leftover_h = fw - used_w, fh - used_h
+    # Cut along the shorter leftover so the bigger offcut stays in one piece
+    if leftover_w < leftover_h:
+        right = (fx + used_w, fy, leftover_w, used_h)
+        top = (fx, fy + used_h, fw, leftover_h)
+    else:
+        right = (fx + used_w, fy, leftover_w, fh)
+        top = (fx, fy + used_h, used_w, leftover_h)
+    for rect in (right, top):
+        if rect[2] > kerf and rect[3] > kerf:
+            sheet.free.append(rect)
+    sheet.placements.append(Placement(x, y, width, height, rotated))
+
+
+def _best_fit(sheets, width, height, kerf, rotate):
+    """Return (sheet, free index, rotated) of the tightest free rectangle."""
+    best = None
+    best_score = None
+    orientations = [(width, height, False)]
+    if rotate and width != height:
+        orientations.append((height, width, True))
+    for sheet in sheets:
+        for index, rect in enumerate(sheet.free):
+            for w, h, rotated in orientations:
+                if _fits(w + kerf, h + kerf, rect):
+                    score = (rect[2] * rect[3] - (w + kerf) * (h + kerf), min(rect[2] - w, rect[3] - h))
+                    if best_score is None or score < best_score:
+                        best, best_score = (sheet, index, rotated), score
+    return best
+
+
+def nest_panels(panels, sheet_size=SHEET_SIZE, kerf=DEFAULT_KERF, grain=True, stock_offcuts=()):
+    """Nest ``panels`` onto sheets and return a NestingPlan.
+
+    ``panels`` is an iterable of (width, height, count); heights run along
+    the sheet's height. With ``grain`` panels keep that direction, otherwise
+    they may be turned 90 degrees. ``stock_offcuts`` are (width, height)
+    leftovers from earlier jobs, filled before any new sheet is opened.
+    """
+    sheet_width, sheet_height = sheet_size
+    sheets = [_OpenSheet(width, height, kerf, from_stock=True) for width, height in stock_offcuts]
+    unplaced = []
+    queue = []
+    for width, height, count in panels:
+        if count <= 0 or width <= 0 or height <= 0:
+            continue
+        fits_plain = width <= sheet_width and height <= sheet_height
+        fits_turned = not grain and height <= sheet_width and width <= sheet_height
+        if not (fits_plain or fits_turned):
+            unplaced.append((width, height, count))
+            continue
+        queue.extend([(width, height)] * count)
+    # Largest panels first, longest side breaking ties
+    queue.sort(key=lambda panel: (panel[0] * panel[1], max(panel)), reverse=True)
+
+    for width, height in queue:
+        spot = _best_fit(sheets, width, height, kerf, rotate=not grain)
+        if spot is None:
+            sheets.append(_OpenSheet(sheet_width, sheet_height, kerf))
+            spot = _best_fit(sheets[-1:], width, height, kerf, rotate=not grain)
+        sheet, index, rotated = spot
+        x, y = sheet.free[index][:2]
+        if rotated:
+            width, height = height, width
+        _place(sheet, index, x, y, width, height, kerf, rotated)
+
+    done = []
+    for sheet in sheets:
+        if not sheet.placements:
+            continue
+        offcuts = tuple(sorted(
+            ((x, y, w - kerf, h - kerf) for x, y, w, h in sheet.free if min(w, h) - kerf >= MIN_OFFCUT),
+            key=lambda rect: rect[2] * rect[3], reverse=True))
+        done.append(Sheet(sheet.width, sheet.height, tuple(sheet.placements), offcuts, sheet.from_stock))
+    return NestingPlan(kerf, done, unplaced)
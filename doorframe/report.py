@@ -0,0 +1,387 @@
+"""The material report as data: typed rows built once, then rendered.
+
+build_report() walks a calculated job and returns a Report, a flat list
+of rows: headings, door information, one PieceRow per piece class with
+its counts, lengths and stock boards, totals and the cutting plan. The
+text, CSV, JSON and HTML renderers only look labels up in a translation
+table, so one Report can be written in every language and format without
+calculating anything again.
+"""
+import csv
+import html
+import io
+import json
+import math
+from dataclasses import asdict, dataclass
+from typing import List, Tuple, Union
+
+from .engine import BOTTOM, BOX_LOCK, ELECTRIC_LOCK, FIREPROOF, HONEYCOMB_BOARD, HONEYCOMB_PAPER, MODE_UB, SIMPLE, \
+    STOCK_LENGTH, TOP, YIPAIYIKONG, sheet_panels
+from .nesting import GRAIN
+
+
+@dataclass(frozen=True)
+class Heading:
+    """Start of a section: the report title (``key``) or a job line (``text``)."""
+    key: str = ""
+    text: str = ""
+
+
+@dataclass(frozen=True)
+class PlanHeading:
+    """Start of the cutting plan."""
+    stock_length: float
+    kerf: float
+
+
+@dataclass(frozen=True)
+class Info:
+    """A labelled value. With ``translate`` the value is a translation key too."""
+    key: str
+    value: Union[str, float]
+    unit: str = ""
+    translate: bool = False
+
+
+@dataclass(frozen=True)
+class Note:
+    key: str
+
+
+@dataclass(frozen=True)
+class PieceRow:
+    """All pieces of one class of one job line."""
+    row: int
+    # Translation keys: the piece class, its report section and its length label
+    piece: str
+    section: str
+    length_label: str
+    width: float
+    length: float
+    per_door: int
+    total: int
+    total_length: float
+    # Stock boards the pieces would need on their own
+    boards: int
+
+
+@dataclass(frozen=True)
+class Total:
+    key: str
+    value: float
+    unit: str = ""
+
+
+@dataclass(frozen=True)
+class PatternRow:
+    """``count`` boards of ``width`` cut into ``cuts``."""
+    width: float
+    count: int
+    cuts: Tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class OversizeRow:
+    """Pieces longer than the stock boards."""
+    width: float
+    length: float
+    count: int
+
+
+@dataclass(frozen=True)
+class SheetRow:
+    key: str
+    sheet_count: int
+    utilisation: float
+    # (width, height, count) of panels larger than a sheet
+    unplaced: Tuple[Tuple[float, float, int], ...] = ()
+
+
+Row = Union[Heading, Info, Note, PieceRow, Total, PlanHeading, PatternRow, OversizeRow, SheetRow]
+
+
+@dataclass(frozen=True)
+class Report:
+    rows: List[Row]
+
+    @property
+    def pieces(self):
+        return [row for row in self.rows if isinstance(row, PieceRow)]
+
+
+# Piece name -> (report section, label of its length)
+_PIECE_LABELS = {
+    "vertical_pieces": ("vertical_pieces", "length_each_piecev"),
+    "right_vertical_pieces": ("right_vertical_pieces", "length_each_piecev"),
+    "left_vertical_pieces": ("left_vertical_pieces", "length_each_piecev"),
+    "outer_wood_upper_part": ("left_vertical_pieces", "outer_wood_upper_part"),
+    "inner_wood_upper_part": ("left_vertical_pieces", "inner_wood_upper_part"),
+    "outer_wood_bottom_part": ("left_vertical_pieces", "outer_wood_bottom_part"),
+    "inner_wood_bottom_part": ("left_vertical_pieces", "inner_wood_bottom_part"),
+    "horizontal_pieces": ("horizontal_pieces", "length_each_pieceh"),
+    "upper_horizontal_pieces": ("upper_horizontal_pieces", "length_each_pieceh"),
+    "lower_horizontal_pieces": ("lower_horizontal_pieces", "length_each_pieceh"),
+    "very_upper_horizontal_piece_length": ("horizontal_pieces", "very_upper_horizontal_piece_length"),
+    "reinforce_concealed_wood_length": ("horizontal_pieces", "reinforce_concealed_wood_length"),
+    "slats_length": ("slats_count", "slats_length"),
+    "gap_wood_lock": ("gap_wood_lock", "gap_wood_lock_length"),
+}
+
+
+def _door_info(result):
+    """Information rows describing one door, like the head of the GUI report."""
+    spec = result.spec
+    rows = []
+    if spec.category != FIREPROOF:
+        rows.append(Info("structure_type", spec.structure_type, translate=True))
+    rows += [Info("door_type", spec.door_type, translate=True), Info("num_doors", result.num_doors)]
+    for name, width, height in sheet_panels(result):
+        rows.append(Info(name, f"{width:g} mm x {height:g} mm"))
+    if spec.category == FIREPROOF and spec.mode == MODE_UB:
+        rows += [Info("max_height", result.max_height, "mm"), Info("min_height", result.min_height, "mm")]
+    rows.append(Info("edge_sealing", result.edge_sealing_type))
+    if spec.door_type == ELECTRIC_LOCK:
+        rows += [Info("electric_lock", result.electric_lock_name),
+                 Info("electric_lock_height", result.electric_lock_height, "mm")]
+    elif spec.door_type == BOX_LOCK:
+        rows += [Info("box_lock", result.box_lock_name), Info("box_lock_height", result.box_lock_height, "mm")]
+    if result.lock_direction:
+        rows.append(Info("direction", result.lock_direction, translate=True))
+    if result.has_concealed_closer:
+        rows.append(Info("concealed_door_closer", result.concealed_door_closer_name))
+    if spec.category != FIREPROOF:
+        if spec.structure_type == YIPAIYIKONG:
+            rows.append(Info("gap_width", result.gap_width, "mm"))
+        elif spec.structure_type in (HONEYCOMB_BOARD, HONEYCOMB_PAPER):
+            if result.gap_length:
+                rows.append(Info("gap_length", result.gap_length, "mm"))
+            else:
+                rows += [Info("reinforce_wood", result.reinforce_wood, "mm"),
+                         Info("gap_length_upper", result.gap_length_upper, "mm"),
+                         Info("gap_length_bottom", result.gap_length_bottom, "mm")]
+    return rows
+
+
+def build_report(job, plan=None, sheets=(), stock_length=STOCK_LENGTH):
+    """Build the Report of a calculated BatchResult.
+
+    ``plan`` (a CuttingPlan) and ``sheets`` ((name, NestingPlan) pairs) add
+    the job's board count, cutting patterns and sheet counts.
+    """
+    rows = [Heading(key="app_title")]
+    for line in job.lines:
+        if len(job.lines) > 1 or line.mark:
+            rows.append(Heading(text=f"#{line.row}" + (f" {line.mark}" if line.mark else "")))
+        rows += _door_info(line.result)
+        doors = line.spec.num_doors
+        line_length = 0
+        for piece in line.pieces:
+            section, length_label = _PIECE_LABELS.get(piece.name, (piece.name, piece.name))
+            total_length = piece.length * piece.count * doors
+            line_length += total_length
+            rows.append(PieceRow(line.row, piece.name, section, length_label, piece.width, piece.length,
+                                 piece.count, piece.count * doors, total_length,
+                                 math.ceil(total_length / stock_length) if stock_length else 0))
+        if line.spec.structure_type == YIPAIYIKONG and line.spec.category != FIREPROOF:
+            rows.append(Note("yipaiyikong_note"))
+        if len(job.lines) > 1:
+            rows.append(Total("total_wood_length", line_length, "mm"))
+
+    rows.append(Total("total_wood_length", job.total_length, "mm"))
+    if plan is not None:
+        rows.append(Total("total_wood", plan.boards_needed))
+        rows.append(PlanHeading(plan.stock_length, plan.kerf))
+        rows += [PatternRow(board.width, count, board.cuts) for board, count in plan.patterns()]
+        rows += [OversizeRow(width, length, count) for width, length, count in plan.oversize]
+        rows.append(Info("waste", round(plan.waste_percent, 1), "%"))
+    for name, sheet_plan in sheets:
+        rows.append(SheetRow(name, sheet_plan.sheet_count, round(sheet_plan.utilisation, 1),
+                             tuple(sheet_plan.unplaced)))
+    return Report(rows)
+
+
+def _number(value):
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class _Labels:
+    """Translation lookups. Without translations the keys are the labels."""
+
+    def __init__(self, translations):
+        self.translations = translations
+
+    def __call__(self, key):
+        if self.translations is None:
+            return key
+        try:
+            return self.translations[key]
+        except KeyError:
+            raise ValueError(f"translations: missing {key!r}") from None
+
+    def value(self, value):
+        """An option value; one without a translation (e.g. typed into a job sheet) is shown as it is."""
+        if self.translations is None:
+            return value
+        return self.translations.get(value, value)
+
+
+# Text style of a line, by the translation key of its label; the GUI configures a Text tag per style
+STYLES = {
+    "app_title": "blackbold",
+    "door_type": "black", "electric_lock": "black", "electric_lock_height": "black",
+    "plywood_dimensions": "khaki", "xisuangai": "khaki",
+    "length_each_piecev": "blue", "length_each_pieceh": "red", "slats_length": "red",
+    "outer_wood_upper_part": "green", "inner_wood_upper_part": "purple",
+    "outer_wood_bottom_part": "orange", "inner_wood_bottom_part": "brown",
+    "very_upper_horizontal_piece_length": "magenta", "gap_wood_lock_length": "magenta",
+    "slats_count": "slategray", "reinforce_wood": "green",
+    "gap_length": "brown", "gap_length_upper": "brown", "gap_length_bottom": "brown",
+    "total_wood_length": "black", "total_wood": "black",
+}
+DEFAULT_STYLE = "normal"
+
+# Every translation key the renderers look up; the translations build checks them (see translations)
+REPORT_KEYS = frozenset(
+    {"app_title", "structure_type", "door_type", "num_doors", "max_height", "min_height", "edge_sealing",
+     "electric_lock", "electric_lock_height", "box_lock", "box_lock_height", "direction", "concealed_door_closer",
+     "gap_width", "gap_length", "reinforce_wood", "gap_length_upper", "gap_length_bottom", "yipaiyikong_note",
+     "total_wood_length", "total_wood", "waste", "num_pieces_per_door", "total_num_pieces", "cutting_plan",
+     "kerf", "oversize_pieces", "sheets", "panels_larger_than_sheet", "width", "length",
+     HONEYCOMB_PAPER, YIPAIYIKONG, HONEYCOMB_BOARD, SIMPLE, ELECTRIC_LOCK, BOX_LOCK, TOP, BOTTOM}
+    | set(_PIECE_LABELS) | {key for labels in _PIECE_LABELS.values() for key in labels} | set(STYLES) | set(GRAIN))
+
+
+def render_spans(report, translations=None):
+    """The text report as (text, style) spans, one per line, for a Tk Text widget."""
+    label = _Labels(translations)
+    spans = []
+
+    def line(text, key=None):
+        spans.append((text + "\n", STYLES.get(key, DEFAULT_STYLE)))
+
+    for row in report.rows:
+        if isinstance(row, Heading):
+            if row.key:
+                line(label(row.key), row.key)
+            else:
+                line("")
+                line(row.text)
+        elif isinstance(row, Info):
+            value = label.value(row.value) if row.translate else _number(row.value)
+            line(f"‣ {label(row.key)}\t: {value}{' ' + row.unit if row.unit else ''}", row.key)
+        elif isinstance(row, Note):
+            line(f"‣ {label(row.key)}", row.key)
+        elif isinstance(row, PieceRow):
+            line(f"‣ {label(row.section)} ({row.width:g} mm):", row.section)
+            line(f"  • {label(row.length_label)}\t: {row.length:g} mm", row.length_label)
+            line(f"  • {label('num_pieces_per_door')}\t: {row.per_door}")
+            line(f"  • {label('total_num_pieces')}\t: {row.total}")
+            line(f"  • {label('total_wood_length')}\t: {row.total_length:.2f} mm", "total_wood_length")
+            line(f"  • {label('total_wood')}\t: {row.boards}", "total_wood")
+        elif isinstance(row, Total):
+            value = f"{row.value:.2f}" if row.unit == "mm" else _number(row.value)
+            line("")
+            line(f"‣ {label(row.key)}\t: {value}{' ' + row.unit if row.unit else ''}", row.key)
+        elif isinstance(row, PlanHeading):
+            line("")
+            line(f"‣ {label('cutting_plan')} ({row.stock_length:g} mm, {label('kerf')} {row.kerf:g} mm):")
+        elif isinstance(row, PatternRow):
+            line(f"  • {row.width:g} mm x {row.count}\t: {' + '.join(f'{cut:g}' for cut in row.cuts)} mm")
+        elif isinstance(row, OversizeRow):
+            line(f"  • {label('oversize_pieces')} ({row.width:g} mm x {row.count})\t: {row.length:g} mm")
+        elif isinstance(row, SheetRow):
+            line(f"‣ {label(row.key)}\t: {row.sheet_count} {label('sheets')} ({row.utilisation:.1f} %)", row.key)
+            for width, height, count in row.unplaced:
+                line(f"  • {label('panels_larger_than_sheet')} ({count})\t: {width:g} x {height:g} mm")
+    return spans
+
+
+def merge_spans(spans):
+    """Join neighbouring spans of the same style, so a Text widget gets fewer tag ranges."""
+    merged = []
+    for text, style in spans:
+        if merged and merged[-1][1] == style:
+            merged[-1] = (merged[-1][0] + text, style)
+        else:
+            merged.append((text, style))
+    return merged
+
+
+def render_text(report, translations=None):
+    """Plain text in the layout of the GUI report."""
+    return "".join(text for text, _ in render_spans(report, translations))[:-1]
+
+
+def render_csv(report, translations=None):
+    """One CSV row per piece class and job line, for spreadsheets."""
+    label = _Labels(translations)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["row", "piece", "width", "length", "per_door", "total", "total_length", "boards"])
+    for row in report.pieces:
+        writer.writerow([row.row, label(row.piece), f"{row.width:g}", f"{row.length:g}", row.per_door, row.total,
+                         f"{row.total_length:.2f}", row.boards])
+    return buffer.getvalue()
+
+
+def render_json(report):
+    """The rows as a JSON list, each with a ``type``; labels stay translation keys."""
+    return json.dumps([dict(type=type(row).__name__, **asdict(row)) for row in report.rows],
+                      ensure_ascii=False, indent=2)
+
+
+def render_html(report, translations=None):
+    """A standalone HTML page: information lists and one piece table per section."""
+    label = _Labels(translations)
+    escape = html.escape
+    out = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8">',
+           '<style>body{font-family:sans-serif}table{border-collapse:collapse;margin:.5em 0}'
+           'td,th{border:1px solid #999;padding:2px 8px;text-align:right}td:first-child{text-align:left}</style>',
+           '</head><body>']
+    # Row type of the open table, if any; consecutive piece or pattern rows share one table
+    table = None
+
+    for row in report.rows:
+        if table is not None and not isinstance(row, table):
+            out.append('</table>')
+            table = None
+        if isinstance(row, Heading):
+            out.append(f'<h1>{escape(label(row.key))}</h1>' if row.key else f'<h2>{escape(row.text)}</h2>')
+        elif isinstance(row, Info):
+            value = label.value(row.value) if row.translate else _number(row.value)
+            out.append(f'<p><b>{escape(label(row.key))}</b>: {escape(str(value))} {escape(row.unit)}</p>')
+        elif isinstance(row, Note):
+            out.append(f'<p><i>{escape(label(row.key))}</i></p>')
+        elif isinstance(row, PieceRow):
+            if table is None:
+                headers = ["width", "length", "num_pieces_per_door", "total_num_pieces", "total_wood_length",
+                           "total_wood"]
+                out.append('<table><tr><th></th>' + "".join(f'<th>{escape(label(key))}</th>' for key in headers)
+                           + '</tr>')
+                table = PieceRow
+            out.append(f'<tr><td>{escape(label(row.length_label))}</td><td>{row.width:g}</td><td>{row.length:g}</td>'
+                       f'<td>{row.per_door}</td><td>{row.total}</td><td>{row.total_length:.2f}</td>'
+                       f'<td>{row.boards}</td></tr>')
+        elif isinstance(row, Total):
+            value = f"{row.value:.2f}" if row.unit == "mm" else _number(row.value)
+            out.append(f'<p><b>{escape(label(row.key))}: {value} {escape(row.unit)}</b></p>')
+        elif isinstance(row, PlanHeading):
+            out.append(f'<h2>{escape(label("cutting_plan"))} ({row.stock_length:g} mm, {escape(label("kerf"))} '
+                       f'{row.kerf:g} mm)</h2>')
+        elif isinstance(row, PatternRow):
+            if table is None:
+                out.append('<table>')
+                table = PatternRow
+            cuts = " + ".join(f"{cut:g}" for cut in row.cuts)
+            out.append(f'<tr><td>{row.width:g} mm x {row.count}</td><td>{cuts} mm</td></tr>')
+        elif isinstance(row, OversizeRow):
+            out.append(f'<p>{escape(label("oversize_pieces"))} ({row.width:g} mm x {row.count}): {row.length:g} mm</p>')
+        elif isinstance(row, SheetRow):
+            out.append(f'<p><b>{escape(label(row.key))}</b>: {row.sheet_count} {escape(label("sheets"))} '
+                       f'({row.utilisation:.1f} %)</p>')
+            for width, height, count in row.unplaced:
+                out.append(f'<p>{escape(label("panels_larger_than_sheet"))} ({count}): {width:g} x {height:g} mm</p>')
+    if table is not None:
+        out.append('</table>')
+    out.append('</body></html>')
+    return "\n".join(out) + "\n"
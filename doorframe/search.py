@@ -0,0 +1,109 @@
+"""Type-ahead search over catalog model names.
+
+A CatalogIndex is built once per catalog (a few milliseconds for hundreds
+of models) and answers each keystroke from memory. Names and queries are
+compared in a folded form: NFKC turns full-width letters, digits and
+spaces into their half-width forms, then case is folded, so "ｃｉｓａ",
+"CISA" and "Cisa" are the same. Matches are ranked:
+
+0. the whole name
+1. a prefix of the name
+2. every query word a prefix of some word of the name ("miwa al3" finds
+   "MIWA AL3M"; CJK and Latin runs count as separate words)
+3. a substring, ignoring spaces and punctuation, found through a bigram
+   index ("easykey" finds "飛利浦 EASY KEY ALPHA-VP")
+4. fuzzy: enough shared bigrams to be a likely typo ("cisa 57210")
+
+Within a rank the catalog order is kept.
+"""
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+# Shortest share of the query's bigrams (Dice coefficient) a fuzzy match needs
+FUZZY_THRESHOLD = 0.5
+_WORD = re.compile(r"[0-9a-z]+|[^\W0-9a-z_]+")
+
+
+def normalize(text):
+    """Fold width, case and spacing: "ＣＩＳＡ　５２７１０" -> "cisa 52710"."""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def _words(key):
+    return _WORD.findall(key)
+
+
+def _compact(key):
+    return "".join(_words(key))
+
+
+def _bigrams(compact):
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+class CatalogIndex:
+    def __init__(self, names):
+        self.names = list(names)
+        self._keys = [normalize(name) for name in self.names]
+        self._compacts = [_compact(key) for key in self._keys]
+        # (word, position) sorted, for word-prefix lookups by bisection
+        self._words = sorted({(word, position) for position, key in enumerate(self._keys) for word in _words(key)})
+        self._grams = defaultdict(set)
+        self._gram_counts = []
+        for position, compact in enumerate(self._compacts):
+            grams = _bigrams(compact)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._grams[gram].add(position)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _word_prefix(self, word):
+        found = set()
+        start = bisect_left(self._words, (word,))
+        for indexed, position in self._words[start:]:
+            if not indexed.startswith(word):
+                break
+            found.add(position)
+        return found
+
+    def search(self, query, limit=None):
+        """Names matching ``query``, best first; every name for an empty query."""
+        key = normalize(query)
+        compact = _compact(key)
+        if not compact:
+            return self.names[:limit]
+        ranks = {}
+
+        def rank(positions, value):
+            for position in positions:
+                ranks.setdefault(position, value)
+
+        rank((p for p, k in enumerate(self._keys) if k == key), (0, 0))
+        rank((p for p, k in enumerate(self._keys) if k.startswith(key)), (1, 0))
+        words = _words(key)
+        matched = self._word_prefix(words[0])
+        for word in words[1:]:
+            matched &= self._word_prefix(word)
+        rank(matched, (2, 0))
+        grams = _bigrams(compact)
+        if grams:
+            # Candidates hold every bigram of the query; the substring check confirms the order
+            candidates = set.intersection(*(self._grams.get(gram, set()) for gram in grams))
+        else:
+            candidates = range(len(self.names))
+        rank((p for p in candidates if compact in self._compacts[p]), (3, 0))
+        if grams:
+            shared = defaultdict(int)
+            for gram in grams:
+                for position in self._grams.get(gram, ()):
+                    shared[position] += 1
+            for position, count in shared.items():
+                score = 2 * count / (len(grams) + self._gram_counts[position])
+                if score >= FUZZY_THRESHOLD:
+                    ranks.setdefault(position, (4, -score))
+        ordered = sorted(ranks, key=lambda position: (ranks[position], position))
+        return [self.names[position] for position in ordered[:limit]]
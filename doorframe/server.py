@@ -0,0 +1,195 @@
+"""Local HTTP JSON service: ``python -m doorframe.server``.
+
+POST a door spec (an object), a list of specs, or ``{"specs": [...]}``
+with plan options to ``/calculate`` and get back the same document as
+``python -m doorframe --format json``: every line with its pieces, the
+consolidated cut list, the cutting plan and the sheet nesting.
+
+Requests are calculated in a process pool so a large batch or an exact
+cutting plan never holds up the single-door requests of other clients.
+Every worker loads the lock and closer catalogs when it starts and again
+when catalog.db has changed since (one stat per request), so models added
+at a station are used without a restart.
+``GET /health`` answers ``{"status": "ok"}``.
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .batch import calculate_batch, read_records
+from .catalog import catalog_store
+from .cutting import DEFAULT_KERF
+from .engine import STOCK_LENGTH
+from .nesting import SHEET_SIZE
+from .watch import file_stamp
+
+DEFAULT_PORT = 8080
+# Requests larger than this are refused (bytes)
+MAX_BODY = 4 * 1024 * 1024
+# Upper limit for the exact cutting plan search, so one request cannot tie up a worker
+MAX_TIME_BUDGET = 5.0
+_OPTIONS = {"stock_length": STOCK_LENGTH, "kerf": DEFAULT_KERF, "exact": False, "time_budget": 1.0,
+            "sheet_size": SHEET_SIZE}
+
+
+# The catalogs of this worker process and the catalog.db stamp they were loaded at
+_catalogs = None
+_catalogs_stamp = None
+
+
+def worker_catalogs():
+    """This worker's catalogs, read again when catalog.db has changed."""
+    global _catalogs, _catalogs_stamp
+    store = catalog_store()
+    stamp = file_stamp(store.path)
+    if _catalogs is None or stamp != _catalogs_stamp:
+        try:
+            _catalogs = store.load_all()
+        except sqlite3.Error:
+            if _catalogs is None:
+                raise
+            # Locked or being replaced; keep the old ones and try again on the next request
+        else:
+            _catalogs_stamp = stamp
+    return _catalogs
+
+
+def _init_worker():
+    worker_catalogs()
+
+
+def _number(options, name, positive=False):
+    value = options[name]
+    if (isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value)
+            or value < 0 or (positive and value == 0)):
+        raise ValueError(f"{name} must be a {'positive' if positive else 'non-negative'} number")
+    return value
+
+
+def parse_request(document):
+    """Split a request body into (spec records, plan options)."""
+    if isinstance(document, dict) and "specs" in document:
+        records = document["specs"]
+        unknown = sorted(set(document) - set(_OPTIONS) - {"specs"})
+        if unknown:
+            raise ValueError(f"unknown option(s): {', '.join(unknown)}")
+        options = dict(_OPTIONS, **{name: value for name, value in document.items() if name in _OPTIONS})
+    else:
+        records = document
+        options = dict(_OPTIONS)
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list) or not records:
+        raise ValueError("expected a door spec object, a list of specs or {\"specs\": [...]}")
+
+    _number(options, "stock_length", positive=True)
+    for name in ("kerf", "time_budget"):
+        _number(options, name)
+    options["time_budget"] = min(options["time_budget"], MAX_TIME_BUDGET)
+    if not isinstance(options["exact"], bool):
+        raise ValueError("exact must be true or false")
+    sheet_size = options["sheet_size"]
+    if not isinstance(sheet_size, (list, tuple)) or len(sheet_size) != 2:
+        raise ValueError("sheet_size must be [width, height]")
+    options["sheet_size"] = tuple(_number({"sheet_size": value}, "sheet_size", positive=True) for value in sheet_size)
+    return records, options
+
+
+def calculate_request(document):
+    """Calculate one parsed request body; runs in a pool worker."""
+    records, options = parse_request(document)
+    job = calculate_batch(read_records(records, "request"), worker_catalogs())
+    plan = job.cutting_plan(options["stock_length"], options["kerf"], options["exact"], options["time_budget"])
+    return job.to_dict(plan, job.sheet_plans(options["sheet_size"], options["kerf"]))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections open: tablets and the ERP send many small requests
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this Nagle adds ~40 ms
+    disable_nagle_algorithm = True
+
+    def _send(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            self._send(413, {"error": "Request too large"})
+            return
+        body = self.rfile.read(length)
+        if self.path != "/calculate":
+            self._send(404, {"error": f"Not found: {self.path}"})
+            return
+        try:
+            document = json.loads(body)
+            data = self.server.pool.submit(calculate_request, document).result()
+        except (ValueError, TypeError, ArithmeticError) as e:
+            # Bad JSON, a bad option or a spec the engine cannot calculate
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send(200, data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=DEFAULT_PORT, workers=None, verbose=False):
+    """Create the HTTP server and its worker pool, with every worker started."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    workers = workers or os.cpu_count()
+    server.pool = ProcessPoolExecutor(workers, initializer=_init_worker)
+    # The pool starts a process per submit while none is idle; start them all now, not on the first requests
+    for future in [server.pool.submit(_init_worker) for _ in range(workers)]:
+        future.result()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m doorframe.server",
+                                     description="Serve door frame calculations as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--verbose", action="store_true", help="log every request to stderr")
+    args = parser.parse_args(argv)
+    try:
+        server = make_server(args.host, args.port, args.workers, args.verbose)
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(f"Serving on http://{args.host}:{server.server_address[1]}/calculate", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
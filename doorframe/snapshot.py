@@ -0,0 +1,163 @@
+"""Content-hashed catalog snapshots pinned to saved jobs.
+
+A job saved with save_job() keeps the catalogs it was calculated with, so
+editing a lock later never changes the cut lengths of an old order. Each
+catalog is frozen into a CatalogSnapshot named by the SHA-256 of its
+canonical JSON and written once to ``snapshots/<digest>.json`` next to the
+job file; the job itself only names the three digests:
+
+    {"catalogs": {"electric_locks": "9f2c...", "box_locks": "...", "concealeds": "..."},
+     "lines": [{"row": 2, "mark": "D1", "spec": {...}}, ...]}
+
+Jobs pinned to the same catalog share one file on disk and, while any of
+them is loaded, one read-only snapshot in memory: snapshots are interned
+by digest, and a digest already loaded is resolved without reading the
+file again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Mapping
+from dataclasses import asdict
+from types import MappingProxyType
+
+from .batch import calculate_batch
+from .catalog import KINDS, Catalogs
+from .engine import DoorSpec, default_catalogs
+
+SNAPSHOT_DIR = "snapshots"
+
+_interned = weakref.WeakValueDictionary()
+_intern_lock = threading.Lock()
+
+
+class CatalogSnapshot(Mapping):
+    """One catalog, frozen: a read-only {name: {"length": ..., ...}} named by its digest."""
+
+    __slots__ = ("digest", "_models", "__weakref__")
+
+    def __init__(self, digest, models):
+        self.digest = digest
+        self._models = {name: MappingProxyType(dict(dimensions)) for name, dimensions in models.items()}
+
+    def __getitem__(self, name):
+        return self._models[name]
+
+    def __iter__(self):
+        return iter(self._models)
+
+    def __len__(self):
+        return len(self._models)
+
+    def __repr__(self):
+        return f"CatalogSnapshot({self.digest[:12]}, {len(self)} models)"
+
+
+def _canonical(models):
+    return json.dumps({name: dict(dimensions) for name, dimensions in models.items()},
+                      sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def digest_of(models):
+    """The SHA-256 of a catalog's canonical JSON: the same models give the same digest."""
+    return hashlib.sha256(_canonical(models).encode("utf-8")).hexdigest()
+
+
+def _intern(digest, models):
+    with _intern_lock:
+        snapshot = _interned.get(digest)
+        if snapshot is None:
+            snapshot = CatalogSnapshot(digest, models)
+            _interned[digest] = snapshot
+        return snapshot
+
+
+def freeze(models):
+    """The snapshot of a catalog's current content, shared with every other holder of that content."""
+    if isinstance(models, CatalogSnapshot):
+        return models
+    return _intern(digest_of(models), models)
+
+
+def pin(catalogs=None):
+    """Catalogs made of snapshots; calculate with these to get a job that save_job() can pin."""
+    if catalogs is None:
+        catalogs = default_catalogs()
+    return Catalogs(**{kind: freeze(getattr(catalogs, kind)) for kind in KINDS})
+
+
+def _write(path, document):
+    # Renamed into place, so a reader never sees half a job or snapshot
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(document, file, ensure_ascii=False, indent=1)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _snapshot_dir(job_path):
+    return os.path.join(os.path.dirname(os.path.abspath(job_path)), SNAPSHOT_DIR)
+
+
+def save_job(path, job, catalogs):
+    """Save a BatchResult with the catalogs it was calculated with (ideally pin()'s).
+
+    Returns the pinned catalogs.
+    """
+    pinned = pin(catalogs)
+    directory = _snapshot_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    for kind in KINDS:
+        snapshot = getattr(pinned, kind)
+        target = os.path.join(directory, f"{snapshot.digest}.json")
+        # Named by content: an existing file already holds exactly this catalog
+        if not os.path.exists(target):
+            _write(target, {name: dict(dimensions) for name, dimensions in snapshot.items()})
+    _write(path, {
+        "catalogs": {kind: getattr(pinned, kind).digest for kind in KINDS},
+        "lines": [{"row": line.row, "mark": line.mark, "spec": asdict(line.spec)} for line in job.lines],
+    })
+    return pinned
+
+
+def load_snapshot(directory, digest):
+    """The snapshot ``digest``, from memory or ``directory``; raises ValueError if missing or altered."""
+    snapshot = _interned.get(digest)
+    if snapshot is not None:
+        return snapshot
+    path = os.path.join(directory, f"{digest}.json")
+    try:
+        with open(path, encoding="utf-8") as file:
+            models = json.load(file)
+    except FileNotFoundError:
+        raise ValueError(f"catalog snapshot {digest} not found in {directory}") from None
+    if digest_of(models) != digest:
+        raise ValueError(f"{path} does not match its digest; the snapshot was edited")
+    return _intern(digest, models)
+
+
+def load_job(path):
+    """Read a saved job; returns (job lines for calculate_batch, pinned Catalogs)."""
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    try:
+        digests = document["catalogs"]
+        catalogs = Catalogs(**{kind: load_snapshot(_snapshot_dir(path), digests[kind]) for kind in KINDS})
+        lines = [(line["row"], line["mark"], DoorSpec(**line["spec"])) for line in document["lines"]]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{path}: not a saved job ({e})") from None
+    return lines, catalogs
+
+
+def recalculate_job(path):
+    """Calculate a saved job again with its pinned catalogs."""
+    lines, catalogs = load_job(path)
+    return calculate_batch(lines, catalogs)
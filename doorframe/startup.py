@@ -0,0 +1,157 @@
+"""Where the GUI's startup time goes, and a budget for each phase.
+
+Appmajor.py times its startup phases with phase() and since():
+
+- ``imports``: from launch until its imports are done
+- ``catalog_load`` and ``translation_load``: the module level loads
+- ``widget_build``: DoorFrameCalculator(root), the form and its menus
+- ``first_paint``: from launch until the window is drawn
+
+``python Appmajor.py --profile-startup [FILE]`` starts the GUI, writes
+the phases, together with the ``-X importtime`` data of a fresh
+``import Appmajor``, as a JSON report and quits.
+
+The first three phases need no display:
+
+    python -m doorframe.startup --runs 5 --budget imports=0.8 --report startup.json
+
+imports Appmajor in fresh interpreters and exits with status 1 when the
+median of a phase is over its budget, so a slower start fails a build
+instead of being noticed on the shop floor.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+from .catalog import application_path
+
+# Seconds; generous for the shop-floor mini-PCs, where a start takes a few times longer than on a desk
+BUDGETS = {"imports": 1.0, "catalog_load": 0.2, "translation_load": 0.2, "widget_build": 1.0, "first_paint": 1.5}
+HEADLESS_PHASES = ("imports", "catalog_load", "translation_load")
+GUI_MODULE = "Appmajor"
+
+# Phase -> seconds, in the order they were timed
+PHASES = {}
+
+
+@contextmanager
+def phase(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASES[name] = time.perf_counter() - started
+
+
+def since(name, started):
+    """Time phase ``name`` as running from ``started`` (a perf_counter() reading) until now."""
+    PHASES[name] = time.perf_counter() - started
+
+
+def over_budget(phases, budgets=None):
+    """(phase, seconds, budget) for every phase slower than its budget."""
+    budgets = BUDGETS if budgets is None else budgets
+    return [(name, seconds, budgets[name]) for name, seconds in phases.items()
+            if name in budgets and seconds > budgets[name]]
+
+
+def parse_importtime(text):
+    """The ``-X importtime`` lines of ``text`` as dicts, in import order."""
+    imports = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        name = fields[2].rstrip()
+        imports.append({"module": name.strip(), "depth": (len(name) - len(name.lstrip())) // 2,
+                        "self_us": int(fields[0]), "cumulative_us": int(fields[1])})
+    return imports
+
+
+def profile_imports(module=GUI_MODULE, directory=application_path):
+    """Import ``module`` in a fresh interpreter; returns (its import times, its PHASES).
+
+    Raises RuntimeError when the import fails.
+    """
+    import subprocess
+
+    code = f"import json, {module}; from doorframe import startup; print(json.dumps(startup.PHASES))"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=directory,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr.strip()[-2000:]}")
+    return parse_importtime(completed.stderr), json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def report(phases, imports, budgets=None):
+    """The machine-readable startup report."""
+    budgets = BUDGETS if budgets is None else budgets
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "phases": phases,
+        "budgets": {name: budgets[name] for name in phases if name in budgets},
+        "over_budget": [name for name, _, _ in over_budget(phases, budgets)],
+        "imports": imports,
+    }
+
+
+def write_report(path, document):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=1)
+
+
+def _budget(text):
+    name, _, seconds = text.partition("=")
+    try:
+        return name, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected PHASE=SECONDS, got {text!r}") from None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m doorframe.startup",
+                                     description="Time the headless startup phases of the GUI and check them "
+                                                 "against their budgets.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh imports to take the median of (default: 5)")
+    parser.add_argument("--budget", type=_budget, action="append", default=[], metavar="PHASE=SECONDS",
+                        help=f"override a budget; defaults: {', '.join(f'{n}={BUDGETS[n]:g}' for n in HEADLESS_PHASES)}")
+    parser.add_argument("--report", metavar="FILE", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    if getattr(sys, 'frozen', False):
+        print("error: the startup profile needs a Python interpreter, not the packaged app", file=sys.stderr)
+        return 2
+    unknown = [name for name, _ in args.budget if name not in BUDGETS]
+    if unknown:
+        parser.error(f"unknown phase(s): {', '.join(unknown)}; phases: {', '.join(BUDGETS)}")
+    budgets = dict(BUDGETS, **dict(args.budget))
+    runs = []
+    try:
+        for _ in range(max(1, args.runs)):
+            runs.append(profile_imports())
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    phases = {name: statistics.median(run[1][name] for run in runs) for name in HEADLESS_PHASES}
+    # The import times of the median run by total import time
+    imports = sorted(runs, key=lambda run: run[1]["imports"])[len(runs) // 2][0]
+    document = report(phases, imports, budgets)
+    if args.report:
+        write_report(args.report, document)
+    for name, seconds in phases.items():
+        print(f"{name:<17} {seconds * 1000:7.1f} ms  (budget {budgets[name] * 1000:g} ms)", file=sys.stderr)
+    for entry in sorted(imports, key=lambda entry: entry["self_us"], reverse=True)[:10]:
+        print(f"  {entry['self_us'] / 1000:6.1f} ms  {entry['module']}", file=sys.stderr)
+    for name, seconds, budget in over_budget(phases, budgets):
+        print(f"over budget: {name} took {seconds * 1000:.1f} ms, budget {budget * 1000:g} ms", file=sys.stderr)
+    return 1 if document["over_budget"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""Stress test of catalogs shared by several stations: ``python -m doorframe.stress``.
+
+Runs two checks in a scratch folder, with processes standing in for the
+stations:
+
+- ``writers``: every writer adds its models and removes half of them
+  again, at the same time as the others, through CatalogStore.upsert()
+  and apply(), the whole-dict save_electric_locks() and update_json(),
+  reading the JSON file back after each write. Afterwards the database
+  and the JSON file must hold exactly the models that were not removed.
+- ``kill``: writers keep rewriting a large JSON catalog and the database
+  while they are killed at random, mid-write, and the file is read in
+  between. No read may see a torn file, the models all writers agree on
+  must survive in both, no temporary file may be left over and the lock
+  must still be free afterwards.
+
+Exits with status 1 when a model is lost or a file is torn, so it can run
+as a build check on the file system the stations really share:
+
+    python -m doorframe.stress --dir /mnt/share/stress --writers 16 --seconds 10
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import closing
+
+from . import catalog
+from .catalog import KINDS, CatalogStore, update_json
+
+KIND = "electric_locks"
+_JSON = "electric_locks.json"
+_DB = "catalog.db"
+# Models every kill-test writer writes along with its own, the part of the catalog that must survive
+_SHARED_MODELS = 3000
+
+
+def _store(directory):
+    # No bundled JSON files: the scratch database starts empty
+    return CatalogStore(os.path.join(directory, _DB),
+                        json_files={kind: os.path.join(directory, "missing.json") for kind in KINDS})
+
+
+def _read_json(path):
+    """The JSON file as another station would read it; raises ValueError when it is torn."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _writer(args):
+    directory, number, models = args
+    store = _store(directory)
+    catalog._store = store  # The legacy save_* functions use the application's store
+    path = os.path.join(directory, _JSON)
+    rnd = random.Random(number)
+    data = catalog.load_electric_locks()
+    torn = 0
+    for index in range(models):
+        name = f"W{number} M{index}"
+        dimensions = {"length": 100 + index, "offset_bottom": 100, "offset_top": index}
+        how = rnd.choice(("upsert", "save", "apply"))
+        if how == "upsert":
+            store.upsert(KIND, name, dimensions)
+        elif how == "save":
+            data[name] = dimensions
+            catalog.save_electric_locks(data)
+        else:
+            store.apply(KIND, {name: dimensions})
+        update_json(path, {name: dimensions})
+        try:
+            _read_json(path)
+        except ValueError:
+            torn += 1
+    # Remove the even models again, half through the store and half through the legacy save
+    removed = {f"W{number} M{index}": None for index in range(0, models, 2)}
+    names = sorted(removed)
+    store.apply(KIND, dict.fromkeys(names[::2]))
+    data = catalog.load_electric_locks()
+    for name in names[1::2]:
+        data.pop(name, None)
+    catalog.save_electric_locks(data)
+    update_json(path, removed)
+    return torn
+
+
+def check_writers(directory, writers=16, models=60):
+    """Run the concurrent writers; returns a list of problems."""
+    started = time.perf_counter()
+    try:
+        with multiprocessing.Pool(writers) as pool:
+            torn = sum(pool.map(_writer, [(directory, number, models) for number in range(writers)]))
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # e.g. update_json() reading a torn file
+        return [f"writers: a writer failed: {type(e).__name__}: {e}"]
+    problems = [f"writers: {torn} reads saw a torn JSON file"] if torn else []
+    expected = {f"W{number} M{index}" for number in range(writers) for index in range(1, models, 2)}
+    for source, names in (("database", set(_store(directory).load(KIND))),
+                          ("JSON file", set(_read_json(os.path.join(directory, _JSON))))):
+        lost, extra = expected - names, names - expected
+        if lost:
+            problems.append(f"writers: {len(lost)} model(s) lost from the {source}, e.g. {sorted(lost)[0]!r}")
+        if extra:
+            problems.append(f"writers: {len(extra)} removed model(s) back in the {source}, e.g. {sorted(extra)[0]!r}")
+    print(f"writers: {writers} x {models} models in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    return problems
+
+
+def _shared_models():
+    return {f"S{index}": {"length": 100 + index % 500, "offset_bottom": 100, "offset_top": index % 500}
+            for index in range(_SHARED_MODELS)}
+
+
+def _killed_writer(directory, number):
+    store = _store(directory)
+    path = os.path.join(directory, _JSON)
+    shared = _shared_models()
+    while True:
+        update_json(path, dict(shared, **{f"K{number}": {"length": number + 1}}))
+        store.apply(KIND, dict(shared, **{f"K{number}": {"length": number + 1, "offset_bottom": 0,
+                                                         "offset_top": number + 1}}))
+
+
+def check_kill(directory, writers=8, seconds=8.0):
+    """Kill writers mid-write for ``seconds``; returns a list of problems."""
+    path = os.path.join(directory, _JSON)
+    store = _store(directory)
+    shared = _shared_models()
+    update_json(path, shared)
+    store.replace(KIND, shared)
+    processes = []
+    kills = reads = torn = 0
+    rnd = random.Random(0)
+    end = time.monotonic() + seconds
+    try:
+        while time.monotonic() < end:
+            while len(processes) < writers:
+                process = multiprocessing.Process(target=_killed_writer, args=(directory, len(processes)),
+                                                  daemon=True)
+                process.start()
+                processes.append(process)
+            time.sleep(rnd.random() * 0.05)
+            victim = processes.pop(rnd.randrange(len(processes)))
+            victim.kill()
+            victim.join()
+            kills += 1
+            for _ in range(5):
+                try:
+                    _read_json(path)
+                    reads += 1
+                except ValueError:
+                    torn += 1
+    finally:
+        for process in processes:
+            process.kill()
+            process.join()
+
+    problems = []
+    if torn:
+        problems.append(f"kill: {torn} of {reads + torn} reads saw a torn JSON file")
+    # A dead writer must not keep the locks; the store gives up after its timeout
+    try:
+        update_json(path, {"final": {"length": 1}})
+        store.upsert(KIND, "final", {"length": 1})
+        with closing(sqlite3.connect(store.path)) as connection:
+            integrity = connection.execute("PRAGMA integrity_check").fetchone()[0]
+    except (OSError, ValueError, sqlite3.Error) as e:
+        return problems + [f"kill: the catalog is unusable after the kills: {e}"]
+    if integrity != "ok":
+        problems.append(f"kill: database integrity check failed: {integrity}")
+    for source, names in (("database", set(store.load(KIND))), ("JSON file", set(_read_json(path)))):
+        lost = set(shared) - names
+        if lost:
+            problems.append(f"kill: {len(lost)} model(s) lost from the {source}, e.g. {sorted(lost)[0]!r}")
+    leftovers = [name for name in os.listdir(directory) if name.endswith(".tmp")]
+    if leftovers:
+        problems.append(f"kill: temporary file(s) left over: {', '.join(sorted(leftovers))}")
+    print(f"kill: {kills} writers killed, {reads + torn} reads", file=sys.stderr)
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m doorframe.stress",
+                                     description="Check that concurrent and killed catalog writers never lose "
+                                                 "a model or leave a torn file.")
+    parser.add_argument("--dir", help="scratch folder, e.g. on the shared drive (default: a new temporary one)")
+    parser.add_argument("--writers", type=int, default=16, help="writer processes (default: 16)")
+    parser.add_argument("--models", type=int, default=60, help="models each writer adds (default: 60)")
+    parser.add_argument("--seconds", type=float, default=8.0, help="duration of the kill test (default: 8)")
+    parser.add_argument("--skip", choices=("writers", "kill"), action="append", default=[],
+                        help="leave out one of the checks")
+    args = parser.parse_args(argv)
+    if args.writers < 1 or args.models < 2:
+        parser.error("--writers must be at least 1 and --models at least 2")
+    directory = args.dir or tempfile.mkdtemp(prefix="doorframe-stress-")
+    problems = []
+    try:
+        for name, check, options in (("writers", check_writers, (args.writers, args.models)),
+                                     ("kill", check_kill, (min(args.writers, 8), args.seconds))):
+            if name in args.skip:
+                continue
+            scratch = os.path.join(directory, name)
+            shutil.rmtree(scratch, ignore_errors=True)
+            os.makedirs(scratch)
+            problems += check(scratch, *options)
+    finally:
+        if not args.dir:
+            shutil.rmtree(directory, ignore_errors=True)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    print("FAILED" if problems else "ok", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Calculations off the GUI thread.
+
+A Calculator runs one calculation at a time on a single worker thread.
+submit() cancels whatever is still running or queued, so repeated clicks
+coalesce into the latest spec instead of piling up. The GUI polls the
+Calculation's ``progress`` and future from ``root.after`` callbacks; Tk
+is never touched from the worker.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .batch import calculate_batch
+from .report import build_report
+
+
+class Cancelled(Exception):
+    """Raised inside the worker once its calculation has been cancelled."""
+
+
+class Calculation:
+    """One submitted job; ``progress`` goes from 0 to 1 while the worker runs it."""
+
+    def __init__(self, specs, catalogs=None, image_size=None):
+        self.specs = list(specs)
+        self.catalogs = catalogs
+        self.image_size = image_size
+        self.progress = 0.0
+        self.future = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def step(self, progress):
+        """Record progress; raises Cancelled once the calculation was cancelled."""
+        if self._cancelled.is_set():
+            raise Cancelled()
+        self.progress = progress
+
+
+def run_calculation(calculation):
+    """Calculate, plan and report a Calculation; returns (BatchResult, Report).
+
+    With an ``image_size`` the diagrams are rendered into the display cache
+    too, so showing the result on the GUI thread is a cache hit.
+    """
+    total = len(calculation.specs)
+    calculation.step(0.0)
+    # The door lines are the first half of the work, planning, the report and the diagrams the rest
+    job = calculate_batch(calculation.specs, calculation.catalogs,
+                          progress=lambda done: calculation.step(0.5 * done / total))
+    plan = job.cutting_plan()
+    calculation.step(0.7)
+    sheets = job.sheet_plans()
+    calculation.step(0.8)
+    report = build_report(job, plan, sheets)
+    calculation.step(0.9)
+    if calculation.image_size:
+        from .diagram import display_image
+
+        for done, line in enumerate(job.lines, start=1):
+            display_image(line.result, calculation.image_size)
+            calculation.step(0.9 + 0.1 * done / total)
+    calculation.progress = 1.0
+    return job, report
+
+
+class Calculator:
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calculate")
+        self.current = None
+
+    def submit(self, specs, catalogs=None, image_size=None):
+        """Start calculating ``specs``, cancelling the previous calculation."""
+        self.cancel()
+        calculation = Calculation(specs, catalogs, image_size)
+        calculation.future = self._executor.submit(run_calculation, calculation)
+        self.current = calculation
+        return calculation
+
+    def cancel(self):
+        if self.current is not None:
+            self.current.cancel()
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,189 @@
+"""UI translations, compiled into one bundle per language.
+
+translations.json holds every language and stays the file people edit.
+
+    python -m doorframe.translations build
+
+checks it and writes one compact bundle per language to lang/ next to it.
+The build fails, naming the key, when a language lacks a key another one
+has or one the report renders (report.REPORT_KEYS), a text is empty, a
+text's {placeholders} differ between languages, or a key the GUI looks up
+literally (translations[...]["key"] in Appmajor.py) is missing; a bad
+edit is caught there instead of as a KeyError in the middle of a
+calculation.
+
+load_translations() returns a Translations dict that reads only the bundle
+of a language when it is first looked up: the GUI's language at startup,
+the others on a switch. Each bundle is a read-only mapping. When
+translations.json has changed since the last build, it is checked and
+used in memory instead; loading never writes, only the build does, so
+stations sharing the folder do not all rewrite lang/ at once.
+"""
+import hashlib
+import json
+import os
+import re
+import string
+import sys
+import tempfile
+from types import MappingProxyType
+
+from .catalog import application_path
+from .report import REPORT_KEYS
+
+TRANSLATIONS_FILE = os.path.join(application_path, 'translations.json')
+BUNDLE_DIR = "lang"
+INDEX_FILE = "index.json"
+# Sources whose literal lookups the build checks
+GUI_SOURCES = (os.path.join(application_path, 'Appmajor.py'),)
+
+_LOOKUP = re.compile(r"""translations\[[^\[\]]+\]\[\s*["']([^"']+)["']\s*\](?:\[\s*["']([^"']+)["']\s*\])?""")
+
+
+def _freeze(data):
+    return MappingProxyType({key: _freeze(value) if isinstance(value, dict) else value
+                             for key, value in data.items()})
+
+
+def _flatten(data, prefix=""):
+    for key, value in data.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _placeholders(text):
+    return {name for _, name, _, _ in string.Formatter().parse(text) if name is not None}
+
+
+def check_translations(document, sources=GUI_SOURCES, required=REPORT_KEYS):
+    """Raise ValueError listing every problem of a parsed translations.json.
+
+    Every language needs every key of ``required`` besides the keys the
+    others have.
+    """
+    if not isinstance(document, dict) or not document:
+        raise ValueError("translations: expected an object of languages")
+    flat = {language: dict(_flatten(texts)) for language, texts in document.items()}
+    keys = set().union(*(texts.keys() for texts in flat.values()), required)
+    problems = []
+    for language, texts in flat.items():
+        problems.extend(f"{language}: missing {key!r}" for key in sorted(keys - texts.keys()))
+        for key, text in texts.items():
+            if not isinstance(text, str) or not text.strip():
+                problems.append(f"{language}: {key!r} is empty")
+    for key in sorted(keys):
+        variants = {frozenset(_placeholders(texts[key])) for texts in flat.values()
+                    if isinstance(texts.get(key), str)}
+        if len(variants) > 1:
+            problems.append(f"{key!r}: the languages use different {{placeholders}}")
+    for path in sources:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding='utf-8') as file:
+            source = file.read()
+        used = {".".join(filter(None, match)) for match in _LOOKUP.findall(source)}
+        # A lookup of a nested object ("tooltips") is fine as long as the object exists
+        problems.extend(f"{os.path.basename(path)} looks up missing {key!r}" for key in sorted(used)
+                        if key not in keys and not any(k.startswith(key + ".") for k in keys))
+    if problems:
+        raise ValueError("translations: " + "; ".join(problems))
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write(path, document):
+    directory = os.path.dirname(path)
+    descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(document, file, ensure_ascii=False, separators=(",", ":"))
+        os.chmod(temporary, 0o644)  # mkstemp makes it private; other users read the bundles
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def build_bundles(path=TRANSLATIONS_FILE, sources=GUI_SOURCES):
+    """Check ``path`` and write its per-language bundles; returns the languages."""
+    with open(path, 'rb') as file:
+        data = file.read()
+    document = json.loads(data.decode('utf-8'))
+    check_translations(document, sources)
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), BUNDLE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    for language, texts in document.items():
+        _write(os.path.join(directory, f"{language}.json"), texts)
+    # Written last: bundles only count once the index names their source
+    _write(os.path.join(directory, INDEX_FILE), {"source": _digest(data), "languages": list(document)})
+    return list(document)
+
+
+class Translations(dict):
+    """{language: read-only texts}; a language's bundle is read on its first lookup."""
+
+    def __init__(self, languages, load):
+        super().__init__()
+        self.languages = tuple(languages)
+        self._load = load
+
+    def __missing__(self, language):
+        if language not in self.languages:
+            raise KeyError(language)
+        texts = self[language] = _freeze(self._load(language))
+        return texts
+
+    def __contains__(self, language):
+        return language in self.languages
+
+    def get(self, language, default=None):
+        return self[language] if language in self.languages else default
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def load_translations(path=TRANSLATIONS_FILE):
+    if not os.path.exists(path):
+        return Translations((), None)
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), BUNDLE_DIR)
+    with open(path, 'rb') as file:
+        data = file.read()
+    try:
+        index = _read_json(os.path.join(directory, INDEX_FILE))
+    except (OSError, ValueError):
+        index = {}
+    if index.get("source") == _digest(data):
+        return Translations(index["languages"],
+                            lambda language: _read_json(os.path.join(directory, f"{language}.json")))
+    # Edited since the last build: check and use the source itself until the next build
+    document = json.loads(data.decode('utf-8'))
+    check_translations(document)
+    return Translations(document, document.__getitem__)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] != ["build"] or len(argv) > 2:
+        print("usage: python -m doorframe.translations build [translations.json]", file=sys.stderr)
+        return 2
+    path = argv[1] if len(argv) > 1 else TRANSLATIONS_FILE
+    try:
+        languages = build_bundles(path)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"built {', '.join(languages)} into {os.path.join(os.path.dirname(os.path.abspath(path)), BUNDLE_DIR)}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
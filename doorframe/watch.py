@@ -0,0 +1,105 @@
+"""Pick up catalog and translation changes made by other stations.
+
+A CatalogWatcher polls the modification stamp of catalog.db and
+translations.json on a daemon thread: one os.stat() per file every
+``interval`` seconds, so an idle station spends microseconds per poll.
+When a stamp moves, the watcher reads the file again on its own thread,
+works out which catalogs actually changed and queues a Reload. The GUI
+takes reloads from a ``root.after`` callback and swaps them in on the Tk
+thread; Tk is never touched from the watcher.
+"""
+import copy
+import os
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .catalog import KINDS, catalog_store
+from .translations import TRANSLATIONS_FILE, load_translations
+
+POLL_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class Reload:
+    # The catalogs that changed, by kind ("electric_locks", ...), as new dicts
+    catalogs: Dict[str, dict]
+    translations: Optional[dict]
+
+
+def file_stamp(path):
+    """(mtime, size, inode) of ``path``, or None when it is missing."""
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    return status.st_mtime_ns, status.st_size, status.st_ino
+
+
+class CatalogWatcher:
+    def __init__(self, catalogs, store=None, translations_file=TRANSLATIONS_FILE, interval=POLL_SECONDS):
+        self.store = store or catalog_store()
+        self.translations_file = translations_file
+        self.interval = interval
+        # The watcher's own copy; the GUI keeps editing the dicts it was given
+        self._catalogs = {kind: copy.deepcopy(getattr(catalogs, kind)) for kind in KINDS}
+        self._stamps = {path: file_stamp(path) for path in (self.store.path, translations_file)}
+        self._reloads = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            reload = self.check()
+            if reload is not None:
+                self._reloads.put(reload)
+
+    def check(self):
+        """Poll once; returns a Reload when something changed, else None."""
+        catalogs, translations = {}, None
+        stamp = file_stamp(self.store.path)
+        if stamp != self._stamps[self.store.path]:
+            try:
+                loaded = self.store.load_all()
+            except sqlite3.Error:
+                # Locked or being replaced; the stamp is kept, so the next poll tries again
+                pass
+            else:
+                self._stamps[self.store.path] = stamp
+                for kind in KINDS:
+                    if getattr(loaded, kind) != self._catalogs[kind]:
+                        self._catalogs[kind] = getattr(loaded, kind)
+                        # The GUI gets its own dict, so its edits never reach the watcher's copy
+                        catalogs[kind] = copy.deepcopy(self._catalogs[kind])
+        stamp = file_stamp(self.translations_file)
+        if stamp != self._stamps[self.translations_file]:
+            try:
+                translations = load_translations(self.translations_file)
+            except (OSError, ValueError):
+                # Half-saved by an editor; try again on the next poll
+                pass
+            else:
+                self._stamps[self.translations_file] = stamp
+        if not catalogs and translations is None:
+            return None
+        return Reload(catalogs, translations)
+
+    def pending(self):
+        """The reloads queued since the last call, oldest first."""
+        reloads = []
+        while True:
+            try:
+                reloads.append(self._reloads.get_nowait())
+            except queue.Empty:
+                return reloads